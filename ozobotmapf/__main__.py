@@ -1,30 +1,42 @@
 import logging
 
 from ozobotmapf.mapf_solvers.manual_solver import ManualSolver
-from ozobotmapf.simulator.simulator import Simulator
-from ozobotmapf.map_editor.editor import Editor
 from ozobotmapf.configuration.configuration import EditorConfig, SimulatorConfig
 from ozobotmapf.configuration.cli_options import CLIOptions
 from ozobotmapf.configuration.config_options import ConfigOptions
+from ozobotmapf.mapf_solvers.plan_file import PlanFileSolver, save_plans
 from ozobotmapf.mapf_solvers.static_solvers import MapfSolverBoOX
 from ozobotmapf.level.ozomap import OzoMap
+from ozobotmapf.simulator.tiled_output import TiledOutput
 from ozobotmapf.utils.constants import Values
+from ozobotmapf.utils.run_profiler import RunProfiler
 
 
-def run_simulation(config):
+def run_simulation(config, run_profiler=None):
     """Function runs the Simulator process
 
+    Note:
+        The Simulator (and pygame with it) is imported only here, so that configuration and planning stay headless.
+
     Args:
         config (Configuration): Application configuration parameters
+        run_profiler (RunProfiler): Profiler that is notified about the simulation time (None if not profiling)
     """
+    from ozobotmapf.simulator.simulator import Simulator
+
     logging.info("Starting Simulator.")
 
     ozomap = OzoMap(config).load_map(config)
-    solver = init_solver(config)
+    solver = init_solver(config, ozomap)
     plans = solver.plan()
+    if config.save_plan_path is not None:
+        save_plans(plans, config.save_plan_path)
 
-    simulator = Simulator(ozomap, plans, config)
-    simulator.run()
+    if config.tiles is not None:
+        TiledOutput(ozomap, plans, config).run()
+    else:
+        simulator = Simulator(ozomap, plans, config, run_profiler)
+        simulator.run()
 
     logging.info("The Simulator finished successfully.")
 
@@ -35,6 +47,8 @@ def run_editor(config):
     Args:
         config (Configuration): Application configuration parameters
     """
+    from ozobotmapf.map_editor.editor import Editor
+
     logging.info("Starting Map Editor.")
     ozomap = OzoMap(config)
 
@@ -50,7 +64,7 @@ def configure_application():
     if not options.debug:
         logging.getLogger().setLevel(logging.INFO)
 
-    config = ConfigOptions(Values.SIMULATOR_CONFIG).parse()
+    config = ConfigOptions(Values.SIMULATOR_CONFIG).parse(validate_solver=options.plan is None)
     config.update(ConfigOptions(options.config_file).parse())
 
     if options.editor:
@@ -62,8 +76,16 @@ def configure_application():
     return config_merge
 
 
-def init_solver(config):
-    """Function initializes the solver instance with given arguments."""
+def init_solver(config, ozomap):
+    """Function initializes the solver instance with given arguments.
+
+    If a plan file is given, the recorded plans are validated against the map and replayed, the external solver is
+    not run.
+    """
+    if config.plan_path is not None:
+        logging.info("Plan file solver initialized.")
+        return PlanFileSolver(config.plan_path, ozomap)
+
     solver_args = {"input-file": config.map_path, "algorithm": config.solver_algorithm}
     solver = MapfSolverBoOX(config.solver_path + config.solver, solver_args)
     # solver = ManualSolver() # Use in case the plan needs to be modified
@@ -76,8 +98,13 @@ if __name__ == '__main__':
                         level=logging.DEBUG)
 
     configuration = configure_application()
-    if configuration.editor:
+    profiler = RunProfiler(configuration)
+    if configuration.editor and profiler.is_enabled():
+        profiler.run(run_editor, configuration)
+    elif configuration.editor:
         run_editor(configuration)
+    elif profiler.is_enabled():
+        profiler.run(run_simulation, configuration, profiler)
     else:
         run_simulation(configuration)
 
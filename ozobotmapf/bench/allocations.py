@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import statistics
+import tracemalloc
+from argparse import ArgumentParser
+
+from ozobotmapf.bench.suite import MAPS_PATH, SIMULATOR_CONFIG, DISPLAY_CONFIG, AGENT_TYPES, build_config
+from ozobotmapf.configuration.config_options import ConfigOptions, get_agent_class
+from ozobotmapf.graphics.shapes import Point
+from ozobotmapf.level.ozomap import OzoMap
+from ozobotmapf.mapf_solvers.manual_solver import ManualSolver
+from ozobotmapf.simulator.agents.path_drawable import PathSegment, TurnSegment
+
+MAP_PATH = os.path.join(MAPS_PATH, "scenarios", "10x5_6a_evacuation.ozomap")  # Map of the ManualSolver plans
+SEGMENT_KINDS = ["dot", "line", "arc"]
+
+
+def segment_memory(agent, kind, count):
+    """Function measures memory of trail segments built the same way as by the OzobotAgent.
+
+    Args:
+        agent (Agent): Agent providing the drawables (configured line width, trail sprites)
+        kind (str): Kind of the segment (one of `SEGMENT_KINDS`)
+        count (int): Number of built segments
+
+    Returns:
+        dict: Allocated bytes and memory blocks per segment
+    """
+    config = agent.config
+    origin = Point(config.tile_size, config.tile_size)
+    segments = []
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(count):
+        point = origin.moved(i % config.tile_size, 0.5)
+        if kind == "dot":
+            segments.append(PathSegment(agent._line_drawable(point, point), i))
+        elif kind == "line":
+            segments.append(PathSegment(agent._line_drawable(point, point.moved(0, 15)), i))
+        else:
+            segments.append(TurnSegment(agent._arc_drawable(point, i % 90, i % 90 + 3), i))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return {"bytes": size / count, "blocks": blocks / count}
+
+
+def frame_allocations(agents, frames, fps):
+    """Function measures memory allocated by agent updates (trail building) of every frame.
+
+    Args:
+        agents (list[Agent]): Agents of the simulation
+        frames (int): Number of simulated frames
+        fps (int): Frame rate of the simulated frames
+
+    Returns:
+        dict: Median and maximal peak of the memory allocated during a frame, memory left allocated after the run
+    """
+    frame_time = 1000 / fps
+    peaks = []
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for frame in range(frames):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for agent in agents:
+            agent.update_path(round(frame * frame_time))
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    return {"frame_peak_kib": statistics.median(peaks) / 1024, "max_frame_peak_kib": max(peaks) / 1024,
+            "retained_kib": retained / 1024}
+
+
+def build_agents(config, agent_type):
+    """Function builds agents of the ManualSolver plans on the evacuation scenario map.
+
+    Args:
+        config (dict[str, dict]): Parsed configuration
+        agent_type (str): Agent type name (one of `AgentTypes`)
+
+    Returns:
+        list[Agent]: Initialized agents
+    """
+    sim_config = build_config(MAP_PATH, config)
+    sim_config.agent_class = get_agent_class(agent_type)
+    ozomap = OzoMap(sim_config).load_map(sim_config)
+    plans = ManualSolver().plan()
+    return [sim_config.agent_class(agent_id, plans[agent_id], ozomap, sim_config) for agent_id in plans]
+
+
+def main(args=None):
+    parser = ArgumentParser(prog="python -m ozobotmapf.bench.allocations",
+                            description="Measures memory of trail segments and allocations of agent updates.")
+    parser.add_argument('-n', '--count', type=int, default=10000, help='Number of built segments per kind.')
+    parser.add_argument('-f', '--frames', type=int, default=600, help='Number of simulated frames per agent type.')
+    parser.add_argument('--fps', type=int, default=60, help='Frame rate of the simulated frames.')
+    parser.add_argument('-j', '--json', dest='json', action='store_true', help='Print the results as JSON.')
+    args = parser.parse_args(args)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    config = ConfigOptions(SIMULATOR_CONFIG).parse(validate_solver=False)
+    config.update(ConfigOptions(DISPLAY_CONFIG).parse())
+
+    agent = build_agents(config, "ozobot")[0]
+    results = {"segments": {kind: segment_memory(agent, kind, args.count) for kind in SEGMENT_KINDS},
+               "frames": {agent_type: frame_allocations(build_agents(config, agent_type), args.frames, args.fps)
+                          for agent_type in AGENT_TYPES}}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("{:<12} {:>14} {:>14}".format("Segment", "Bytes", "Blocks"))
+    for kind, result in results["segments"].items():
+        print("{:<12} {:>14.1f} {:>14.2f}".format(kind, result["bytes"], result["blocks"]))
+    print()
+    print("{:<12} {:>14} {:>14} {:>14}".format("Agent type", "Frame [KiB]", "Max [KiB]", "Retained [KiB]"))
+    for agent_type, result in results["frames"].items():
+        print("{:<12} {:>14.2f} {:>14.2f} {:>14.2f}".format(agent_type, result["frame_peak_kib"],
+                                                           result["max_frame_peak_kib"], result["retained_kib"]))
+
+
+if __name__ == '__main__':
+    main()
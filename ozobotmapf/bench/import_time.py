@@ -0,0 +1,78 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+# Modules measured by default, the headless core first and the rendering modules last (for comparison)
+MODULES = [
+    "ozobotmapf.utils.constants",
+    "ozobotmapf.level.ozomap",
+    "ozobotmapf.mapf_solvers.static_solvers",
+    "ozobotmapf.configuration.config_options",
+    "ozobotmapf.configuration.configuration",
+    "ozobotmapf.simulator.agents.ozobot_agent",
+    "ozobotmapf.simulator.simulator",
+    "ozobotmapf.map_editor.editor",
+    "pygame",
+]
+
+PROBE = "import sys, time\n" \
+        "start = time.perf_counter()\n" \
+        "import {}\n" \
+        "print(time.perf_counter() - start, 'pygame' in sys.modules)"
+
+
+def measure_import(module, repeat):
+    """Function measures the import time of a module in fresh interpreters.
+
+    Every measurement runs in a new interpreter, so no module is cached from a previous import.
+
+    Args:
+        module (str): Absolute name of the module
+        repeat (int): Number of measurements
+
+    Returns:
+        dict: Median and minimal import time in milliseconds and a flag if pygame was imported
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root(), os.environ.get("PYTHONPATH")])))
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    times, loads_pygame = [], False
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module)], env=env, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+        times.append(float(output[-2]) * 1000)
+        loads_pygame = output[-1] == "True"
+
+    return {"module": module, "median_ms": statistics.median(times), "min_ms": min(times),
+            "loads_pygame": loads_pygame}
+
+
+def package_root():
+    """Returns the directory containing the `ozobotmapf` package."""
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = ArgumentParser(description="Measures import time of the application modules.")
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='Number of measurements per module.')
+    parser.add_argument('-j', '--json', dest='json', action='store_true', help='Print the results as JSON.')
+    parser.add_argument('modules', nargs='*', default=MODULES, help='Modules to measure.')
+    args = parser.parse_args()
+
+    results = [measure_import(module, args.repeat) for module in args.modules]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("{:<45} {:>12} {:>12} {:>8}".format("Module", "Median [ms]", "Min [ms]", "pygame"))
+    for result in results:
+        print("{:<45} {:>12.2f} {:>12.2f} {:>8}".format(result["module"], result["median_ms"], result["min_ms"],
+                                                       "yes" if result["loads_pygame"] else "no"))
+
+
+if __name__ == '__main__':
+    main()
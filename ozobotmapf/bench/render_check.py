@@ -0,0 +1,89 @@
+import glob
+import logging
+import os
+import sys
+from argparse import ArgumentParser
+
+from ozobotmapf.bench.suite import MAPS_PATH, PLANS_PATH, SIMULATOR_CONFIG, DISPLAY_CONFIG, AGENT_TYPES, build_config
+from ozobotmapf.configuration.config_options import ConfigOptions, get_agent_class
+from ozobotmapf.level.ozomap import OzoMap
+from ozobotmapf.mapf_solvers.plan_file import load_plans
+from ozobotmapf.utils.constants import AgentTypes, Colors, TrailModes, Values
+
+
+def check_frames(ozomap, plans, config, frames, fps):
+    """Function renders frames by the render list and by drawing every agent path on its own and compares them.
+
+    Args:
+        ozomap (OzoMap): Loaded map
+        plans (dict[int, dict[str, list]]): Plans of all agents
+        config (Configuration): Application configuration parameters
+        frames (int): Number of compared frames
+        fps (int): Frame rate of the simulated frames
+
+    Returns:
+        list[int]: Simulation times of the frames that differ
+    """
+    import pygame
+    from ozobotmapf.graphics.render_list import RenderList
+
+    agents = [config.agent_class(agent_id, plans[agent_id], ozomap, config) for agent_id in sorted(plans)]
+    renderer = RenderList()
+    size = (config.window_width, config.window_height)
+    batched, separate = pygame.Surface(size), pygame.Surface(size)
+
+    differing = []
+    for frame in range(frames):
+        time = round(frame * 1000 / fps)
+        batched.fill(Colors.WHITE)
+        separate.fill(Colors.WHITE)
+        for agent in agents:
+            agent.update_path(time)
+            renderer.add_path(agent.get_active_path())
+            agent.get_active_path().draw(separate)
+        renderer.draw(batched)
+        if pygame.image.tostring(batched, "RGB") != pygame.image.tostring(separate, "RGB"):
+            differing.append(time)
+    return differing
+
+
+def main(args=None):
+    parser = ArgumentParser(prog="python -m ozobotmapf.bench.render_check",
+                            description="Checks that the render list draws the same pixels as drawing every agent "
+                                        "path on its own.")
+    parser.add_argument('-a', '--agent-types', nargs='+', choices=AGENT_TYPES, default=AGENT_TYPES,
+                        help='Checked agent types.')
+    parser.add_argument('-n', '--frames', type=int, default=300, help='Number of compared frames per variant.')
+    parser.add_argument('-f', '--fps', type=int, default=60, help='Frame rate of the simulated frames.')
+    args = parser.parse_args(args)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    logging.getLogger().setLevel(logging.WARNING)
+
+    config = ConfigOptions(SIMULATOR_CONFIG).parse(validate_solver=False)
+    config.update(ConfigOptions(DISPLAY_CONFIG).parse())
+
+    failed = False
+    for plan_path in sorted(glob.glob(os.path.join(PLANS_PATH, "scenarios", "*" + Values.PLAN_FILE_EXT))):
+        name = os.path.basename(plan_path)[:-len(Values.PLAN_FILE_EXT)]
+        sim_config = build_config(os.path.join(MAPS_PATH, "scenarios", name + Values.MAP_FILE_EXT), config)
+        ozomap = OzoMap(sim_config).load_map(sim_config)
+        plans = load_plans(plan_path)
+        for agent_type in args.agent_types:
+            modes = [TrailModes.FRAMES, TrailModes.ANALYTIC] if agent_type == AgentTypes.OZOBOT else [None]
+            sim_config.agent_class = get_agent_class(agent_type)
+            for sprites in (True, False):
+                for mode in modes:
+                    sim_config.trail_sprites, sim_config.trail_mode = sprites, mode or TrailModes.FRAMES
+                    differing = check_frames(ozomap, plans, sim_config, args.frames, args.fps)
+                    failed = failed or bool(differing)
+                    result = "ok" if not differing else "{} frames differ (first at {} ms)".format(len(differing),
+                                                                                                  differing[0])
+                    print("{:<22} {:<9} {:<8} {:<9} {}".format(name, agent_type, "sprites" if sprites else "-",
+                                                               mode or "-", result))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+import copy
+import glob
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from ozobotmapf.bench.synthetic import synthetic_map_lines, synthetic_plans, plans_to_boox_output
+from ozobotmapf.configuration.cli_options import CLIOptions
+from ozobotmapf.configuration.config_options import ConfigOptions, get_agent_class
+from ozobotmapf.configuration.configuration import SimulatorConfig
+from ozobotmapf.level.ozomap import OzoMap
+from ozobotmapf.mapf_solvers.manual_solver import ManualSolver
+from ozobotmapf.mapf_solvers.plan_file import load_plans, save_plans, validate_plans
+from ozobotmapf.mapf_solvers.static_solvers import parse_boox_output
+from ozobotmapf.simulator.frame_profiler import summarize
+from ozobotmapf.utils.constants import AgentTypes, Values
+
+RESOURCES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                              "resources")
+MAPS_PATH = os.path.join(RESOURCES_PATH, "maps")
+PLANS_PATH = os.path.join(RESOURCES_PATH, "plans")
+SIMULATOR_CONFIG = os.path.join(RESOURCES_PATH, "config", "simulator.ini")
+DISPLAY_CONFIG = os.path.join(RESOURCES_PATH, "config", "display", "monitor_config.ini")
+
+AGENT_TYPES = [AgentTypes.DUMMY, AgentTypes.ANIMATED, AgentTypes.OZOBOT]
+MANUAL_PLANS = {"10x5_6a_evacuation": ManualSolver}  # Maps the hard-coded ManualSolver plan belongs to
+
+MAX_WINDOW_SIZE = 4096  # Synthetic maps are scaled down to fit into a window of this size (in pixels)
+SWEEP_BASE = {"size": 8, "agents": 8, "fps": 60}
+SWEEP_SIZES = [4, 8, 16, 32]
+SWEEP_AGENTS = [1, 4, 16, 32]
+SWEEP_FPS = [30, 60, 120, 240]
+
+
+class BenchmarkSuite:
+    """Class runs headless benchmarks of the whole simulation pipeline.
+
+    For every map, loading, plan parsing, Simulator construction (agents and map drawables) and rendering of frames
+    are measured. Frames are rendered into an offscreen window (dummy SDL video driver), every phase of a frame is
+    measured by the FrameProfiler.
+
+    Attributes:
+        args (namespace): Parsed benchmark arguments
+        config (dict[str, dict]): Parsed simulator and display configuration
+    """
+
+    def __init__(self, args):
+        """Initialization of the BenchmarkSuite instance.
+
+        Args:
+            args (namespace): Parsed benchmark arguments
+        """
+        self.args = args
+        self.config = ConfigOptions(SIMULATOR_CONFIG).parse(validate_solver=False)
+        self.config.update(ConfigOptions(args.display_config).parse())
+
+    def run(self):
+        """Method runs all requested benchmarks.
+
+        Returns:
+            dict: Benchmark results
+        """
+        results = {"meta": self.__meta(), "maps": {}, "sweeps": {}}
+        for map_path in self.__map_paths():
+            name = os.path.relpath(map_path, MAPS_PATH)[:-len(".ozomap")]
+            print("Map {}".format(name), file=sys.stderr)
+            results["maps"][name] = self.bench_map(map_path, name, self.config, self.args.fps)
+
+        if self.args.sweeps:
+            results["sweeps"] = self.run_sweeps()
+        return results
+
+    def run_sweeps(self):
+        """Method runs scaling sweeps over synthetic open maps.
+
+        Each sweep changes one parameter (map size, agent count or FPS) and keeps the others at `SWEEP_BASE`.
+
+        Returns:
+            dict: Results of every sweep
+        """
+        base = SWEEP_BASE
+        sweeps = {
+            "map_size": [(size, base["agents"], base["fps"], "{0}x{0}".format(size)) for size in SWEEP_SIZES],
+            "agent_count": [(base["size"], agents, base["fps"], str(agents)) for agents in SWEEP_AGENTS],
+            "fps": [(base["size"], base["agents"], fps, str(fps)) for fps in SWEEP_FPS],
+        }
+
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for sweep, points in sweeps.items():
+                results[sweep] = {}
+                for size, agents, fps, label in points:
+                    print("Sweep {}: {}".format(sweep, label), file=sys.stderr)
+                    map_path = os.path.join(directory, "{0}x{0}_{1}a.ozomap".format(size, agents))
+                    with open(map_path, "w") as file:
+                        file.writelines(synthetic_map_lines(size, size, agents, self.args.seed))
+                    config = self.__scaled_config(size)
+                    results[sweep][label] = self.bench_map(map_path, label, config, fps)
+        return results
+
+    def bench_map(self, map_path, name, config, fps):
+        """Method benchmarks a single map.
+
+        Args:
+            map_path (str): Path to the map file
+            name (str): Name of the map relative to the maps folder (used to find the plan source)
+            config (dict[str, dict]): Parsed configuration
+            fps (int): Frame rate of the simulated frames
+
+        Returns:
+            dict: Results of the map
+        """
+        sim_config = build_config(map_path, config)
+        result = {"tiles": sim_config.map_width * sim_config.map_height, "fps": fps}
+
+        ozomap = None
+        load_samples = []
+        for _ in range(self.args.repeat):
+            start = time.perf_counter_ns()
+            ozomap = OzoMap(sim_config).load_map(sim_config)
+            load_samples.append(time.perf_counter_ns() - start)
+        result["load"] = summarize(load_samples)
+
+        plans, result["plan_source"] = self.__plans(name, ozomap)
+        result["agents"] = len(plans)
+        if not plans:
+            return result
+
+        output = plans_to_boox_output(plans)
+        parse_samples = []
+        for _ in range(self.args.repeat):
+            start = time.perf_counter_ns()
+            parse_boox_output(output)
+            parse_samples.append(time.perf_counter_ns() - start)
+        result["parse"] = summarize(parse_samples)
+
+        with tempfile.TemporaryDirectory() as directory:
+            plan_path = os.path.join(directory, "plan" + Values.PLAN_FILE_EXT)
+            save_plans(plans, plan_path)
+            plan_load_samples = []
+            for _ in range(self.args.repeat):
+                start = time.perf_counter_ns()
+                load_plans(plan_path)
+                plan_load_samples.append(time.perf_counter_ns() - start)
+        result["plan_load"] = summarize(plan_load_samples)
+
+        result["agent_types"] = {}
+        for agent_type in self.args.agent_types:
+            sim_config.agent_class = get_agent_class(agent_type)
+            result["agent_types"][agent_type] = self.bench_simulation(ozomap, plans, sim_config, fps)
+        return result
+
+    def bench_simulation(self, ozomap, plans, config, fps):
+        """Method measures Simulator construction and rendering of frames.
+
+        Args:
+            ozomap (OzoMap): Loaded map
+            plans (dict[int, dict[str, list]]): Plans of all agents
+            config (Configuration): Application configuration parameters
+            fps (int): Frame rate of the simulated frames
+
+        Returns:
+            dict: Construction time, frame time statistics and statistics of every frame phase
+        """
+        from ozobotmapf.simulator.simulator import Simulator
+
+        config.frame_profile = True
+        start = time.perf_counter_ns()
+        simulator = Simulator(ozomap, plans, config)
+        construct = time.perf_counter_ns() - start
+
+        frame_time = 1000 / fps
+        simulator.run_frames(round(frame * frame_time) for frame in range(self.args.frames))
+        report = simulator.profiler.report()
+        return {"construct": summarize([construct]), "frame": report["frame"], "phases": report["phases"]}
+
+    def __plans(self, name, ozomap):
+        """Method returns plans for the map and their source.
+
+        Recorded plan fixtures from `resources/plans/` are preferred, then the hard-coded ManualSolver plans.
+        Maps without a recorded plan get conflict-agnostic synthetic plans.
+        """
+        fixture = os.path.join(PLANS_PATH, name + Values.PLAN_FILE_EXT)
+        if os.path.isfile(fixture):
+            plans = load_plans(fixture)
+            validate_plans(plans, ozomap, fixture)
+            return plans, "fixture"
+        if os.path.basename(name) in MANUAL_PLANS:
+            return MANUAL_PLANS[os.path.basename(name)]().plan(), "manual"
+        return synthetic_plans(ozomap), "synthetic"
+
+    def __map_paths(self):
+        """Method returns paths of all bundled maps matching the map filter."""
+        paths = sorted(glob.glob(os.path.join(MAPS_PATH, "*.ozomap")))
+        paths += sorted(glob.glob(os.path.join(MAPS_PATH, "scenarios", "*.ozomap")))
+        if self.args.maps is not None:
+            paths = [path for path in paths if any(pattern in path for pattern in self.args.maps)]
+        return paths
+
+    def __scaled_config(self, size):
+        """Method scales all Ozobot dimensions down, so that a map of the given size fits into the window limit."""
+        config = copy.deepcopy(self.config)
+        mm_to_px = (config["display"]["resolution_width"] / config["display"]["display_width"] +
+                    config["display"]["resolution_height"] / config["display"]["display_height"]) / 2
+        scale = min(1, MAX_WINDOW_SIZE / (size * config["ozobot"]["tile_size"] * mm_to_px))
+        for option in config["ozobot"]:
+            config["ozobot"][option] *= scale
+        return config
+
+    def __meta(self):
+        import pygame
+        return {"python": platform.python_version(), "pygame": pygame.version.ver, "frames": self.args.frames,
+                "fps": self.args.fps, "repeat": self.args.repeat, "display_config": self.args.display_config,
+                "agent_types": self.args.agent_types, "created": time.strftime("%Y-%m-%d %H:%M:%S")}
+# ------------------------------------------------------------------------------------------------------------
+
+
+def build_config(map_path, config):
+    """Function builds a Simulator configuration for a map, the window is just large enough for the map.
+
+    Args:
+        map_path (str): Path to the map file
+        config (dict[str, dict]): Parsed configuration
+
+    Returns:
+        SimulatorConfig: Configuration for the map
+    """
+    width, height, agents = [int(x) for x in re.findall(r'\d+', os.path.basename(map_path))][:3]
+    cli_args = ["-m", map_path, "-ma", str(width), str(height), str(agents), "-c", DISPLAY_CONFIG]
+
+    probe = SimulatorConfig(CLIOptions().parse(cli_args), config)
+    resolution = [str(max(probe.tile_size * width, 1)), str(max(probe.tile_size * height, 1))]
+    return SimulatorConfig(CLIOptions().parse(cli_args + ["-r", *resolution]), config)
+
+
+def compare(baseline, results, threshold, path=""):
+    """Function compares results with a baseline and yields lines describing the differences.
+
+    Only medians (`p50_ms`) are compared.
+
+    Args:
+        baseline (dict): Baseline results
+        results (dict): New results
+        threshold (float): Relative change that is reported as a regression or an improvement
+        path (str): Path of the compared sub-dictionaries
+
+    Yields:
+        str: Comparison of one measurement
+    """
+    for key, value in results.items():
+        if key not in baseline:
+            continue
+        if isinstance(value, dict):
+            yield from compare(baseline[key], value, threshold, path + "/" + key if path else key)
+        elif key == "p50_ms" and baseline[key]:
+            ratio = value / baseline[key]
+            mark = "REGRESSION" if ratio > 1 + threshold else "improved" if ratio < 1 - threshold else ""
+            yield "{:<70} {:>10.3f} -> {:>10.3f} ms {:>7.2f}x {}".format(path, baseline[key], value, ratio, mark)
+
+
+def parse_arguments(args=None):
+    parser = ArgumentParser(prog="python -m ozobotmapf.bench",
+                            description="Headless benchmarks over the bundled maps and synthetic scaling sweeps.")
+    parser.add_argument('-m', '--maps', nargs='+', help='Benchmark only maps whose path contains one of the patterns.')
+    parser.add_argument('-a', '--agent-types', nargs='+', choices=AGENT_TYPES, default=AGENT_TYPES,
+                        dest='agent_types', help='Agent types to be benchmarked.')
+    parser.add_argument('-n', '--frames', type=int, default=240, help='Number of simulated frames per agent type.')
+    parser.add_argument('-f', '--fps', type=int, default=60, help='Frame rate of the simulated frames.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Repetitions of map loading and plan parsing.')
+    parser.add_argument('-s', '--sweeps', action='store_true', help='Run also the synthetic scaling sweeps.')
+    parser.add_argument('--no-maps', dest='bundled_maps', action='store_false', help='Skip the bundled maps.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic maps.')
+    parser.add_argument('-c', '--display-config', default=DISPLAY_CONFIG, dest='display_config',
+                        help='Display configuration file.')
+    parser.add_argument('-o', '--output', help='Write the JSON results into a file instead of the standard output.')
+    parser.add_argument('-b', '--baseline', help='JSON results to compare the new results with.')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='Relative change reported as a regression or an improvement [default: 0.1].')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parse_arguments(args)
+    if not args.bundled_maps:
+        args.maps = []
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = BenchmarkSuite(args).run()
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        print("\nComparison with '{}':".format(args.baseline), file=sys.stderr)
+        for line in compare(baseline, results, args.threshold):
+            print(line, file=sys.stderr)
@@ -0,0 +1,113 @@
+import collections
+import random
+
+from ozobotmapf.mapf_solvers.prioritized_solver import get_agent_endpoints, paths_to_plans
+
+
+def synthetic_map_lines(width, height, agent_cnt, seed=0):
+    """Function creates an open map (walls only around the map) with random agent starts and finishes.
+
+    Args:
+        width (int): Map width in tiles
+        height (int): Map height in tiles
+        agent_cnt (int): Number of agents
+        seed (int): Seed of the random generator
+
+    Returns:
+        list[str]: Lines of the `.ozomap` file
+    """
+    rng = random.Random(seed)
+    tile_cnt = width * height
+    starts = rng.sample(range(tile_cnt), agent_cnt)
+    finishes = rng.sample(range(tile_cnt), agent_cnt)
+    while any(start == finish for start, finish in zip(starts, finishes)):
+        rng.shuffle(finishes)
+
+    start_of = {tile_id: agent for agent, tile_id in enumerate(starts, 1)}
+    finish_of = {tile_id: agent for agent, tile_id in enumerate(finishes, 1)}
+
+    lines = ["V =\n"]
+    lines += ["({},{},{})\n".format(tile_id, start_of.get(tile_id, 0), finish_of.get(tile_id, 0))
+              for tile_id in range(tile_cnt)]
+    lines.append("E =\n")
+    for tile_id in range(tile_cnt):
+        if tile_id + width < tile_cnt:
+            lines.append("{" + "{},{}".format(tile_id, tile_id + width) + "}\n")
+        if (tile_id + 1) % width != 0:
+            lines.append("{" + "{},{}".format(tile_id, tile_id + 1) + "}\n")
+    return lines
+
+
+def synthetic_plans(ozomap):
+    """Function plans the shortest path of every agent on the map, conflicts between agents are ignored.
+
+    Note:
+        Plans are good enough for performance measurement, not for a real Ozobot run. Agents whose start equals
+        the finish (or that cannot reach it) are left out, because an agent without any move has no path to animate.
+
+    Args:
+        ozomap (OzoMap): Loaded map
+
+    Returns:
+        dict[int, dict[str, list]]: Plans in the same format as produced by solvers
+    """
+    starts, finishes = get_agent_endpoints(ozomap)
+    paths = {}
+    for agent_id in sorted(starts):
+        path = shortest_path(ozomap, starts[agent_id], finishes.get(agent_id))
+        if path is not None and len(path) > 1:
+            paths[agent_id] = path
+    return paths_to_plans(paths)
+
+
+def shortest_path(ozomap, start, finish):
+    """Function finds the shortest path between two tiles with breadth-first search.
+
+    Args:
+        ozomap (OzoMap): Loaded map
+        start (int): ID of the start tile
+        finish (int): ID of the finish tile
+
+    Returns:
+        list[int]: Tile IDs of the path including start and finish (None if there is no path)
+    """
+    if finish is None:
+        return None
+
+    previous = {start: None}
+    queue = collections.deque([start])
+    while queue:
+        current = queue.popleft()
+        if current == finish:
+            break
+        for neighbour in ozomap.get_neighbour_ids(current):
+            if neighbour not in previous:
+                previous[neighbour] = current
+                queue.append(neighbour)
+
+    if finish not in previous:
+        return None
+
+    path = [finish]
+    while previous[path[-1]] is not None:
+        path.append(previous[path[-1]])
+    return path[::-1]
+
+
+def plans_to_boox_output(plans):
+    """Function formats plans the way boOX solvers print them (used to measure plan parsing).
+
+    Args:
+        plans (dict[int, dict[str, list]]): Plans of all agents
+
+    Returns:
+        str: Solver output
+    """
+    lines = ["Agent {}: {}\n".format(agent_id, " ".join(map(str, plan['pos_list'])))
+             for agent_id, plan in plans.items()]
+    step_cnt = max((len(plan['steps']) for plan in plans.values()), default=0)
+    for step in range(step_cnt):
+        moves = ["{}#{}->{}".format(agent_id, *plan['steps'][step]) for agent_id, plan in plans.items()
+                 if step < len(plan['steps']) and plan['steps'][step] is not None]
+        lines.append("Step {}: {} \n".format(step + 1, " ".join(moves)))
+    return "".join(lines)
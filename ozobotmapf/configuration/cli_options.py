@@ -25,13 +25,16 @@ class CLIOptions:
 
         self.args = None
 
-    def parse(self):
+    def parse(self, args=None):
         """Method parses the command-line arguments.
 
+        Args:
+            args (list[str]): Arguments to be parsed instead of `sys.argv` (used by tools that build configurations)
+
         Returns:
             namespace: Parsed command-line arguments
         """
-        self.args = self.__parser.parse_args()
+        self.args = self.__parser.parse_args(args)
         logging.debug("Command-line arguments: {}".format(self.args))
 
         self.__validate_arguments()
@@ -55,17 +58,88 @@ class CLIOptions:
                                    help='Application configuration file.')
         self.__parser.add_argument('-e', '--editor', dest='editor', action='store_true',
                                    help='Start level editor.')
+        self.__parser.add_argument('-fp', '--frame-profile', dest='frame_profile', action='store_true',
+                                   help='Measure phases of every frame and write a report into `resources/logs/`.')
+        self.__parser.add_argument('-fb', '--frame-budget', type=float, dest='frame_budget',
+                                   help='Frame time budget in milliseconds, slower frames are logged '
+                                        '(used with --frame-profile).')
+        self.__parser.add_argument('-ra', '--render-ahead', type=float, dest='render_ahead',
+                                   help='Render frames ahead by a worker thread, latency budget in milliseconds '
+                                        '(how far ahead the frames are rendered).')
+        self.__parser.add_argument('-aq', '--adaptive-quality', type=float, dest='quality_budget',
+                                   help='Frame time budget in milliseconds, costly features are degraded when frames '
+                                        'are slower and restored when they are fast again.')
+        self.__parser.add_argument('-p', '--profile', dest='profile', action='store_true',
+                                   help='Profile the run with cProfile and write `.pstats` into `resources/logs/`.')
+        self.__parser.add_argument('-tm', '--trace-memory', dest='trace_memory', action='store_true',
+                                   help='Trace memory allocations and write a report into `resources/logs/`.')
+        self.__parser.add_argument('-pw', '--profile-window', nargs=2, type=int, dest='profile_window',
+                                   help='Simulation time window [Start, End) in milliseconds to be profiled '
+                                        '(used with --profile or --trace-memory).')
+        self.__parser.add_argument('-v', '--viewport', dest='viewport', action='store_true',
+                                   help='Pan and zoom over the map, maps larger than the window can be simulated.')
+        self.__parser.add_argument('-t', '--tiles', nargs=2, type=int, dest='tiles',
+                                   help='Split the map across several displays, one process and window per display '
+                                        '[Columns, Rows].')
+        self.__parser.add_argument('-pl', '--plan', type=str, dest='plan',
+                                   help='Replay plans from a plan file instead of running the solver.')
+        self.__parser.add_argument('-sp', '--save-plan', type=str, dest='save_plan',
+                                   help='Save plans of the run into a plan file (name only saves into '
+                                        '`resources/plans/`).')
 
     def __validate_arguments(self):
         """Validates parsed command-line parameter values."""
         assert_argument(self.args.resolution[0] > 0, "Width resolution has to be > 0.")
         assert_argument(self.args.resolution[1] > 0, "Height resolution has to be > 0.")
+        assert_argument(self.args.frame_budget is None or self.args.frame_budget > 0, "Frame budget has to be > 0.")
+        assert_argument(self.args.frame_budget is None or self.args.frame_profile,
+                        "Frame budget can be used only with --frame-profile.")
+        if self.args.quality_budget is not None:
+            self.__validate_adaptive_quality()
+        if self.args.render_ahead is not None:
+            self.__validate_render_ahead()
+        if self.args.profile_window is not None:
+            self.__validate_profile_window()
+        assert_argument(not (self.args.viewport and self.args.editor), "Viewport is not supported by the map editor.")
+        if self.args.tiles is not None:
+            self.__validate_tiles()
 
         if not self.args.editor:
             self.__validate_map()
             self.__validate_map_attributes()
+            self.__validate_plans()
         self.__validate_config_file()
 
+    def __validate_profile_window(self):
+        """Method validates the profiling time window."""
+        assert_argument(self.args.profile or self.args.trace_memory,
+                        "Profiling window can be used only with --profile or --trace-memory.")
+        assert_argument(not self.args.editor, "Profiling window is not supported by the map editor.")
+        assert_argument(0 <= self.args.profile_window[0] < self.args.profile_window[1],
+                        "Profiling window has to satisfy 0 <= Start < End.")
+
+    def __validate_adaptive_quality(self):
+        """Method validates the frame time budget of the adaptive quality."""
+        assert_argument(self.args.quality_budget > 0, "Adaptive quality budget has to be > 0.")
+        assert_argument(not self.args.editor, "Adaptive quality is not supported by the map editor.")
+        assert_argument(not self.args.frame_profile, "Adaptive quality cannot be used with --frame-profile, "
+                                                     "frames would not be comparable.")
+
+    def __validate_render_ahead(self):
+        """Method validates the latency budget of the render-ahead pipeline."""
+        assert_argument(self.args.render_ahead > 0, "Render-ahead latency budget has to be > 0.")
+        assert_argument(not self.args.editor, "Render-ahead is not supported by the map editor.")
+        assert_argument(not (self.args.frame_profile or self.args.profile),
+                        "Render-ahead cannot be profiled, frames are rendered by another thread.")
+
+    def __validate_tiles(self):
+        """Method validates the tiled output layout."""
+        assert_argument(self.args.tiles[0] > 0 and self.args.tiles[1] > 0, "Number of tiled displays has to be > 0.")
+        assert_argument(not self.args.editor, "Tiled output is not supported by the map editor.")
+        assert_argument(not self.args.viewport, "Tiled output cannot be used with the viewport.")
+        assert_argument(not (self.args.profile or self.args.trace_memory or self.args.frame_profile),
+                        "Tiled output cannot be profiled.")
+
     def __validate_map_attributes(self):
         """Method validates level attributes.
 
@@ -89,6 +163,25 @@ class CLIOptions:
             else:
                 assert_argument(False, "Map has to be a path to a file or a level name from `resources/maps/` folder.")
 
+    def __validate_plans(self):
+        """Method validates the plan file parameters.
+
+        The plan to be replayed has to be a path to a file or a plan name from `resources/plans/` folder. The plan to
+        be saved is put into `resources/plans/` if only a name is given.
+        """
+        if self.args.plan is not None and not os.path.isfile(self.args.plan):
+            if os.path.isfile(Values.PLANS_PATH + self.args.plan):
+                self.args.plan = Values.PLANS_PATH + self.args.plan
+            else:
+                assert_argument(False, "Plan has to be a path to a file or a plan name from `resources/plans/` folder.")
+
+        if self.args.save_plan is not None:
+            assert_argument(self.args.plan is None, "Replayed plan cannot be saved again.")
+            if not os.path.dirname(self.args.save_plan):
+                self.args.save_plan = Values.PLANS_PATH + self.args.save_plan
+            if not self.args.save_plan.endswith(Values.PLAN_FILE_EXT):
+                self.args.save_plan += Values.PLAN_FILE_EXT
+
     def __validate_config_file(self):
         """Method validates if the config file command-line parameter contains a path to a valid file."""
         assert_argument(self.args.config_file is not None, "You have to provide a config file.")
@@ -1,12 +1,10 @@
+import importlib.util
 import logging
 import os.path
 from configparser import ConfigParser
 
 from ozobotmapf.configuration.config_exceptions import InvalidConfigOptionException
-from ozobotmapf.simulator.agents.dummy_agent import DummyAgent
-from ozobotmapf.simulator.agents.animated_agent import AnimatedAgent
-from ozobotmapf.simulator.agents.ozobot_agent import OzobotAgent
-from ozobotmapf.utils.constants import AgentTypes
+from ozobotmapf.utils.constants import AgentTypes, RenderBackends, TrailModes
 
 
 class ConfigOptions:
@@ -30,7 +28,7 @@ class ConfigOptions:
 
         self.config = None
 
-    def parse(self):
+    def parse(self, validate_solver=True):
         """Parses the raw config into a dict of dicts and validates the values.
 
         Each section of the configuration file is parsed separately into a dictionary.
@@ -38,6 +36,9 @@ class ConfigOptions:
         Note:
             Format: config['section']['option'] = value
 
+        Args:
+            validate_solver (bool): If false, the 'solver' section is not validated (the solver will not be run)
+
         Returns:
             dict[str, dict[str, str]: Parsed configuration file
         """
@@ -45,7 +46,7 @@ class ConfigOptions:
         for section in self.__raw_config.sections():
             self.config[section] = self.__get_section_dict(section)
 
-        self.__validate_config()
+        self.__validate_config(validate_solver)
         logging.info("Config file parsed successfully: {}".format(self.config))
 
         return self.config
@@ -60,7 +61,7 @@ class ConfigOptions:
             dict[str, str]: Parsed configuration file section
         """
         options = {}
-        simulator_flags = ["display_borders", "display_walls", "direction_preview", "colors"]
+        simulator_flags = ["display_borders", "display_walls", "direction_preview", "colors", "trail_sprites"]
         for option in self.__raw_config.options(section):
             if section == "simulator":
                 if option in simulator_flags:
@@ -78,14 +79,18 @@ class ConfigOptions:
 
         return options
 
-    def __validate_config(self):
+    def __validate_config(self, validate_solver):
         """Validates the whole config file (with retyping).
 
         Each section is validated separately.
+
+        Args:
+            validate_solver (bool): Flag if the 'solver' section should be validated
         """
         for section in self.config:
             if section == "solver":
-                self.__validate_solver_section()
+                if validate_solver:
+                    self.__validate_solver_section()
             elif section == "simulator":
                 self.__validate_simulator_section()
             else:
@@ -119,20 +124,52 @@ class ConfigOptions:
     def __validate_simulator_section(self):
         """Validates simulator section values.
 
-        Agent type string is replaced with agent class.
+        Agent type string is replaced with agent class. NumPy is an optional dependency, it is checked only when
+        the `numpy` render backend is selected.
         """
-        if self.config["simulator"]["agent_type"] == AgentTypes.DUMMY:
-            self.config["simulator"]["agent_type"] = DummyAgent
-        elif self.config["simulator"]["agent_type"] == AgentTypes.ANIMATED:
-            self.config["simulator"]["agent_type"] = AnimatedAgent
-        elif self.config["simulator"]["agent_type"] == AgentTypes.OZOBOT:
-            self.config["simulator"]["agent_type"] = OzobotAgent
-        else:
-            raise_exception("Unsupported agent type found in configuration.")
+        self.config["simulator"]["agent_type"] = get_agent_class(self.config["simulator"]["agent_type"])
+        trail_mode = self.config["simulator"].get("trail_mode", TrailModes.FRAMES)
+        if trail_mode not in (TrailModes.FRAMES, TrailModes.ANALYTIC):
+            raise_exception("Unsupported trail mode found in configuration.")
+        render_backend = self.config["simulator"].get("render_backend", RenderBackends.PYGAME)
+        if render_backend not in (RenderBackends.PYGAME, RenderBackends.NUMPY):
+            raise_exception("Unsupported render backend found in configuration.")
+        if render_backend == RenderBackends.NUMPY and importlib.util.find_spec("numpy") is None:
+            raise_exception("'numpy' render backend requires the NumPy package, install it or use 'pygame' backend.")
 
 # ------------------------------------------------------------------------------------------------------------
 
 
+def get_agent_class(agent_type):
+    """Function returns the agent class for an agent type name.
+
+    Note:
+        Agent modules are imported only here, so that the configuration module itself does not pull in the whole
+        simulator package.
+
+    Args:
+        agent_type (str): Agent type name (one of `AgentTypes`)
+
+    Returns:
+        class: Agent class
+
+    Raises:
+        InvalidConfigOptionException: If the agent type is not supported
+    """
+    from ozobotmapf.simulator.agents.dummy_agent import DummyAgent
+    from ozobotmapf.simulator.agents.animated_agent import AnimatedAgent
+    from ozobotmapf.simulator.agents.ozobot_agent import OzobotAgent
+
+    if agent_type == AgentTypes.DUMMY:
+        return DummyAgent
+    elif agent_type == AgentTypes.ANIMATED:
+        return AnimatedAgent
+    elif agent_type == AgentTypes.OZOBOT:
+        return OzobotAgent
+    else:
+        raise_exception("Unsupported agent type found in configuration.")
+
+
 def raise_exception(message):
     """Method logs the error and raises exception.
 
@@ -2,6 +2,7 @@ import logging
 import math
 
 from ozobotmapf.graphics.shapes import Point
+from ozobotmapf.utils.constants import RenderBackends, TrailModes
 
 
 class Configuration:
@@ -10,6 +11,8 @@ class Configuration:
     Attributes:
         map_path (str): Path to the level file
         solver_path (str): Path to the solver executable
+        plan_path (str): Path to the plan file that is replayed instead of running the solver (None if not set)
+        save_plan_path (str): Path to the plan file where plans of the run are saved (None if not set)
         fullscreen (bool): Flag if fullscreen mode is on
         window_width (int): Width of the window in pixels
         window_height (int): Height of the window in pixels
@@ -36,6 +39,24 @@ class Configuration:
         step_time (int): Time that takes animated path to move between two tiles in milliseconds
         tail_lag (int): Time lag between the head and tail of the animated path in milliseconds
         colors (bool): Flag if OzobotAgent should use colored paths
+        trail_sprites (bool): Flag if trails should be drawn from pre-rasterized sprites
+        trail_mode (str): How OzobotAgent builds its trail (one of `TrailModes`)
+        render_backend (str): How the agent paths are drawn (one of `RenderBackends`)
+        checker_patterns (bool): Flag if tiles of agent starts and finishes have the fine checker pattern (changed by
+            the adaptive quality)
+        frame_profile (bool): Flag if phases of every simulator frame should be measured
+        frame_budget (float): Frame time budget in milliseconds, slower frames are logged (None if not set)
+        render_ahead (float): Latency budget of frames rendered ahead by a worker thread in milliseconds (None if
+            frames are rendered by the main loop)
+        quality_budget (float): Frame time budget of the adaptive quality in milliseconds (None if the quality is
+            not adapted)
+        profile (bool): Flag if the run should be profiled with cProfile
+        trace_memory (bool): Flag if memory allocations should be traced with tracemalloc
+        profile_window (list[int]): Simulation time window of profiling in milliseconds (None for the whole run)
+        viewport (bool): Flag if the map can be panned and zoomed (the map can be larger than the window)
+        tiles (list[int]): Number of columns and rows of the tiled output displays (None for a single window)
+        region_width (int): Width of the map region shown by one window in tiles
+        region_height (int): Height of the map region shown by one window in tiles
     """
 
     def __init__(self, cli, config):
@@ -47,6 +68,8 @@ class Configuration:
         """
         self.map_path = None
         self.solver_path = None
+        self.plan_path = None
+        self.save_plan_path = None
 
         self.fullscreen = cli.fullscreen
         if self.fullscreen:
@@ -77,6 +100,16 @@ class Configuration:
         self.map_width, self.map_height, self.map_agent_count = [None] * 3
 
         self.editor = cli.editor
+        self.frame_profile = cli.frame_profile
+        self.frame_budget = cli.frame_budget
+        self.render_ahead = cli.render_ahead
+        self.quality_budget = cli.quality_budget
+        self.profile = cli.profile
+        self.trace_memory = cli.trace_memory
+        self.profile_window = cli.profile_window
+        self.viewport = cli.viewport
+        self.tiles = cli.tiles
+        self.region_width, self.region_height = self.max_map_width, self.max_map_height
 
         self.display_grid = None
         self.display_walls = None
@@ -85,6 +118,10 @@ class Configuration:
         self.step_time = None
         self.tail_lag = None
         self.colors = None
+        self.trail_sprites = None
+        self.trail_mode = None
+        self.render_backend = None
+        self.checker_patterns = None
 
     def __str__(self):
         return "CONFIGURATION PARAMETERS:\n" \
@@ -127,10 +164,18 @@ class SimulatorConfig(Configuration):
         super().__init__(cli, config)
 
         self.map_path = cli.map_file
+        self.plan_path = cli.plan
+        self.save_plan_path = cli.save_plan
         self.solver_path = config["solver"]["path"]
         self.solver = config["solver"]["solver"]
         self.solver_algorithm = config["solver"]["algorithm"]
         self.map_width, self.map_height, self.map_agent_count = cli.map_attributes
+        if self.tiles is not None:  # Arena is made of displays of the same size, every window shows its region
+            self.max_map_width *= self.tiles[0]
+            self.max_map_height *= self.tiles[1]
+        elif self.viewport:  # Grid has to cover the whole map, only a part of it is displayed
+            self.max_map_width = max(self.max_map_width, self.map_width)
+            self.max_map_height = max(self.max_map_height, self.map_height)
 
         self.color_code_radius = round(config["ozobot"]["color_code_radius"] * self.mm_to_px)
         self.intersection_width = round(config["ozobot"]["intersection_width"] * self.mm_to_px)
@@ -142,6 +187,10 @@ class SimulatorConfig(Configuration):
         self.step_time = config["simulator"]["step_time"]
         self.tail_lag = config["simulator"]["tail_lag"]
         self.colors = config["simulator"]["colors"]
+        self.trail_sprites = config["simulator"].get("trail_sprites", True)
+        self.trail_mode = config["simulator"].get("trail_mode", TrailModes.FRAMES)
+        self.render_backend = config["simulator"].get("render_backend", RenderBackends.PYGAME)
+        self.checker_patterns = True
 
         logging.debug(str(self))
 
@@ -0,0 +1,4 @@
+from ozobotmapf.generate.generator import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import time
+from argparse import ArgumentParser
+
+from ozobotmapf.generate.generator_exception import GeneratorException
+from ozobotmapf.generate.layouts import LAYOUTS, add_obstacles
+from ozobotmapf.mapf_solvers.plan_file import save_plans
+from ozobotmapf.mapf_solvers.prioritized_solver import PrioritizedSolver
+from ozobotmapf.mapf_solvers.solver_exception import NoPlanFoundException
+from ozobotmapf.utils.constants import Values
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "resources", "maps", "generated")
+
+
+class MapGenerator:
+    """Class generates maps with the given layout, random obstacles and random agent starts and finishes.
+
+    Starts and finishes are placed only into the largest connected part of the map and every agent has to move
+    (start and finish differ). If the check is on, the assignment has to be solvable by the built-in prioritized
+    planner, otherwise another assignment is tried.
+
+    Attributes:
+        layout (str): Name of the layout (one of `LAYOUTS`)
+        width (int): Width of the map in tiles
+        height (int): Height of the map in tiles
+        agent_cnt (int): Number of agents
+        density (float): Fraction of tiles turned into obstacles on top of the layout
+        check (bool): Flag if the assignment has to be solvable by the prioritized planner
+    """
+
+    ASSIGNMENT_ATTEMPTS = 10
+    PLANNER_RESTARTS = 3
+
+    def __init__(self, layout, width, height, agent_cnt, density=0.0, check=True):
+        """Initialization of the MapGenerator instance.
+
+        Args:
+            layout (str): Name of the layout (one of `LAYOUTS`)
+            width (int): Width of the map in tiles
+            height (int): Height of the map in tiles
+            agent_cnt (int): Number of agents
+            density (float): Fraction of tiles turned into obstacles on top of the layout
+            check (bool): Flag if the assignment has to be solvable by the prioritized planner
+        """
+        self.layout = layout
+        self.width, self.height, self.agent_cnt = width, height, agent_cnt
+        self.density = density
+        self.check = check
+
+    def generate(self, seed):
+        """Method generates one map.
+
+        Args:
+            seed (int): Seed of the random generator, the same seed always gives the same map
+
+        Returns:
+            list[str]: Lines of the `.ozomap` file
+            dict[int, dict[str, list]]: Plans found by the check (None if the check is off)
+
+        Raises:
+            GeneratorException: If the agents do not fit into the map or no solvable assignment is found
+        """
+        rng = random.Random(seed)
+        layout = LAYOUTS[self.layout](self.width, self.height, rng)
+        add_obstacles(layout, self.density, rng)
+        component = layout.largest_component()
+        if len(component) < 2 or self.agent_cnt > len(component):
+            raise GeneratorException("{} agents do not fit into the largest connected part of the map ({} tiles)."
+                                     .format(self.agent_cnt, len(component)))
+
+        for _ in range(self.ASSIGNMENT_ATTEMPTS):
+            starts, finishes = self.__assign_agents(component, rng)
+            if not self.check:
+                return layout.to_lines(starts, finishes), None
+
+            agents = {agent: (starts[agent], finishes[agent]) for agent in starts}
+            try:
+                plans = PrioritizedSolver(layout, self.PLANNER_RESTARTS, seed, agents).plan()
+            except NoPlanFoundException:
+                continue
+            return layout.to_lines(starts, finishes), plans
+
+        raise GeneratorException("No solvable assignment of agents found in {} attempts (seed {})."
+                                 .format(self.ASSIGNMENT_ATTEMPTS, seed))
+
+    def map_name(self, index):
+        """Method returns the name of the generated map, it starts with the map attributes.
+
+        Args:
+            index (int): Index of the map in the generated batch
+
+        Returns:
+            str: Map name without the extension
+        """
+        return "{}x{}_{}a_{}_{}".format(self.width, self.height, self.agent_cnt, self.layout, index)
+
+    def __assign_agents(self, component, rng):
+        """Method places starts and finishes of all agents to distinct tiles of the component.
+
+        Finishes are sampled independently of the starts, then every finish equal to its start is replaced by a tile
+        that is not a finish yet or, if all tiles are finishes, swapped with the finish of another agent. Both keep
+        the assignment valid, so a single pass is enough.
+
+        Returns:
+            dict[int, int]: Start tile ID of every agent
+            dict[int, int]: Finish tile ID of every agent
+
+        Raises:
+            GeneratorException: If the component is too small for distinct starts and finishes
+        """
+        if len(component) < 2 or self.agent_cnt > len(component):
+            raise GeneratorException("No valid assignment of {} agents exists in {} tiles."
+                                     .format(self.agent_cnt, len(component)))
+
+        starts = rng.sample(component, self.agent_cnt)
+        finishes = rng.sample(component, self.agent_cnt)
+        unused = sorted(set(component).difference(finishes))
+        for agent in range(self.agent_cnt):
+            if finishes[agent] != starts[agent]:
+                continue
+            if unused:
+                finishes[agent] = unused.pop(rng.randrange(len(unused)))
+            else:  # Every tile is a finish, the other agent's finish differs from both starts
+                other = rng.choice([index for index in range(self.agent_cnt) if index != agent])
+                finishes[agent], finishes[other] = finishes[other], finishes[agent]
+        return dict(enumerate(starts, 1)), dict(enumerate(finishes, 1))
+# ------------------------------------------------------------------------------------------------------------
+
+
+def generate_map(task):
+    """Function generates one map and writes it into a file (run in the worker processes).
+
+    Args:
+        task (tuple): Generator, index of the map, seed, output folder and flag if plans should be saved
+
+    Returns:
+        str: Path to the generated map
+    """
+    generator, index, seed, output, plan = task
+    lines, plans = generator.generate(seed)
+    path = os.path.join(output, generator.map_name(index) + Values.MAP_FILE_EXT)
+    with open(path, "w") as file:
+        file.writelines(lines)
+    if plan and plans is not None:
+        save_plans(plans, path[:-len(Values.MAP_FILE_EXT)] + Values.PLAN_FILE_EXT)
+    return path
+
+
+def generate_maps(generator, count, seed, output, jobs=None, plans=False):
+    """Function generates a batch of maps in parallel.
+
+    Args:
+        generator (MapGenerator): Configured generator
+        count (int): Number of maps
+        seed (int): Seed of the first map, following maps use the next seeds
+        output (str): Output folder
+        jobs (int): Number of worker processes (None for the number of CPUs)
+        plans (bool): Flag if plans found by the check should be saved next to the maps
+
+    Yields:
+        str: Paths to the generated maps (in the order they are finished)
+    """
+    os.makedirs(output, exist_ok=True)
+    tasks = [(generator, index, seed + index, output, plans) for index in range(count)]
+    if jobs == 1 or count == 1:
+        yield from map(generate_map, tasks)
+        return
+
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap_unordered(generate_map, tasks)
+
+
+def parse_arguments(args=None):
+    parser = ArgumentParser(prog="python -m ozobotmapf.generate",
+                            description="Non-interactive generation of `.ozomap` files.")
+    parser.add_argument('-l', '--layout', choices=sorted(LAYOUTS), default="open", help='Layout of the maps.')
+    parser.add_argument('-s', '--size', nargs=2, type=int, required=True, metavar=('WIDTH', 'HEIGHT'),
+                        help='Map size in tiles.')
+    parser.add_argument('-a', '--agents', type=int, required=True, help='Number of agents.')
+    parser.add_argument('-d', '--density', type=float, default=0.0,
+                        help='Fraction of tiles turned into obstacles on top of the layout [default: 0].')
+    parser.add_argument('-n', '--count', type=int, default=1, help='Number of generated maps.')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH,
+                        help='Output folder [default: resources/maps/generated].')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes [default: number of CPUs].')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first map.')
+    parser.add_argument('--no-check', dest='check', action='store_false',
+                        help='Do not check that the agents can be planned by the prioritized planner.')
+    parser.add_argument('-p', '--plans', action='store_true',
+                        help='Save plans found by the check next to the maps (`.ozoplan`).')
+    args = parser.parse_args(args)
+
+    if args.size[0] < 1 or args.size[1] < 1 or args.agents < 1 or args.count < 1:
+        parser.error("Map size, number of agents and number of maps have to be > 0.")
+    if not 0 <= args.density < 1:
+        parser.error("Obstacle density has to be in range [0, 1).")
+    if args.plans and not args.check:
+        parser.error("Plans can be saved only with the check.")
+    return args
+
+
+def main(args=None):
+    args = parse_arguments(args)
+    logging.getLogger().setLevel(logging.WARNING)
+    generator = MapGenerator(args.layout, *args.size, args.agents, args.density, args.check)
+
+    start = time.perf_counter()
+    try:
+        for done, path in enumerate(generate_maps(generator, args.count, args.seed, args.output, args.jobs,
+                                                  args.plans), 1):
+            print("[{}/{}] {}".format(done, args.count, path), file=sys.stderr)
+    except GeneratorException as error:
+        sys.exit("Generation failed: {}".format(error))
+    print("Generated {} maps in {:.2f} s.".format(args.count, time.perf_counter() - start), file=sys.stderr)
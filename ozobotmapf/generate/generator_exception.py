@@ -0,0 +1,3 @@
+class GeneratorException(Exception):
+    """Raised when a map cannot be generated with the requested parameters."""
+    pass
@@ -0,0 +1,252 @@
+import collections
+
+
+class Layout:
+    """Class represents a generated map as a grid of tiles and passages between neighbouring tiles.
+
+    Tile IDs are the same as in `.ozomap` files (`y * width + x`). A wall is anywhere there is no passage, obstacles
+    are tiles without any passage.
+
+    Attributes:
+        width (int): Width of the map in tiles
+        height (int): Height of the map in tiles
+        passages (set[tuple[int, int]]): Passages between neighbouring tiles (lower tile ID first)
+    """
+
+    def __init__(self, width, height):
+        """Initialization of an empty Layout (walls everywhere).
+
+        Args:
+            width (int): Width of the map in tiles
+            height (int): Height of the map in tiles
+        """
+        self.width, self.height = width, height
+        self.passages = set()
+
+    def open(self, a, b):
+        """Method opens the passage between two neighbouring tiles."""
+        self.passages.add((min(a, b), max(a, b)))
+
+    def close(self, a, b):
+        """Method builds the wall between two neighbouring tiles."""
+        self.passages.discard((min(a, b), max(a, b)))
+
+    def open_all(self):
+        """Method opens all passages (walls remain only around the map)."""
+        for tile_id in range(self.width * self.height):
+            for neighbour in self.grid_neighbours(tile_id):
+                if neighbour > tile_id:
+                    self.passages.add((tile_id, neighbour))
+
+    def block(self, tile_id):
+        """Method turns the tile into an obstacle by closing all its passages."""
+        for neighbour in self.grid_neighbours(tile_id):
+            self.close(tile_id, neighbour)
+
+    def grid_neighbours(self, tile_id):
+        """Method returns IDs of the neighbouring tiles regardless of walls.
+
+        Args:
+            tile_id (int): Number of the tile
+
+        Returns:
+            list[int]: IDs of the neighbouring tiles
+        """
+        x, y = tile_id % self.width, tile_id // self.width
+        neighbours = []
+        if y > 0:
+            neighbours.append(tile_id - self.width)
+        if x < self.width - 1:
+            neighbours.append(tile_id + 1)
+        if y < self.height - 1:
+            neighbours.append(tile_id + self.width)
+        if x > 0:
+            neighbours.append(tile_id - 1)
+        return neighbours
+
+    def get_neighbour_ids(self, tile_id):
+        """Method returns IDs of the tiles that can be reached from the tile in one move (same as `OzoMap`).
+
+        Args:
+            tile_id (int): Number of the tile
+
+        Returns:
+            list[int]: IDs of the neighbouring tiles
+        """
+        return [neighbour for neighbour in self.grid_neighbours(tile_id)
+                if (min(tile_id, neighbour), max(tile_id, neighbour)) in self.passages]
+
+    def largest_component(self):
+        """Method finds the largest set of tiles that are connected with each other.
+
+        Returns:
+            list[int]: Tile IDs of the largest component (sorted)
+        """
+        seen, largest = set(), []
+        for tile_id in range(self.width * self.height):
+            if tile_id in seen:
+                continue
+            component, queue = [tile_id], collections.deque([tile_id])
+            seen.add(tile_id)
+            while queue:
+                for neighbour in self.get_neighbour_ids(queue.popleft()):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        component.append(neighbour)
+                        queue.append(neighbour)
+            if len(component) > len(largest):
+                largest = component
+        return sorted(largest)
+
+    def to_lines(self, starts, finishes):
+        """Method creates the `.ozomap` file representation of the layout.
+
+        Args:
+            starts (dict[int, int]): Start tile ID of every agent
+            finishes (dict[int, int]): Finish tile ID of every agent
+
+        Returns:
+            list[str]: Lines of the `.ozomap` file
+        """
+        start_of = {tile_id: agent for agent, tile_id in starts.items()}
+        finish_of = {tile_id: agent for agent, tile_id in finishes.items()}
+
+        lines = ["V =\n"]
+        lines += ["({},{},{})\n".format(tile_id, start_of.get(tile_id, 0), finish_of.get(tile_id, 0))
+                  for tile_id in range(self.width * self.height)]
+        lines.append("E =\n")
+        lines += ["{" + "{},{}".format(a, b) + "}\n" for a, b in sorted(self.passages)]
+        return lines
+# ------------------------------------------------------------------------------------------------------------
+
+
+def open_layout(width, height, rng):
+    """Function creates a map without any inner walls."""
+    layout = Layout(width, height)
+    layout.open_all()
+    return layout
+
+
+def corridors_layout(width, height, rng, loop_ratio=0.15):
+    """Function creates a maze of one tile wide corridors.
+
+    A random depth-first search carves a maze (a spanning tree of the grid), then a part of the remaining walls is
+    removed, so that the corridors form loops where agents can pass each other.
+
+    Args:
+        width (int): Width of the map in tiles
+        height (int): Height of the map in tiles
+        rng (random.Random): Random generator
+        loop_ratio (float): Fraction of the remaining inner walls that are removed
+
+    Returns:
+        Layout: Generated layout
+    """
+    layout = Layout(width, height)
+    visited, stack = {0}, [0]
+    while stack:
+        current = stack[-1]
+        unvisited = [neighbour for neighbour in layout.grid_neighbours(current) if neighbour not in visited]
+        if not unvisited:
+            stack.pop()
+            continue
+        following = rng.choice(unvisited)
+        layout.open(current, following)
+        visited.add(following)
+        stack.append(following)
+
+    walls = [(tile_id, neighbour) for tile_id in range(width * height) for neighbour in layout.grid_neighbours(tile_id)
+             if neighbour > tile_id and (tile_id, neighbour) not in layout.passages]
+    for a, b in rng.sample(walls, round(len(walls) * loop_ratio)):
+        layout.open(a, b)
+    return layout
+
+
+def rooms_layout(width, height, rng, room_size=4, extra_door_ratio=0.3):
+    """Function creates a map divided into square rooms connected by doors.
+
+    Rooms are connected into a random spanning tree, so every room is reachable, and some of the other neighbouring
+    rooms get a door too.
+
+    Args:
+        width (int): Width of the map in tiles
+        height (int): Height of the map in tiles
+        rng (random.Random): Random generator
+        room_size (int): Length of the room side in tiles
+        extra_door_ratio (float): Probability that neighbouring rooms outside of the spanning tree get a door
+
+    Returns:
+        Layout: Generated layout
+    """
+    layout = Layout(width, height)
+    layout.open_all()
+
+    room_of = {}
+    for tile_id in range(width * height):
+        room_of[tile_id] = (tile_id % width // room_size, tile_id // width // room_size)
+
+    doors = collections.defaultdict(list)  # Pair of rooms -> passages between them
+    for a, b in list(layout.passages):
+        if room_of[a] != room_of[b]:
+            layout.close(a, b)
+            doors[tuple(sorted((room_of[a], room_of[b])))].append((a, b))
+
+    rooms = sorted(set(room_of.values()))
+    connected, pairs = {rooms[0]}, sorted(doors)
+    rng.shuffle(pairs)
+    while len(connected) < len(rooms):
+        for pair in pairs:
+            if (pair[0] in connected) != (pair[1] in connected):
+                layout.open(*rng.choice(doors[pair]))
+                connected.update(pair)
+                break
+    for pair in pairs:
+        if rng.random() < extra_door_ratio:
+            layout.open(*rng.choice(doors[pair]))
+    return layout
+
+
+def warehouse_layout(width, height, rng, shelf_length=4):
+    """Function creates a warehouse with rows of shelves (obstacles) separated by one tile wide aisles.
+
+    Shelves are one tile deep, every second row inside the map is a row of shelves interrupted by cross aisles.
+    The border of the map is always an aisle.
+
+    Args:
+        width (int): Width of the map in tiles
+        height (int): Height of the map in tiles
+        rng (random.Random): Random generator (unused, the layout is regular)
+        shelf_length (int): Number of shelf tiles between two cross aisles
+
+    Returns:
+        Layout: Generated layout
+    """
+    layout = Layout(width, height)
+    layout.open_all()
+    for tile_id in range(width * height):
+        x, y = tile_id % width, tile_id // width
+        inside = 0 < x < width - 1 and 0 < y < height - 1
+        if inside and y % 2 == 0 and x % (shelf_length + 1) != 0:
+            layout.block(tile_id)
+    return layout
+
+
+def add_obstacles(layout, density, rng):
+    """Function turns randomly chosen tiles into obstacles.
+
+    Args:
+        layout (Layout): Layout to be modified
+        density (float): Fraction of all tiles that become obstacles
+        rng (random.Random): Random generator
+    """
+    tile_cnt = layout.width * layout.height
+    for tile_id in rng.sample(range(tile_cnt), round(tile_cnt * density)):
+        layout.block(tile_id)
+
+
+LAYOUTS = {
+    "open": open_layout,
+    "corridors": corridors_layout,
+    "rooms": rooms_layout,
+    "warehouse": warehouse_layout,
+}
@@ -0,0 +1,66 @@
+class ChunkIndex:
+    """Spatial index of the static map drawables, the grid is split into square chunks of tiles.
+
+    Only chunks overlapping the visible part of the grid are drawn. Chunks are created when they become visible
+    for the first time and are dropped whenever the map is laid out again (pan or zoom of the viewport), so a large
+    map never has all its drawables in memory.
+
+    Attributes:
+        parser (OzomapDrawableParser): Parser creating drawables of a grid region
+        width (int): Width of the grid in tiles
+        height (int): Height of the grid in tiles
+    """
+
+    CHUNK_SIZE = 8  # Length of the chunk side in tiles
+    LAYERS = 3  # Agent starts and finishes, tile borders, walls
+
+    def __init__(self, parser, width, height):
+        """Initialization of the ChunkIndex instance.
+
+        Args:
+            parser (OzomapDrawableParser): Parser creating drawables of a grid region
+            width (int): Width of the grid in tiles
+            height (int): Height of the grid in tiles
+        """
+        self.parser = parser
+        self.width, self.height = width, height
+
+        self.__chunks = {}
+
+    def get_layers(self, x0, y0, x1, y1):
+        """Method returns drawables of all chunks overlapping the region, grouped by layers.
+
+        Args:
+            x0 (int): First visible column
+            y0 (int): First visible row
+            x1 (int): Column after the last visible column
+            y1 (int): Row after the last visible row
+
+        Returns:
+            list[list[DrawableGroup]]: Drawable groups of the visible chunks for every layer
+        """
+        layers = [[] for _ in range(self.LAYERS)]
+        if x1 <= x0 or y1 <= y0:
+            return layers
+
+        size = self.CHUNK_SIZE
+        for chunk_y in range(y0 // size, (y1 - 1) // size + 1):
+            for chunk_x in range(x0 // size, (x1 - 1) // size + 1):
+                for layer, group in zip(layers, self.__get_chunk(chunk_x, chunk_y)):
+                    layer.append(group)
+        return layers
+
+    def invalidate(self):
+        """Method drops all chunks (their drawables do not match the tile layout any more)."""
+        self.__chunks.clear()
+
+    def __len__(self):
+        return len(self.__chunks)
+
+    def __get_chunk(self, chunk_x, chunk_y):
+        chunk = self.__chunks.get((chunk_x, chunk_y))
+        if chunk is None:
+            x0, y0 = chunk_x * self.CHUNK_SIZE, chunk_y * self.CHUNK_SIZE
+            x1, y1 = min(x0 + self.CHUNK_SIZE, self.width), min(y0 + self.CHUNK_SIZE, self.height)
+            chunk = self.__chunks[(chunk_x, chunk_y)] = self.parser.parse_region(x0, y0, x1, y1)
+        return chunk
@@ -1,27 +1,106 @@
 import math
-import pygame
 
+from ozobotmapf.graphics.label_cache import LABELS
 from ozobotmapf.graphics.shapes import Point, Rectangle
+from ozobotmapf.graphics.trail_sprites import SPRITES
 from ozobotmapf.utils.constants import Colors, Directions
+from ozobotmapf.utils.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")  # Loaded by the first draw, drawables can be built without pygame
 
 
 class Drawable:
-    """Abstract class wrapping several pyGame objects that can be drawn to the screen."""
+    """Abstract class wrapping several pyGame objects that can be drawn to the screen.
+
+    Note:
+        Drawables are created for every trail segment, so all of them use `__slots__` instead of `__dict__`.
+    """
+
+    __slots__ = ()
+
+    IS_DOT = False  # Flag if the drawable is one dot of a trail with `x`, `y`, and `width` (see `SpriteDot`)
 
     def draw(self, screen):
         """Method supporting drawing to the screen."""
         pass
 
+    def draw_colored(self, screen, color):
+        """Method draws the drawable in the given color instead of its own (if supported).
+
+        Args:
+            screen (pygame.Surface): Target surface
+            color (tuple[int, int, int]): Color of the drawing
+        """
+        self.draw(screen)
+
+    def submit(self, renderer, color=None):
+        """Method adds the drawable to the frame renderer (`RenderList` or `TrailRasterizer`) instead of drawing it.
+
+        Args:
+            renderer (RenderList | TrailRasterizer): Renderer collecting the frame
+            color (tuple[int, int, int]): Color of the drawing (None for the drawable's own color)
+        """
+        renderer.add_drawable(self, color)
+
+    def get_sprite(self, color=None):
+        """Method returns the cached sprite of the drawable, so it can be blitted with the others at once.
+
+        Args:
+            color (tuple[int, int, int]): Color of the drawing (None for the drawable's own color)
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: Sprite and its position (None if the drawable is not a sprite)
+        """
+        return None
+
+    def get_dot(self):
+        """Method returns the middle of the drawable if it looks like one dot of a trail (it fits into the line width).
+
+        Returns:
+            tuple[float, float]: Middle of the dot (None if the drawable is not a dot)
+        """
+        return None
+
+    def translate(self, dx, dy):
+        """Method moves the drawable on the screen (used when the map is panned).
+
+        Args:
+            dx (int): Horizontal move in pixels
+            dy (int): Vertical move in pixels
+        """
+        pass
+
 
 class Line(Drawable):
+    __slots__ = ("start", "end", "width", "color")
+
     def __init__(self, start: Point, end: Point, width: int = 1, color=Colors.BLACK):
-        self.start, self.end = Point(*start.to_list()), Point(*end.to_list())
+        self.start, self.end = Point(start.x, start.y), Point(end.x, end.y)
         self.width = width
         self.color = color
         self.__elongate()
 
     def draw(self, screen):
-        pygame.draw.line(screen, self.color, self.start, self.end, self.width)
+        self.draw_colored(screen, self.color)
+
+    def draw_colored(self, screen, color):
+        pygame.draw.line(screen, color, self.start, self.end, self.width)
+
+    def get_dot(self):
+        start, end = self.start, self.end
+        if abs(end.x - start.x) + abs(end.y - start.y) <= self.width:  # Zero length line elongated to the width
+            return (start.x + end.x) / 2, (start.y + end.y) / 2
+        return None
+
+    def translate(self, dx, dy):
+        self.start.move(dx, dy)
+        self.end.move(dx, dy)
+
+    def set_ends(self, start: Point, end: Point):
+        """Method moves the line to new ends in place (the line can be reused instead of creating a new one)."""
+        self.start.x, self.start.y = start.x, start.y
+        self.end.x, self.end.y = end.x, end.y
+        self.__elongate()
 
     def __elongate(self):
         if self.start.x == self.end.x:  # line is vertical
@@ -41,6 +120,8 @@ class Line(Drawable):
 
 
 class Rect(Drawable):
+    __slots__ = ("rect", "width", "color")
+
     def __init__(self, rectangle: Rectangle, width: int = 1, color=Colors.BLACK):
         self.rect = Rectangle(*rectangle.to_list())
         self.width = width
@@ -51,6 +132,8 @@ class Rect(Drawable):
 
 
 class FillRect(Drawable):
+    __slots__ = ("rect", "color")
+
     def __init__(self, rectangle: Rectangle, color=Colors.WHITE):
         self.rect = Rectangle(*rectangle.to_list())
         self.color = color
@@ -60,7 +143,11 @@ class FillRect(Drawable):
 
 
 class FillChecker(Drawable):
-    def __init__(self, rectangle: Rectangle, color1=Colors.WHITE, color2=Colors.BLACK, splits=10):
+    __slots__ = ("rect", "colors", "splits", "part_width", "part_height")
+
+    SPLITS = 10  # Number of the parts of the pattern in both directions
+
+    def __init__(self, rectangle: Rectangle, color1=Colors.WHITE, color2=Colors.BLACK, splits=SPLITS):
         self.rect = Rectangle(*rectangle.to_list())
         self.colors = [color1, color2]
         self.splits = splits
@@ -79,6 +166,8 @@ class FillChecker(Drawable):
 
 
 class FullArrow(Drawable):
+    __slots__ = ("corners", "color")
+
     def __init__(self, center: Point, direction: Directions, width: int, color=Colors.BLACK):
         self.corners = self.__compute_corners(center, direction, width)
         self.color = color
@@ -100,6 +189,8 @@ class FullArrow(Drawable):
 
 
 class Arc(Drawable):
+    __slots__ = ("bounding_box", "starting_angle", "end_angle", "width", "color")
+
     def __init__(self, bounding_box: Rectangle, start_angle: int, end_angle: int, width: int = 1, color=Colors.BLACK):
         self.bounding_box = bounding_box
         self.starting_angle = math.radians(start_angle)
@@ -108,20 +199,120 @@ class Arc(Drawable):
         self.color = color
 
     def draw(self, screen):
-        pygame.draw.arc(screen, self.color, self.bounding_box, self.starting_angle, self.end_angle, self.width)
+        self.draw_colored(screen, self.color)
+
+    def draw_colored(self, screen, color):
+        pygame.draw.arc(screen, color, self.bounding_box, self.starting_angle, self.end_angle, self.width)
+
+    def get_dot(self):
+        box = self.bounding_box
+        return get_arc_dot(box.origin.x, box.origin.y, box.width, self.starting_angle, self.end_angle, self.width)
+
+    def translate(self, dx, dy):
+        self.bounding_box.origin.move(dx, dy)
+
+
+class SpriteDot(Drawable):
+    """Zero length line (one dot of a trail) drawn as a cached sprite, looks the same as `Line(point, point)`."""
+
+    __slots__ = ("x", "y", "width", "color")
+
+    IS_DOT = True
+
+    def __init__(self, point: Point, width: int = 1, color=Colors.BLACK):
+        self.x, self.y = int(point.x), int(point.y)
+        self.width = width
+        self.color = color
+
+    def draw(self, screen):
+        self.draw_colored(screen, self.color)
+
+    def draw_colored(self, screen, color):
+        sprite, offset = SPRITES.dot(self.width, color)
+        screen.blit(sprite, (self.x + offset[0], self.y + offset[1]))
+
+    def get_sprite(self, color=None):
+        sprite, offset = SPRITES.dot(self.width, self.color if color is None else color)
+        return sprite, (self.x + offset[0], self.y + offset[1])
+
+    def get_dot(self):
+        return self.x, self.y
+
+    def translate(self, dx, dy):
+        self.x += dx
+        self.y += dy
+
+
+class SpriteArc(Drawable):
+    """Arc drawn as a cached sprite, angles are rounded to `TrailSprites.angle_step` degrees."""
+
+    __slots__ = ("x", "y", "box_size", "start_angle", "end_angle", "width", "color")
+
+    def __init__(self, bounding_box: Rectangle, start_angle: float, end_angle: float, width: int = 1,
+                 color=Colors.BLACK):
+        self.x, self.y = int(bounding_box.origin.x), int(bounding_box.origin.y)
+        self.box_size = int(bounding_box.width)
+        self.start_angle = SPRITES.round_angle(start_angle)
+        self.end_angle = SPRITES.round_angle(end_angle)
+        self.width = width
+        self.color = color
+
+    def draw(self, screen):
+        self.draw_colored(screen, self.color)
+
+    def draw_colored(self, screen, color):
+        sprite, offset = SPRITES.arc(self.box_size, self.width, self.start_angle, self.end_angle, color)
+        screen.blit(sprite, (self.x + offset[0], self.y + offset[1]))
+
+    def get_sprite(self, color=None):
+        sprite, offset = SPRITES.arc(self.box_size, self.width, self.start_angle, self.end_angle,
+                                     self.color if color is None else color)
+        return sprite, (self.x + offset[0], self.y + offset[1])
+
+    def get_dot(self):
+        return get_arc_dot(self.x, self.y, self.box_size, math.radians(self.start_angle),
+                           math.radians(self.end_angle), self.width)
+
+    def translate(self, dx, dy):
+        self.x += dx
+        self.y += dy
 
 
 class Circle(Drawable):
+    __slots__ = ("origin", "radius", "color")
+
     def __init__(self, origin: Point, radius: int, color=Colors.BLACK):
         self.origin = origin
         self.radius = radius
         self.color = color
 
     def draw(self, screen):
-        pygame.draw.circle(screen, self.color, self.origin, self.radius)
+        self.draw_colored(screen, self.color)
+
+    def draw_colored(self, screen, color):
+        pygame.draw.circle(screen, color, self.origin, self.radius)
+
+    def translate(self, dx, dy):
+        self.origin = self.origin.moved(dx, dy)
+
+
+class Label(Drawable):
+    __slots__ = ("center", "text", "tile_size", "color")
+
+    def __init__(self, center: Point, text: str, tile_size: int, color=Colors.BLACK):
+        self.center = center
+        self.text = text
+        self.tile_size = tile_size
+        self.color = color
+
+    def draw(self, screen):
+        surface = LABELS.get(self.text, self.color, self.tile_size)
+        screen.blit(surface, surface.get_rect(center=(self.center.x, self.center.y)))
 
 
 class DrawableGroup(Drawable):
+    __slots__ = ("list",)
+
     def __init__(self):
         self.list = []
 
@@ -129,8 +320,91 @@ class DrawableGroup(Drawable):
         for drawable in self.list:
             drawable.draw(screen)
 
+    def submit(self, renderer, color=None):
+        for drawable in self.list:
+            drawable.submit(renderer, color)
+
+    def translate(self, dx, dy):
+        for drawable in self.list:
+            drawable.translate(dx, dy)
+
     def add_drawable(self, drawable: Drawable):
         self.list.append(drawable)
 
     def clear(self):
         self.list.clear()
+
+
+class LinePool(Drawable):
+    """Group of lines that is rebuilt every frame, lines of the previous frames are reused.
+
+    Note:
+        `clear` only marks all lines as free, `add_line` moves a free line to the new ends (a new line is created only
+        when there is no free one), so a steady animation does not create any new drawables.
+    """
+
+    __slots__ = ("width", "color", "__lines", "__used")
+
+    def __init__(self, width: int = 1, color=Colors.BLACK):
+        self.width = width
+        self.color = color
+        self.__lines = []
+        self.__used = 0  # Number of lines drawn in the current frame
+
+    def draw(self, screen):
+        lines = self.__lines
+        for i in range(self.__used):
+            lines[i].draw(screen)
+
+    def submit(self, renderer, color=None):
+        lines = self.__lines
+        for i in range(self.__used):
+            lines[i].submit(renderer, color)
+
+    def translate(self, dx, dy):
+        lines = self.__lines
+        for i in range(self.__used):
+            lines[i].translate(dx, dy)
+
+    def add_line(self, start: Point, end: Point):
+        if self.__used < len(self.__lines):
+            self.__lines[self.__used].set_ends(start, end)
+        else:
+            self.__lines.append(Line(start, end, self.width, self.color))
+        self.__used += 1
+
+    def clear(self):
+        self.__used = 0
+
+    def __len__(self):
+        return self.__used
+
+    def __iter__(self):
+        return iter(self.__lines[:self.__used])
+# ------------------------------------------------------------------------------------------------------------
+
+
+def get_arc_dot(x, y, box_size, start_angle, end_angle, width):
+    """Function returns the middle of an arc if it looks like one dot of a trail.
+
+    Note:
+        Trails draw turns by short arc pieces (one for every frame), a piece that is not longer than the line width is
+        a dot in its middle.
+
+    Args:
+        x (float): Horizontal coordinate of the bounding box origin
+        y (float): Vertical coordinate of the bounding box origin
+        box_size (float): Size of the square bounding box of the whole circle in pixels
+        start_angle (float): Start angle in radians
+        end_angle (float): End angle in radians
+        width (int): Width of the arc in pixels
+
+    Returns:
+        tuple[float, float]: Middle of the dot (None if the arc is longer)
+    """
+    radius = (box_size - width) / 2  # Middle of the arc width, arcs are drawn inside of the bounding box
+    if radius * abs(end_angle - start_angle) > width:
+        return None
+
+    angle = (start_angle + end_angle) / 2
+    return x + box_size / 2 + radius * math.cos(angle), y + box_size / 2 - radius * math.sin(angle)
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+from ozobotmapf.utils.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")  # Loaded by the first rendered label
+
+
+class LabelCache:
+    """Class caches rendered text surfaces, so that the same labels are not rasterized on every repaint.
+
+    Surfaces are keyed by (text, color, tile size) and the least recently used ones are evicted when the cache is full.
+    The font size is derived from the tile size, so labels stay readable inside small tiles.
+
+    Attributes:
+        max_size (int): Maximal number of cached surfaces
+        hits (int): Number of labels served from the cache
+        misses (int): Number of labels that had to be rendered
+    """
+
+    FONT_NAME = 'freesansbold.ttf'
+    FONT_SIZE = 40
+    MIN_FONT_SIZE = 8
+    MAX_SIZE = 1024
+
+    def __init__(self, max_size=MAX_SIZE):
+        """Initialization of the LabelCache instance.
+
+        Args:
+            max_size (int): Maximal number of cached surfaces
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self.__surfaces = OrderedDict()
+        self.__fonts = {}
+
+    def get(self, text, color, tile_size):
+        """Method returns the rendered label.
+
+        Args:
+            text (str): Text of the label
+            color (tuple[int, int, int]): Color of the text
+            tile_size (int): Size of the tile the label belongs to in pixels
+
+        Returns:
+            pygame.Surface: Rendered label (must not be modified, it is shared)
+        """
+        key = (text, color, tile_size)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(tile_size).render(text, True, color)
+        self.__surfaces[key] = surface
+        if len(self.__surfaces) > self.max_size:
+            self.__surfaces.popitem(last=False)
+        return surface
+
+    def get_font(self, tile_size):
+        """Method returns the font used for labels in tiles of the given size.
+
+        Args:
+            tile_size (int): Size of the tile in pixels
+
+        Returns:
+            pygame.font.Font: Font of the labels
+        """
+        size = min(self.FONT_SIZE, max(self.MIN_FONT_SIZE, tile_size // 4))
+        font = self.__fonts.get(size)
+        if font is None:
+            font = self.__fonts[size] = pygame.font.Font(self.FONT_NAME, size)
+        return font
+
+    def clear(self):
+        """Method drops all cached surfaces and fonts (fonts are invalid after `pygame.quit`)."""
+        self.__surfaces.clear()
+        self.__fonts.clear()
+
+    def __len__(self):
+        return len(self.__surfaces)
+# ------------------------------------------------------------------------------------------------------------
+
+
+LABELS = LabelCache()  # Cache shared by the Map Editor and Simulator overlays
@@ -4,78 +4,123 @@ from ozobotmapf.utils.constants import Colors, Directions
 
 
 class OzomapDrawableParser:
+    COARSE_SPLITS = 2  # Splits of the start and finish checker pattern when the quality is degraded
+
     def __init__(self, ozomap, config):
         self.ozomap = ozomap
         self.config = config
 
     def parse(self):
-        drawables = [self.__positions_to_drawable(), self.__borders_to_drawable(), self.__walls_to_drawable()]
-        return drawables
+        return self.parse_region(0, 0, self.ozomap.grid.width, self.ozomap.grid.height)
+
+    def parse_region(self, x0, y0, x1, y1):
+        """Method creates drawables of a rectangular region of the grid (the whole grid is used by `parse`).
+
+        Args:
+            x0 (int): First column of the region
+            y0 (int): First row of the region
+            x1 (int): Column after the last column of the region
+            y1 (int): Row after the last row of the region
 
-    def __positions_to_drawable(self):
+        Returns:
+            list[DrawableGroup]: Agent starts and finishes, tile borders and walls of the region
+        """
+        tiles = [self.ozomap.grid.get_tile(x, y)
+                 for y in range(y0, min(y1, self.ozomap.height)) for x in range(x0, min(x1, self.ozomap.width))]
+        return [self.__positions_to_drawable(tiles), self.__borders_to_drawable(x0, y0, x1, y1),
+                self.__walls_to_drawable(x0, y0, x1, y1)]
+
+    def __positions_to_drawable(self, tiles):
         group = DrawableGroup()
-        for tile in self.ozomap.map_tile_generator():
-            rectangle = Rectangle(Point(tile.origin.x, tile.origin.y), self.config.tile_size, self.config.tile_size)
+        for tile in tiles:
+            origin = self.ozomap.geometry.get_origin(tile.x_pos, tile.y_pos)
+            rectangle = Rectangle(origin, self.config.tile_size, self.config.tile_size)
             if tile.agent_start > 0 and tile.agent_finish > 0:
-                group.add_drawable(FillChecker(rectangle, Colors.START, Colors.FINISH))
+                splits = FillChecker.SPLITS if self.config.checker_patterns else self.COARSE_SPLITS
+                group.add_drawable(FillChecker(rectangle, Colors.START, Colors.FINISH, splits))
             elif tile.agent_start > 0:
                 group.add_drawable(FillRect(rectangle, Colors.START))
             elif tile.agent_finish > 0:
                 group.add_drawable(FillRect(rectangle, Colors.FINISH))
         return group
 
-    def __borders_to_drawable(self):
+    def __borders_to_drawable(self, x0, y0, x1, y1):
         group = DrawableGroup()
         origin = self.ozomap.get_origin()
+        tile_size = self.config.tile_size
 
         # Horizontal lines
-        line_length = self.ozomap.grid.width * self.config.tile_size
-        for i in range(self.ozomap.grid.height + 1):
-            offset = i * self.config.tile_size
-            start = Point(origin.x, origin.y + offset)
-            end = Point(origin.x + line_length, origin.y + offset)
+        for i in range(y0, y1 + 1):
+            offset = i * tile_size
+            start = Point(origin.x + x0 * tile_size, origin.y + offset)
+            end = Point(origin.x + x1 * tile_size, origin.y + offset)
             group.add_drawable(Line(start, end, self.config.tile_border_width, Colors.GREY))
 
         # Vertical lines
-        line_length = self.ozomap.grid.height * self.config.tile_size
-        for i in range(self.ozomap.grid.width + 1):
-            offset = i * self.config.tile_size
-            start = Point(origin.x + offset, origin.y)
-            end = Point(origin.x + offset, origin.y + line_length)
+        for i in range(x0, x1 + 1):
+            offset = i * tile_size
+            start = Point(origin.x + offset, origin.y + y0 * tile_size)
+            end = Point(origin.x + offset, origin.y + y1 * tile_size)
             group.add_drawable(Line(start, end, self.config.tile_border_width, Colors.GREY))
         return group
 
-    def __walls_to_drawable(self):
-        wall_set = set()
-        for tile in self.ozomap.map_tile_generator():
-            if tile.has_wall(Directions.UP):
-                wall_set.add(self.__upper_wall_to_drawable(tile.origin))
-            if tile.has_wall(Directions.RIGHT):
-                wall_set.add(self.__right_wall_to_drawable(tile.origin))
-            if tile.has_wall(Directions.DOWN):
-                wall_set.add(self.__bottom_wall_to_drawable(tile.origin))
-            if tile.has_wall(Directions.LEFT):
-                wall_set.add(self.__left_wall_to_drawable(tile.origin))
+    def __walls_to_drawable(self, x0, y0, x1, y1):
+        """Method creates walls of the region merged into maximal horizontal and vertical runs.
+
+        Note:
+            Tile borders are swept row by row and column by column. A border is a wall if any of the two tiles
+            (from the region) sharing it has a wall there, so every wall is drawn only once.
+
+        Returns:
+            DrawableGroup: Wall lines of the region
+        """
+        grid = self.ozomap.grid
+        x1, y1 = min(x1, self.ozomap.width), min(y1, self.ozomap.height)
+        origin = self.ozomap.get_origin()
+        tile_size = self.config.tile_size
         group = DrawableGroup()
-        for wall in wall_set:
-            group.add_drawable(wall)
+
+        # Horizontal walls (borders above the rows and below the last row)
+        for row in range(y0, y1 + 1):
+            walls = [(row > y0 and grid.get_tile(x, row - 1).has_wall(Directions.DOWN)) or
+                     (row < y1 and grid.get_tile(x, row).has_wall(Directions.UP)) for x in range(x0, x1)]
+            y = origin.y + row * tile_size
+            for start, end in get_runs(walls):
+                group.add_drawable(self.__wall_line_to_drawable(Point(origin.x + (x0 + start) * tile_size, y),
+                                                                Point(origin.x + (x0 + end) * tile_size, y)))
+
+        # Vertical walls (borders left of the columns and right of the last column)
+        for column in range(x0, x1 + 1):
+            walls = [(column > x0 and grid.get_tile(column - 1, y).has_wall(Directions.RIGHT)) or
+                     (column < x1 and grid.get_tile(column, y).has_wall(Directions.LEFT)) for y in range(y0, y1)]
+            x = origin.x + column * tile_size
+            for start, end in get_runs(walls):
+                group.add_drawable(self.__wall_line_to_drawable(Point(x, origin.y + (y0 + start) * tile_size),
+                                                                Point(x, origin.y + (y0 + end) * tile_size)))
         return group
 
-    def __upper_wall_to_drawable(self, tile_origin):
-        return self.__wall_line_to_drawable(tile_origin,
-                              tile_origin.moved(self.config.tile_size, 0))
+    def __wall_line_to_drawable(self, start, end):
+        return Line(start, end, self.config.wall_width)
+# ------------------------------------------------------------------------------------------------------------
 
-    def __right_wall_to_drawable(self, tile_origin):
-        return self.__wall_line_to_drawable(tile_origin.moved(self.config.tile_size, 0),
-                              tile_origin.moved(self.config.tile_size, self.config.tile_size))
 
-    def __bottom_wall_to_drawable(self, tile_origin):
-        return self.__wall_line_to_drawable(tile_origin.moved(self.config.tile_size, self.config.tile_size),
-                              tile_origin.moved(0, self.config.tile_size))
+def get_runs(flags):
+    """Function finds maximal runs of consecutive true flags.
 
-    def __left_wall_to_drawable(self, tile_origin):
-        return self.__wall_line_to_drawable(tile_origin.moved(0, self.config.tile_size),
-                              tile_origin)
+    Args:
+        flags (list[bool]): Flags in order
 
-    def __wall_line_to_drawable(self, start, end):
-        return Line(start, end, self.config.wall_width)
\ No newline at end of file
+    Returns:
+        list[tuple[int, int]]: Index of the first flag and index after the last flag of every run
+    """
+    runs = []
+    start = None
+    for index, flag in enumerate(flags):
+        if flag and start is None:
+            start = index
+        elif not flag and start is not None:
+            runs.append((start, index))
+            start = None
+    if start is not None:
+        runs.append((start, len(flags)))
+    return runs
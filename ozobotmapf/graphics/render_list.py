@@ -0,0 +1,124 @@
+from ozobotmapf.graphics.trail_sprites import SPRITES
+
+
+class RenderList:
+    """Render list of one frame gathering the drawables of all agent paths (the `pygame` render backend).
+
+    Drawables are not drawn one by one, consecutive drawables of the same primitive (class) and color are gathered
+    into a run and every run is dispatched at once. Cached trail sprites (dots and arc pieces, the most of every trail)
+    are blitted by a single `Surface.blits` call per run, other runs are drawn one drawable after another.
+
+    Note:
+        Runs are drawn in the order the drawables were added, so without dot thinning the frame is the same as if
+        every agent path was drawn on its own (older trail bands stay under the newer ones, indicators and Color Codes
+        over the trails). Only drawables that follow each other are batched, mostly the sprites of one trail band.
+
+    Attributes:
+        dot_spacing (float): Minimal distance of the drawn trail dots in line widths (0 draws all dots)
+        drawables (int): Number of the drawables drawn in the last frame
+        draw_calls (int): Number of the draw calls (`blits` or a single drawable) in the last frame
+    """
+
+    SPRITES = None  # Run key of the blitted sprites
+
+    def __init__(self):
+        """Initialization of the RenderList instance."""
+        self.dot_spacing = 0
+        self.drawables = 0
+        self.draw_calls = 0
+
+        self.__runs = []  # (key, drawables) in the order of drawing, key is (class, color) or SPRITES
+
+    def add_path(self, path):
+        """Method adds all drawables of an agent path.
+
+        Args:
+            path (Drawable): Active path of an agent
+        """
+        path.submit(self)
+
+    def add_dots(self, dots, color):
+        """Method adds dots of a trail (drawables with the `IS_DOT` flag) at once.
+
+        Args:
+            dots (list[Drawable]): Dots of the same width
+            color (tuple[int, int, int]): Color of the dots
+        """
+        if not dots:
+            return
+        if self.dot_spacing:
+            dots = thin_dots(dots, self.dot_spacing * dots[0].width)
+        sprite, (dx, dy) = SPRITES.dot(dots[0].width, color)
+        self.__get_run(self.SPRITES).extend([(sprite, (dot.x + dx, dot.y + dy)) for dot in dots])
+
+    def add_drawable(self, drawable, color=None):
+        """Method adds a drawable, it joins the last run if that has the same primitive and color.
+
+        Args:
+            drawable (Drawable): Drawn object
+            color (tuple[int, int, int]): Color of the drawing (None for the drawable's own color)
+        """
+        sprite = drawable.get_sprite(color)
+        if sprite is None:
+            self.__get_run((drawable.__class__, color)).append(drawable)
+        else:
+            self.__get_run(self.SPRITES).append(sprite)
+
+    def draw(self, screen):
+        """Method draws all runs of the frame and clears the render list.
+
+        Args:
+            screen (pygame.Surface): Target surface
+        """
+        drawables = draw_calls = 0
+        for key, run in self.__runs:
+            drawables += len(run)
+            if key is self.SPRITES:
+                screen.blits(run, False)
+                draw_calls += 1
+                continue
+
+            color = key[1]
+            draw_calls += len(run)
+            if color is None:
+                for drawable in run:
+                    drawable.draw(screen)
+            else:
+                for drawable in run:
+                    drawable.draw_colored(screen, color)
+
+        self.drawables, self.draw_calls = drawables, draw_calls
+        self.__runs.clear()
+
+    def __get_run(self, key):
+        if self.__runs and self.__runs[-1][0] == key:
+            return self.__runs[-1][1]
+        run = []
+        self.__runs.append((key, run))
+        return run
+# ------------------------------------------------------------------------------------------------------------
+
+
+def thin_dots(dots, spacing):
+    """Function selects the dots of a trail that are at least the spacing apart.
+
+    Note:
+        Both ends of every continuous run of dots are always kept, so the thinned trail is not shorter.
+
+    Args:
+        dots (list[Drawable]): Dots of a trail in the order of their creation
+        spacing (float): Minimal distance of the selected dots in pixels (in both axes)
+
+    Returns:
+        list[Drawable]: Selected dots
+    """
+    kept = [dots[0]]
+    last = dots[0]
+    for dot, following in zip(dots[1:], dots[2:]):
+        if (max(abs(dot.x - last.x), abs(dot.y - last.y)) >= spacing
+                or max(abs(following.x - dot.x), abs(following.y - dot.y)) > spacing):
+            kept.append(dot)
+            last = dot
+    if len(dots) > 1:
+        kept.append(dots[-1])
+    return kept
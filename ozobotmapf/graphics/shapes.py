@@ -8,11 +8,17 @@ class Point:
 
     Point(0, 0) is located in the top-left corner of the application window.
 
+    Note:
+        Points are created for every trail segment of every frame, so the class uses `__slots__` and offers in-place
+        variants of the moving methods (`move`, `move_direction`, `move_offset_to`) for points that are not shared.
+
     Attributes:
         x (int): X coordinate (vertical axis)
         y (int): Y coordinate (horizontal axis)
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         """Initialization of Point instance.
 
@@ -22,6 +28,10 @@ class Point:
         """
         self.x, self.y = x, y
 
+    def copy(self):
+        """Method returns a new point with the same coordinates."""
+        return Point(self.x, self.y)
+
     def moved(self, x, y):
         """Method creates a copy of the point moved by x and y.
 
@@ -65,9 +75,55 @@ class Point:
         Returns:
             Point: New point instance moved to or from other point by given offset.
         """
-        x_off = (other.x - self.x) * offset
-        y_off = (other.y - self.y) * offset
-        return self.moved(x_off, y_off)
+        return Point(self.x + (other.x - self.x) * offset, self.y + (other.y - self.y) * offset)
+
+    def move(self, x, y):
+        """Method moves the point by x and y in place.
+
+        Args:
+            x (int): Length by which the point should be moved along the X axis
+            y (int): Length by which the point should be moved along the Y axis
+
+        Returns:
+            Point: The point itself (for chaining)
+        """
+        self.x += x
+        self.y += y
+        return self
+
+    def move_direction(self, direction, by):
+        """Method moves the point by a given distance in a given direction in place.
+
+        Args:
+            direction (Directions): Direction of the point move
+            by (int): Length by which the point should be moved
+
+        Returns:
+            Point: The point itself (for chaining)
+        """
+        if direction == Directions.UP:
+            self.y -= by
+        elif direction == Directions.DOWN:
+            self.y += by
+        elif direction == Directions.RIGHT:
+            self.x += by
+        elif direction == Directions.LEFT:
+            self.x -= by
+        return self
+
+    def move_offset_to(self, other, offset):
+        """Method moves the point along the direction towards or from some other given point in place.
+
+        Args:
+            other (Point): Other point
+            offset (float): Percentage of the move distance to other point (can be greater than 1 or negative)
+
+        Returns:
+            Point: The point itself (for chaining)
+        """
+        self.x += (other.x - self.x) * offset
+        self.y += (other.y - self.y) * offset
+        return self
 
     def dist_to(self, other):
         """Method computes distance between two points.
@@ -108,6 +164,8 @@ class Rectangle:
         height (int): height of the rectangle
     """
 
+    __slots__ = ("origin", "width", "height")
+
     def __init__(self, origin: Point, width: int, height: int):
         """Initialization of Rectangle instance.
 
@@ -116,7 +174,7 @@ class Rectangle:
             width (int): width of the rectangle
             height (int): height of the rectangle
         """
-        self.origin = Point(*origin.to_list())
+        self.origin = Point(origin.x, origin.y)
         self.width = width
         self.height = height
 
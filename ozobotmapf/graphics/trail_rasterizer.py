@@ -0,0 +1,179 @@
+import math
+
+from ozobotmapf.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")  # Optional dependency, required only by the `numpy` render backend
+pygame = lazy_import("pygame")
+
+
+class TrailRasterizer:
+    """Render backend stamping the trail points of all agents into the screen buffer with NumPy.
+
+    Drawables of all agent paths are collected every frame instead of being drawn one by one. Trails are mostly made
+    of dots (a dot or a short arc piece for every frame), these are grouped by their color and width, and every group
+    is drawn at once: a precomputed disc of the line width is stamped at every dot by a few vectorized operations on
+    the `pygame.surfarray` view of the screen. Dense dots of a trail are thinned to the spacing of a quarter of the line
+    width, so the number of stamps does not grow with the frame rate.
+
+    Note:
+        Groups are stamped in the order their colors first appeared in the frame, so the order of the drawables is
+        kept only between the colors (trail bands go from the oldest to the newest). Lines and arcs longer than
+        their width and other drawables (Color Codes) are cheaper to draw by pygame, they are drawn after all groups.
+
+    Attributes:
+        dot_spacing (float): Minimal distance of the stamped trail dots in line widths (at least `MIN_DOT_SPACING`)
+        points (int): Number of the dots stamped in the last frame
+        drawables (int): Number of the drawables collected in the last frame
+        draw_calls (int): Number of the stamped groups and pygame draw calls in the last frame
+    """
+
+    MIN_DOT_SPACING = 0.25  # Spacing of the stamped dots in line widths
+
+    def __init__(self):
+        """Initialization of the TrailRasterizer instance."""
+        self.dot_spacing = 0
+        self.points = 0
+        self.drawables = 0
+        self.draw_calls = 0
+
+        self.__groups = {}  # (color, width) -> (x coordinates, y coordinates) of the dots
+        self.__drawables = []  # Drawables drawn by pygame (drawable, color)
+        self.__stamps = {}  # width -> (x offsets, y offsets) of the disc
+        self.__count = 0  # Number of the drawables collected in the current frame
+
+    def add_dots(self, dots, color):
+        """Method adds dots of a trail (drawables with the `IS_DOT` flag) at once.
+
+        Args:
+            dots (list[Drawable]): Dots of the same width
+            color (tuple[int, int, int]): Color of the dots
+        """
+        if not dots:
+            return
+        self.__count += len(dots)
+        width = dots[0].width
+        group = self.__groups.get((color, width))
+        if group is None:
+            group = self.__groups[(color, width)] = ([], [])
+        group[0].extend([dot.x for dot in dots])
+        group[1].extend([dot.y for dot in dots])
+
+    def add_drawable(self, drawable, color=None):
+        """Method adds a drawable, it is stamped if it looks like a dot, otherwise it is drawn by pygame.
+
+        Args:
+            drawable (Drawable): Drawn object
+            color (tuple[int, int, int]): Color of the drawing (None for the drawable's own color)
+        """
+        self.__count += 1
+        dot = drawable.get_dot()
+        if dot is None:
+            self.__drawables.append((drawable, color))
+            return
+
+        key = (drawable.color if color is None else color, drawable.width)
+        group = self.__groups.get(key)
+        if group is None:
+            group = self.__groups[key] = ([], [])
+        group[0].append(dot[0])
+        group[1].append(dot[1])
+
+    def add_path(self, path):
+        """Method adds all drawables of an agent path.
+
+        Args:
+            path (Drawable): Active path of an agent
+        """
+        path.submit(self)
+
+    def draw(self, screen):
+        """Method draws everything collected in the frame and clears the collected drawables.
+
+        Args:
+            screen (pygame.Surface): Target surface
+        """
+        self.points = 0
+        self.drawables, self.draw_calls = self.__count, len(self.__groups) + len(self.__drawables)
+        if self.__groups:
+            pixels = pygame.surfarray.pixels2d(screen)  # Locks the screen until the views are released
+            row = pixels.strides[1] // pixels.itemsize  # Pixels of one row including the padding
+            flat = np.lib.stride_tricks.as_strided(pixels, shape=(row * (pixels.shape[1] - 1) + pixels.shape[0],),
+                                                   strides=(pixels.itemsize,))
+            try:
+                for (color, width), group in self.__groups.items():
+                    self.__stamp(pixels, flat, row, screen.get_clip(), screen.map_rgb(color), width, group)
+            finally:
+                del pixels, flat
+        for drawable, color in self.__drawables:
+            if color is None:
+                drawable.draw(screen)
+            else:
+                drawable.draw_colored(screen, color)
+
+        self.__groups.clear()
+        self.__drawables.clear()
+        self.__count = 0
+
+    def __stamp(self, pixels, flat, row, clip, mapped_color, width, group):
+        """Method stamps the disc at all dots of one group.
+
+        Args:
+            pixels (numpy.ndarray): Pixel view of the screen indexed by `[x, y]`
+            flat (numpy.ndarray): Flat pixel view of the screen indexed by `y * row + x`
+            row (int): Length of one row of the flat view
+            clip (pygame.Rect): Drawn area of the screen
+            mapped_color (int): Color mapped to the screen pixel format
+            width (int): Width of the line in pixels
+            group (tuple[list, list]): Coordinates of the collected dots
+        """
+        xs = np.rint(np.asarray(group[0], dtype=float)).astype(np.int64)
+        ys = np.rint(np.asarray(group[1], dtype=float)).astype(np.int64)
+
+        # Dots that cannot reach the drawn area are dropped
+        offset_x, offset_y = self.__get_stamp(width)
+        reach = int(offset_x.max())
+        visible = ((xs >= clip.left - reach) & (xs < clip.right + reach)
+                   & (ys >= clip.top - reach) & (ys < clip.bottom + reach))
+        xs, ys = xs[visible], ys[visible]
+        if len(xs) == 0:
+            return
+
+        # Trails are dense (a dot every frame), only one dot per a quarter of the line width is stamped, the edges of
+        # the overlapping discs stay within 3 % of the radius. Both ends of every continuous run are always stamped.
+        gap = max(1.0, width * max(self.MIN_DOT_SPACING, self.dot_spacing))
+        steps = np.hypot(np.diff(xs), np.diff(ys))
+        buckets = np.floor(np.concatenate(([0.0], np.cumsum(steps))) / gap)
+        keep = np.ones(len(xs), dtype=bool)
+        keep[1:-1] = (buckets[1:-1] != buckets[:-2]) | (steps[1:] > gap)
+        xs, ys = xs[keep], ys[keep]
+        self.points += len(xs)
+
+        # Discs inside of the drawn area are stamped through the flat view (one index per pixel), discs crossing its
+        # border are clipped pixel by pixel
+        inner = ((xs >= clip.left + reach) & (xs < clip.right - reach)
+                 & (ys >= clip.top + reach) & (ys < clip.bottom - reach))
+        flat[((ys[inner] * row + xs[inner])[:, None] + (offset_y * row + offset_x)).ravel()] = mapped_color
+
+        xs = (xs[~inner][:, None] + offset_x).ravel()
+        ys = (ys[~inner][:, None] + offset_y).ravel()
+        inside = (xs >= clip.left) & (xs < clip.right) & (ys >= clip.top) & (ys < clip.bottom)
+        pixels[xs[inside], ys[inside]] = mapped_color
+
+    def __get_stamp(self, width):
+        """Method returns the pixel offsets of a disc with the diameter of the line width.
+
+        Args:
+            width (int): Width of the line in pixels
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Horizontal and vertical offsets of the disc pixels from its middle
+        """
+        stamp = self.__stamps.get(width)
+        if stamp is None:
+            radius = max(width, 1) / 2
+            reach = math.floor(radius)
+            offsets = np.arange(-reach, reach + 1)
+            offset_x, offset_y = np.meshgrid(offsets, offsets, indexing="ij")
+            inside = offset_x ** 2 + offset_y ** 2 <= radius ** 2
+            stamp = self.__stamps[width] = (offset_x[inside], offset_y[inside])
+        return stamp
@@ -0,0 +1,138 @@
+import math
+from collections import OrderedDict
+
+from ozobotmapf.utils.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")  # Loaded by the first rasterized sprite
+
+
+class TrailSprites:
+    """Class pre-rasterizes the shapes Ozobot trails are made of and caches them as small surfaces.
+
+    Trails are built from thousands of tiny shapes: dots of the straight path (zero length lines elongated to the
+    line width) and short arc pieces of the turns. Their set is fixed for the configured tile size and line width,
+    so every shape is rasterized only once (with the same pygame primitive the plain drawables use) and the trail is
+    then drawn by blitting the cached surfaces.
+
+    Arc angles are rounded to `ANGLE_STEP` degrees, which keeps the number of distinct arc pieces small (the error is
+    below one pixel for usual tile sizes). The adaptive quality can switch to `COARSE_ANGLE_STEP`. Surfaces are cropped
+    to the drawn pixels and use the inverse of the shape color as a color key.
+
+    Attributes:
+        max_size (int): Maximal number of cached surfaces
+        angle_step (float): Step of the rounded arc angles in degrees (used by the arcs created from now on)
+        hits (int): Number of shapes served from the cache
+        misses (int): Number of shapes that had to be rasterized
+    """
+
+    ANGLE_STEP = 0.5
+    COARSE_ANGLE_STEP = 2  # Step of the arc angles when the quality is degraded
+    MAX_SIZE = 4096
+
+    def __init__(self, max_size=MAX_SIZE):
+        """Initialization of the TrailSprites instance.
+
+        Args:
+            max_size (int): Maximal number of cached surfaces
+        """
+        self.max_size = max_size
+        self.angle_step = self.ANGLE_STEP
+        self.hits = 0
+        self.misses = 0
+
+        self.__sprites = OrderedDict()
+
+    def dot(self, width, color):
+        """Method returns the sprite of a zero length line (one dot of the trail).
+
+        Args:
+            width (int): Width of the line in pixels
+            color (tuple[int, int, int]): Color of the line
+
+        Returns:
+            pygame.Surface: Rasterized dot (must not be modified, it is shared)
+            tuple[int, int]: Offset of the sprite's top-left corner from the dot position
+        """
+        key = ("dot", width, color)
+        sprite = self.__get(key)
+        if sprite is None:
+            elongation = math.floor(width / 2 - 1)
+            anchor = abs(elongation) + width + 1
+            surface = self.__new_surface(2 * anchor + 1, 2 * anchor + 1, color)
+            pygame.draw.line(surface, color, (anchor, anchor - elongation), (anchor, anchor + elongation), width)
+            sprite = self.__put(key, surface, (anchor, anchor))
+        return sprite
+
+    def arc(self, box_size, width, start_angle, end_angle, color):
+        """Method returns the sprite of an arc piece.
+
+        Args:
+            box_size (int): Size of the square bounding box of the whole circle in pixels
+            width (int): Width of the arc in pixels
+            start_angle (float): Start angle in degrees (already rounded by `round_angle`)
+            end_angle (float): End angle in degrees (already rounded by `round_angle`)
+            color (tuple[int, int, int]): Color of the arc
+
+        Returns:
+            pygame.Surface: Rasterized arc piece (must not be modified, it is shared)
+            tuple[int, int]: Offset of the sprite's top-left corner from the bounding box origin
+        """
+        key = ("arc", box_size, width, start_angle, end_angle, color)
+        sprite = self.__get(key)
+        if sprite is None:
+            surface = self.__new_surface(box_size, box_size, color)
+            pygame.draw.arc(surface, color, (0, 0, box_size, box_size), math.radians(start_angle),
+                            math.radians(end_angle), width)
+            sprite = self.__put(key, surface, (0, 0))
+        return sprite
+
+    def round_angle(self, angle):
+        """Method rounds the angle to the closest multiple of `angle_step`."""
+        return round(angle / self.angle_step) * self.angle_step
+
+    def clear(self):
+        """Method drops all cached sprites."""
+        self.__sprites.clear()
+
+    def __len__(self):
+        return len(self.__sprites)
+
+    def __get(self, key):
+        sprite = self.__sprites.get(key)
+        if sprite is not None:
+            self.__sprites.move_to_end(key)
+            self.hits += 1
+        return sprite
+
+    def __put(self, key, surface, anchor):
+        """Method crops the rasterized surface to the drawn pixels and stores it.
+
+        Args:
+            key (tuple): Cache key
+            surface (pygame.Surface): Rasterized shape
+            anchor (tuple[int, int]): Point of the surface the shape was positioned by
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: Cropped sprite and its offset from the anchor
+        """
+        self.misses += 1
+        bounds = surface.get_bounding_rect()
+        sprite = surface.subsurface(bounds).copy(), (bounds.x - anchor[0], bounds.y - anchor[1])
+        sprite[0].set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+
+        self.__sprites[key] = sprite
+        if len(self.__sprites) > self.max_size:
+            self.__sprites.popitem(last=False)
+        return sprite
+
+    @staticmethod
+    def __new_surface(width, height, color):
+        key_color = tuple(255 - channel for channel in color)
+        surface = pygame.Surface((width, height))
+        surface.fill(key_color)
+        surface.set_colorkey(key_color)
+        return surface
+# ------------------------------------------------------------------------------------------------------------
+
+
+SPRITES = TrailSprites()  # Cache shared by all agents of the Simulator
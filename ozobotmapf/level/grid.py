@@ -1,4 +1,6 @@
+from ozobotmapf.graphics.shapes import Point
 from ozobotmapf.level.tile import Tile
+from ozobotmapf.level.tile_geometry import TileGeometry
 
 
 class Grid:
@@ -12,7 +14,23 @@ class Grid:
         for col in range(len(self.__tiles[0])):
             for row in range(len(self.__tiles)):
                 tile_origin = self.__origin.moved(col * self.__tile_size, row * self.__tile_size)
-                self.__tiles[row][col] = Tile(tile_origin, col, row, config.tile_size)
+                self.__tiles[row][col] = Tile(tile_origin, col, row)
+        self.geometry = TileGeometry(self.width, self.height, self.__origin, self.__tile_size)
+
+    def relayout(self, origin, tile_size):
+        """Method moves all tiles, so that the grid starts at the origin and tiles have the given size.
+
+        Args:
+            origin (Point): Top-left point of the grid on the screen
+            tile_size (int): Size of the tiles in pixels
+        """
+        self.__origin = Point(origin.x, origin.y)
+        self.__tile_size = tile_size
+        for row in range(self.height):
+            for col in range(self.width):
+                tile_origin = self.__origin.moved(col * tile_size, row * tile_size)
+                self.__tiles[row][col].set_layout(tile_origin)
+        self.geometry.relayout(self.__origin, tile_size)
 
     def get_tile(self, x, y):
         return self.__tiles[y][x]
@@ -17,6 +17,7 @@ class OzoMap:
         height (int): True height of the level
         agent_cnt (int): Number of agents on the level
         grid (Grid): 2D grid of tiles
+        geometry (TileGeometry): Precomputed screen geometry of the tiles (updated when the grid is laid out again)
     """
 
     def __init__(self, config):
@@ -29,6 +30,7 @@ class OzoMap:
         """
         self.width, self.height, self.agent_cnt = 0, 0, 0
         self.grid = Grid(config)
+        self.geometry = self.grid.geometry
 
     def init_empty_map(self, config):
         """Initialize an empty level only with border walls.
@@ -173,6 +175,28 @@ class OzoMap:
                     self.grid.get_tile(x_from, y_from).destroy_wall(Directions.LEFT)
                     self.grid.get_tile(x_to, y_to).destroy_wall(Directions.RIGHT)
 
+    def get_neighbour_ids(self, tile_id):
+        """Method returns IDs of the tiles that can be reached from the tile in one move (there is no wall between).
+
+        Args:
+            tile_id (int): Number of the tile
+
+        Returns:
+            list[int]: IDs of the neighbouring tiles
+        """
+        x, y = self.__get_position_from_id(tile_id)
+        tile = self.grid.get_tile(x, y)
+        neighbours = []
+        if y > 0 and not tile.has_wall(Directions.UP):
+            neighbours.append(tile_id - self.width)
+        if x < self.width - 1 and not tile.has_wall(Directions.RIGHT):
+            neighbours.append(tile_id + 1)
+        if y < self.height - 1 and not tile.has_wall(Directions.DOWN):
+            neighbours.append(tile_id + self.width)
+        if x > 0 and not tile.has_wall(Directions.LEFT):
+            neighbours.append(tile_id - 1)
+        return neighbours
+
     def get_tile_by_id(self, tile_id):
         """Method returns a tile instance with given tile_id
 
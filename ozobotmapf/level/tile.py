@@ -13,7 +13,7 @@ class Tile:
         __walls (list[bool]): Flags if there are walls around the tile (Format: [upper, right, bottom, left])
     """
 
-    def __init__(self, origin=Point(0, 0), x_pos=0, y_pos=0, size=0):
+    def __init__(self, origin=Point(0, 0), x_pos=0, y_pos=0):
         """Initialization of the Tile instance.
 
         Args:
@@ -23,7 +23,6 @@ class Tile:
         self.agent_start = 0
         self.agent_finish = 0
         self.__walls = [False] * 4  # [upper, right, bottom, left]
-        self.__size = size
 
     def is_start(self):
         """Returns true if there is an agent's start on the tile."""
@@ -88,20 +87,10 @@ class Tile:
         elif y == y_other:
             return Directions.RIGHT if x - x_other < 0 else Directions.LEFT
 
-    def get_middle(self):
-        half_size = round(self.__size / 2)
-        return self.origin.moved(half_size, half_size)
-
-    def get_edge_middle(self, direction):
-        half_size = round(self.__size / 2)
-        if direction == Directions.NONE:
-            return self.get_middle()
-        elif direction == Directions.UP:
-            return self.origin.moved(half_size, 0)
-        elif direction == Directions.RIGHT:
-            return self.origin.moved(self.__size, half_size)
-        elif direction == Directions.DOWN:
-            return self.origin.moved(half_size, self.__size)
-        elif direction == Directions.LEFT:
-            return self.origin.moved(0, half_size)
+    def set_layout(self, origin):
+        """Method moves the tile to a new position on the screen.
 
+        Args:
+            origin (Point): Top-left point of the tile
+        """
+        self.origin = origin
@@ -0,0 +1,101 @@
+from ozobotmapf.graphics.shapes import Point
+from ozobotmapf.utils.constants import Directions
+
+
+class TileGeometry:
+    """Precomputed screen geometry of the grid tiles.
+
+    Tiles form a regular grid, so coordinates are kept in dense arrays by columns and rows (a tile `[x, y]` has its
+    middle at `[middle_x[x], middle_y[y]]`). Tile middles, edge middles and arc bounding boxes are read from the arrays
+    instead of being computed by the tiles. Arrays are computed again when the grid is laid out again.
+
+    Note:
+        All getters return new points, so the caller can move them in place.
+
+    Attributes:
+        width (int): Number of the grid columns
+        height (int): Number of the grid rows
+        tile_size (int): Size of the tiles in pixels
+        x (list[int]): Horizontal coordinates of the tile borders (`x[col]` is the left border of the column)
+        y (list[int]): Vertical coordinates of the tile borders (`y[row]` is the upper border of the row)
+        middle_x (list[int]): Horizontal coordinates of the tile middles
+        middle_y (list[int]): Vertical coordinates of the tile middles
+    """
+
+    # Position of the arc bounding box for turns (from, to) relative to the tile middle in tile sizes
+    ARC_BOXES = {
+        (Directions.UP, Directions.RIGHT): (0, -1), (Directions.UP, Directions.LEFT): (-1, -1),
+        (Directions.DOWN, Directions.RIGHT): (0, 0), (Directions.DOWN, Directions.LEFT): (-1, 0),
+        (Directions.RIGHT, Directions.UP): (0, -1), (Directions.RIGHT, Directions.DOWN): (0, 0),
+        (Directions.LEFT, Directions.UP): (-1, -1), (Directions.LEFT, Directions.DOWN): (-1, 0),
+    }
+
+    def __init__(self, width, height, origin, tile_size):
+        """Initialization of the TileGeometry instance.
+
+        Args:
+            width (int): Number of the grid columns
+            height (int): Number of the grid rows
+            origin (Point): Top-left point of the grid on the screen
+            tile_size (int): Size of the tiles in pixels
+        """
+        self.width, self.height = width, height
+        self.relayout(origin, tile_size)
+
+    def relayout(self, origin, tile_size):
+        """Method computes the arrays for a new position of the grid and size of the tiles.
+
+        Args:
+            origin (Point): Top-left point of the grid on the screen
+            tile_size (int): Size of the tiles in pixels
+        """
+        self.tile_size = tile_size
+        half_size = round(tile_size / 2)
+        self.x = [origin.x + col * tile_size for col in range(self.width + 1)]
+        self.y = [origin.y + row * tile_size for row in range(self.height + 1)]
+        self.middle_x = [x + half_size for x in self.x[:-1]]
+        self.middle_y = [y + half_size for y in self.y[:-1]]
+
+        # Edge middles by direction (index `direction + 1`, so that Directions.NONE gives the middle)
+        self.__edge_x = (self.middle_x, self.middle_x, self.x[1:], self.middle_x, self.x[:-1])
+        self.__edge_y = (self.middle_y, self.y[:-1], self.middle_y, self.y[1:], self.middle_y)
+
+    def get_origin(self, x, y):
+        """Returns the top-left point of the tile."""
+        return Point(self.x[x], self.y[y])
+
+    def get_middle(self, x, y):
+        """Returns the middle point of the tile."""
+        return Point(self.middle_x[x], self.middle_y[y])
+
+    def get_edge_middle(self, x, y, direction):
+        """Method returns the middle of the tile edge.
+
+        Args:
+            x (int): Column of the tile
+            y (int): Row of the tile
+            direction (Directions): Direction of the edge from the middle (Directions.NONE for the middle)
+
+        Returns:
+            Point: Middle of the edge
+        """
+        return Point(self.__edge_x[direction + 1][x], self.__edge_y[direction + 1][y])
+
+    def get_arc_origin(self, x, y, from_dir, to_dir, line_width):
+        """Method returns the top-left point of the bounding box of a turn arc on the tile.
+
+        Args:
+            x (int): Column of the tile
+            y (int): Row of the tile
+            from_dir (Directions): Direction the agent enters the tile from
+            to_dir (Directions): Direction the agent leaves the tile to
+            line_width (int): Width of the arc line in pixels
+
+        Returns:
+            Point: Origin of the bounding box (None if the tile is not a turn)
+        """
+        box = self.ARC_BOXES.get((from_dir, to_dir))
+        if box is None:
+            return None
+        return Point(self.middle_x[x] - line_width / 2 + box[0] * self.tile_size,
+                     self.middle_y[y] - line_width / 2 + box[1] * self.tile_size)
@@ -8,7 +8,8 @@ import enum
 from pygame.locals import *
 import heapq
 
-from ozobotmapf.graphics.drawables import Line, FillRect, Rect, FillChecker
+from ozobotmapf.graphics.drawables import Line, FillRect, Rect, FillChecker, Label
+from ozobotmapf.graphics.label_cache import LABELS
 from ozobotmapf.graphics.shapes import Point, Rectangle
 from ozobotmapf.utils.constants import Colors, Values, Directions
 from ozobotmapf.map_editor.EditorException import EditorException
@@ -29,6 +30,8 @@ class Editor:
         self.mode = Mode.WALL
         self.starts, self.ends = [], []
         self.click_tolerance = config.line_width
+        self.__dragging = False
+        self.__drag_build = None
         self.__pygame_init()
 
     def __pygame_init(self):
@@ -37,7 +40,7 @@ class Editor:
         pygame.display.set_caption(Values.EDITOR_NAME)
         self.__screen = None
         self.__width, self.__height = self.config.window_width, self.config.window_height
-        self.font = pygame.font.Font('freesansbold.ttf', 40)
+        self.__label_overflow = (0, 0)
 
     def __init_screen(self):
         logging.info("Initializing screen.")
@@ -58,11 +61,13 @@ class Editor:
         self.__greet_user()
         self.__get_map_attributes_from_user()
         self.ozomap.init_empty_map(self.config)
+        self.__label_overflow = self.__compute_label_overflow()
 
         self.__init_screen()
         self.__draw_map()
 
         save = self.__game_loop()
+        LABELS.clear()
         pygame.quit()
 
         if save:
@@ -136,7 +141,72 @@ class Editor:
 
     def __draw_tiles(self):
         for tile in self.ozomap.grid.tile_generator():
-                self.__draw_tile(tile)
+            self.__draw_tile(tile)
+
+    def __redraw_tiles(self, tiles):
+        """Method repaints only the surroundings of the given tiles and updates only that part of the display.
+
+        The repainted area covers the tiles, their walls and labels. All tiles reaching into the area are drawn again
+        with the screen clipped to the area, so the rest of the screen stays untouched.
+
+        Args:
+            tiles (list[Tile]): Tiles that were changed
+        """
+        dirty = self.__get_dirty_rect(tiles[0]).unionall([self.__get_dirty_rect(tile) for tile in tiles[1:]])
+        overflow_x, overflow_y = self.__label_overflow
+        nearby = list(self.__grid_tiles_in(dirty.inflate(2 * overflow_x, 2 * overflow_y)))
+
+        self.__screen.set_clip(dirty)
+        self.__screen.fill(Colors.WHITE, dirty)
+        for tile in nearby:
+            self.__draw_tile(tile)
+        for tile in nearby:
+            self.__draw_tile_walls(tile)
+        self.__screen.set_clip(None)
+        pygame.display.update(dirty)
+
+    def __get_dirty_rect(self, tile):
+        """Method returns the screen area that changes when the tile changes (including its walls and label).
+
+        Args:
+            tile (Tile): Changed tile
+
+        Returns:
+            pygame.Rect: Area of the screen
+        """
+        tile_size = self.config.tile_size + 1
+        margin = self.config.wall_width + 1
+        overflow_x, overflow_y = self.__label_overflow
+        rect = pygame.Rect(tile.origin.x, tile.origin.y, tile_size, tile_size)
+        return rect.inflate(2 * max(margin, overflow_x), 2 * max(margin, overflow_y))
+
+    def __grid_tiles_in(self, rect):
+        """Generator yields all grid tiles that intersect the rectangle.
+
+        Args:
+            rect (pygame.Rect): Area of the screen
+        """
+        origin, tile_size = self.ozomap.get_origin(), self.config.tile_size
+        x_from = max(0, math.floor((rect.left - 1 - origin.x) / tile_size))
+        x_to = min(self.ozomap.grid.width - 1, math.floor((rect.right - origin.x) / tile_size))
+        y_from = max(0, math.floor((rect.top - 1 - origin.y) / tile_size))
+        y_to = min(self.ozomap.grid.height - 1, math.floor((rect.bottom - origin.y) / tile_size))
+        for x in range(x_from, x_to + 1):
+            for y in range(y_from, y_to + 1):
+                yield self.ozomap.grid.get_tile(x, y)
+
+    def __compute_label_overflow(self):
+        """Method computes how far the widest tile label can reach over the tile borders.
+
+        Returns:
+            tuple[int, int]: Horizontal and vertical overflow in pixels
+        """
+        font = LABELS.get_font(self.config.tile_size)
+        digit = max("0123456789", key=lambda char: font.size(char)[0])
+        number = digit * len(str(self.config.map_agent_count))
+        width, height = font.size("S: {} / F: {}".format(number, number))
+        return (max(0, math.ceil((width - self.config.tile_size) / 2)) + 1,
+                max(0, math.ceil((height - self.config.tile_size) / 2)) + 1)
 
     def __draw_tile(self, tile):
         tile_size = self.config.tile_size + 1 # This needs to be done for tile borders to overlap during drawing
@@ -154,22 +224,22 @@ class Editor:
         Rect(rectangle, self.config.tile_border_width, Colors.GREY).draw(self.__screen)
 
     def __render_text_in_tile(self, tile, text):
-        text = self.font.render(text, True, Colors.BLACK)
-        text_rect = text.get_rect()
         half_size = self.config.tile_size / 2
-        text_rect.center = (tile.origin.x + half_size, tile.origin.y + half_size)
-        self.__screen.blit(text, text_rect)
+        Label(tile.origin.moved(half_size, half_size), text, self.config.tile_size).draw(self.__screen)
 
     def __draw_walls(self):
         for tile in self.ozomap.grid.tile_generator():
-            if tile.has_wall(Directions.UP):
-                self.__draw_upper_wall(tile.origin)
-            if tile.has_wall(Directions.RIGHT):
-                self.__draw_right_wall(tile.origin)
-            if tile.has_wall(Directions.DOWN):
-                self.__draw_bottom_wall(tile.origin)
-            if tile.has_wall(Directions.LEFT):
-                self.__draw_left_wall(tile.origin)
+            self.__draw_tile_walls(tile)
+
+    def __draw_tile_walls(self, tile):
+        if tile.has_wall(Directions.UP):
+            self.__draw_upper_wall(tile.origin)
+        if tile.has_wall(Directions.RIGHT):
+            self.__draw_right_wall(tile.origin)
+        if tile.has_wall(Directions.DOWN):
+            self.__draw_bottom_wall(tile.origin)
+        if tile.has_wall(Directions.LEFT):
+            self.__draw_left_wall(tile.origin)
 
     def __draw_upper_wall(self, tile_origin):
         """Method draws upper wall of a tile.
@@ -238,64 +308,153 @@ class Editor:
                     self.mode = Mode.START
                 if event.type == KEYDOWN and event.key == K_f:
                     self.mode = Mode.FINISH
+                if event.type == MOUSEBUTTONDOWN and event.button == 1 and self.mode == Mode.WALL:
+                    self.__start_wall_drag(Point(*event.pos))
+                if event.type == MOUSEMOTION and self.__dragging:
+                    self.__continue_wall_drag(Point(*event.pos), event.rel)
                 if event.type == MOUSEBUTTONUP:
-                    x, y = pygame.mouse.get_pos()
-                    self.__handle_mouse_click(Point(x, y))
+                    if self.__dragging:
+                        self.__dragging = False
+                    else:
+                        x, y = pygame.mouse.get_pos()
+                        self.__handle_mouse_click(Point(x, y))
 
         return save
 
     def __handle_mouse_click(self, pos):
         if self.mode == Mode.WALL:
-            self.__handle_wall_toggle(pos)
+            changed = self.__handle_wall_toggle(pos)
         elif self.mode == Mode.START or self.mode == Mode.FINISH:
-            self.__handle_tile_toggle(pos)
+            changed = self.__handle_tile_toggle(pos)
         else:
             raise EditorException("Invalid editor mode!")
 
-        self.__draw_map()
+        if changed:
+            self.__redraw_tiles(changed)
 
     def __handle_wall_toggle(self, pos):
-        if self.__is_pos_on_border(pos):
-            for tile in self.ozomap.map_tile_generator():
-                self.__toggle_tile_walls_if_hit(tile, pos)
-
-    def __is_pos_on_border(self, pos):
-        origin = self.ozomap.get_origin()
-
-        for ith_col in range(1, self.config.map_width):
-            x_border = origin.x + ith_col * self.config.tile_size
-            x_from, x_to = x_border - self.click_tolerance, x_border + self.click_tolerance
-            if x_from <= pos.x <= x_to:
-                return True
-
-        for ith_row in range(1, self.config.map_height):
-            y_border = origin.y + ith_row * self.config.tile_size
-            y_from, y_to = y_border - self.click_tolerance, y_border + self.click_tolerance
-            if y_from <= pos.y <= y_to:
-                return True
-
-        return False
-
-    def __toggle_tile_walls_if_hit(self, tile, pos):
-        xp, yp = pos.x, pos.y
-        xo, yo = tile.origin.x, tile.origin.y
-        t, ts = self.click_tolerance, self.config.tile_size
-        if (yo-t <= yp <= yo+t) and (xo+t <= xp <= xo+ts-t):
-            tile.toggle_wall(Directions.UP)
-        if (xo+ts-t <= xp <= xo+ts+t) and (yo+t <= yp <= yo+ts-t):
-            tile.toggle_wall(Directions.RIGHT)
-        if (yo+ts-t <= yp <= yo+ts+t) and (xo+t <= xp <= xo+ts-t):
-            tile.toggle_wall(Directions.DOWN)
-        if (xo-t <= xp <= xo+t) and (yo+t <= yp <= yo+ts-t):
-            tile.toggle_wall(Directions.LEFT)
+        """Method toggles the wall hit by the click.
+
+        Returns:
+            list[Tile]: Tiles on both sides of the toggled wall (empty if no wall was hit)
+        """
+        wall = self.__get_wall_at(pos)
+        if wall is None:
+            return []
+        tile, direction = wall
+        return self.__set_wall(tile, direction, not tile.has_wall(direction))
+
+    def __start_wall_drag(self, pos):
+        """Method starts painting of walls by dragging the mouse.
+
+        The first wall hit during the drag decides if walls are built or destroyed. The same action is then applied
+        to every wall the cursor crosses until the mouse button is released.
+
+        Args:
+            pos (Point): Position of the cursor
+        """
+        self.__dragging = True
+        self.__drag_build = None
+        self.__paint_walls_at([pos])
+
+    def __continue_wall_drag(self, pos, rel):
+        """Method paints walls crossed by the cursor since the last mouse motion event.
+
+        The cursor movement is sampled with the click tolerance as a step, so that fast movements do not skip walls.
+
+        Args:
+            pos (Point): Current position of the cursor
+            rel (tuple[int, int]): Movement of the cursor since the last motion event
+        """
+        steps = max(1, math.ceil(max(abs(rel[0]), abs(rel[1])) / max(1, self.click_tolerance)))
+        self.__paint_walls_at([Point(pos.x - rel[0] * step / steps, pos.y - rel[1] * step / steps)
+                               for step in range(steps - 1, -1, -1)])
+
+    def __paint_walls_at(self, positions):
+        """Method applies the drag action to walls at the given positions and repaints the changed tiles.
+
+        Args:
+            positions (list[Point]): Positions of the cursor
+        """
+        changed = []
+        for pos in positions:
+            wall = self.__get_wall_at(pos)
+            if wall is None:
+                continue
+            tile, direction = wall
+            if self.__drag_build is None:
+                self.__drag_build = not tile.has_wall(direction)
+            if tile.has_wall(direction) != self.__drag_build:
+                changed += self.__set_wall(tile, direction, self.__drag_build)
+
+        if changed:
+            self.__redraw_tiles(changed)
+
+    def __get_wall_at(self, pos):
+        """Method finds the interior wall under the position.
+
+        The nearest vertical and horizontal tile borders are computed from the position. A border is hit if the
+        position is at most the click tolerance away from it and at least the click tolerance away from its ends.
+        Outer walls of the map cannot be hit.
+
+        Args:
+            pos (Point): Position on the screen
+
+        Returns:
+            tuple[Tile, int]: Tile left of or above the wall and direction of the wall from it (None if no wall is hit)
+        """
+        origin, tolerance, tile_size = self.ozomap.get_origin(), self.click_tolerance, self.config.tile_size
+        x, y = pos.x - origin.x, pos.y - origin.y
+        col, row = math.floor(x / tile_size), math.floor(y / tile_size)
+        border_col, border_row = round(x / tile_size), round(y / tile_size)
+
+        if 0 < border_col < self.config.map_width and abs(x - border_col * tile_size) <= tolerance \
+                and 0 <= row < self.config.map_height and tolerance <= y - row * tile_size <= tile_size - tolerance:
+            return self.ozomap.grid.get_tile(border_col - 1, row), Directions.RIGHT
+        if 0 < border_row < self.config.map_height and abs(y - border_row * tile_size) <= tolerance \
+                and 0 <= col < self.config.map_width and tolerance <= x - col * tile_size <= tile_size - tolerance:
+            return self.ozomap.grid.get_tile(col, border_row - 1), Directions.DOWN
+        return None
+
+    def __set_wall(self, tile, direction, build):
+        """Method builds or destroys the wall between the tile and its right or bottom neighbour.
+
+        Args:
+            tile (Tile): Tile left of or above the wall
+            direction (int): Direction of the wall from the tile (`Directions.RIGHT` or `Directions.DOWN`)
+            build (bool): Flag if the wall should be built (else it is destroyed)
+
+        Returns:
+            list[Tile]: Tiles on both sides of the wall
+        """
+        if direction == Directions.RIGHT:
+            neighbour, opposite = self.ozomap.grid.get_tile(tile.x_pos + 1, tile.y_pos), Directions.LEFT
+        else:
+            neighbour, opposite = self.ozomap.grid.get_tile(tile.x_pos, tile.y_pos + 1), Directions.UP
+
+        if build:
+            tile.build_wall(direction)
+            neighbour.build_wall(opposite)
+        else:
+            tile.destroy_wall(direction)
+            neighbour.destroy_wall(opposite)
+        return [tile, neighbour]
 
     def __handle_tile_toggle(self, pos):
+        """Method toggles agent start or finish on the clicked tile.
+
+        Returns:
+            list[Tile]: The clicked tile (empty if the click is outside the map)
+        """
         tile = self.__get_tile_from_position(pos)
-        if tile is not None:
-            if self.mode == Mode.START:
-                self.__handle_tile_start_toggle(tile)
-            elif self.mode == Mode.FINISH:
-                self.__handle_tile_finish_toggle(tile)
+        if tile is None:
+            return []
+
+        if self.mode == Mode.START:
+            self.__handle_tile_start_toggle(tile)
+        elif self.mode == Mode.FINISH:
+            self.__handle_tile_finish_toggle(tile)
+        return [tile]
 
     def __get_tile_from_position(self, pos):
         x = math.floor((pos.x - self.ozomap.get_origin().x) / self.config.tile_size)
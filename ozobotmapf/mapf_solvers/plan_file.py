@@ -0,0 +1,160 @@
+import logging
+
+from ozobotmapf.mapf_solvers.prioritized_solver import get_agent_endpoints
+from ozobotmapf.mapf_solvers.solver import Solver
+from ozobotmapf.mapf_solvers.solver_exception import PlanFileException
+
+PLAN_FILE_HEADER = "OZOPLAN"
+PLAN_FILE_VERSION = 1
+
+
+class PlanFileSolver(Solver):
+    """Solver replaying plans recorded in a plan file (no external solver is run).
+
+    Attributes:
+        plan_path (str): Path to the plan file
+        ozomap (OzoMap): Loaded map the plans are replayed on (None to skip the validation)
+    """
+
+    def __init__(self, plan_path, ozomap=None):
+        """Initialize the PlanFileSolver instance.
+
+        Args:
+            plan_path (str): Path to the plan file
+            ozomap (OzoMap): Loaded map the plans are replayed on (None to skip the validation)
+        """
+        self.plan_path = plan_path
+        self.ozomap = ozomap
+
+    def plan(self):
+        """Method loads the recorded plans and validates them against the map.
+
+        Returns:
+            dict[int, dict[str, list]]: Plans for every agent, including the list of positions and list of moves
+
+        Raises:
+            PlanFileException: If the file is not a valid plan file or the plans do not fit the map
+        """
+        plans = load_plans(self.plan_path)
+        if self.ozomap is not None:
+            validate_plans(plans, self.ozomap, self.plan_path)
+        logging.info("Loaded plans of {} agents from '{}'.".format(len(plans), self.plan_path))
+        return plans
+# ------------------------------------------------------------------------------------------------------------
+
+
+def save_plans(plans, path):
+    """Function writes plans into a plan file.
+
+    The file starts with the `OZOPLAN <version>` header followed by one line per agent:
+    `<agent>: <positions separated by spaces> | <moves separated by spaces>`, where a move is `<from>-<to>`
+    and a wait is `.`.
+
+    Args:
+        plans (dict[int, dict[str, list]]): Plans of all agents
+        path (str): Path of the plan file
+    """
+    lines = ["{} {}\n".format(PLAN_FILE_HEADER, PLAN_FILE_VERSION)]
+    for agent_id in sorted(plans):
+        plan = plans[agent_id]
+        moves = ["." if step is None else "{}-{}".format(*step) for step in plan['steps']]
+        lines.append("{}: {} | {}\n".format(agent_id, " ".join(map(str, plan['pos_list'])), " ".join(moves)))
+
+    with open(path, "w") as file:
+        file.writelines(lines)
+    logging.info("Plans of {} agents saved to '{}'.".format(len(plans), path))
+
+
+def load_plans(path):
+    """Function reads plans from a plan file (see `save_plans` for the format).
+
+    Args:
+        path (str): Path of the plan file
+
+    Returns:
+        dict[int, dict[str, list]]: Plans for every agent, including the list of positions and list of moves
+
+    Raises:
+        PlanFileException: If the file cannot be read or is not a valid plan file
+    """
+    try:
+        with open(path) as file:
+            lines = file.read().splitlines()
+    except OSError as error:
+        raise_exception("Plan file '{}' cannot be read: {}".format(path, error))
+
+    if not lines or lines[0].split() != [PLAN_FILE_HEADER, str(PLAN_FILE_VERSION)]:
+        raise_exception("'{}' is not a plan file of version {}.".format(path, PLAN_FILE_VERSION))
+
+    plans = {}
+    for line_no, line in enumerate(lines[1:], 2):
+        if not line.strip():
+            continue
+        try:
+            agent, rest = line.split(":", 1)
+            positions, moves = rest.split("|", 1)
+            steps = [None if move == "." else tuple(map(int, move.split("-", 1))) for move in moves.split()]
+            plans[int(agent)] = {'pos_list': list(map(int, positions.split())), 'steps': steps}
+        except ValueError:
+            raise_exception("Invalid line {} in plan file '{}'.".format(line_no, path))
+
+    if not plans:
+        raise_exception("Plan file '{}' does not contain any plan.".format(path))
+    return plans
+
+
+def validate_plans(plans, ozomap, path):
+    """Function checks that the plans can be replayed on the map.
+
+    Every agent of the map has to have a plan starting on its start tile, all tiles have to be on the map and every
+    move has to go to a neighbouring tile (walls are respected). Recorded moves have to match the positions.
+
+    Args:
+        plans (dict[int, dict[str, list]]): Loaded plans
+        ozomap (OzoMap): Loaded map
+        path (str): Path of the plan file (used in the messages)
+
+    Raises:
+        PlanFileException: If the plans do not fit the map
+    """
+    starts, _ = get_agent_endpoints(ozomap)
+    if sorted(plans) != sorted(starts):
+        raise_exception("Plan file '{}' has plans of agents {}, but the map has agents {}."
+                        .format(path, sorted(plans), sorted(starts)))
+
+    tile_cnt = ozomap.width * ozomap.height
+    for agent_id in sorted(plans):
+        positions, steps = plans[agent_id]['pos_list'], plans[agent_id]['steps']
+        if not positions:
+            raise_exception("Plan of agent {} in '{}' has no positions.".format(agent_id, path))
+        for tile_id in positions + [tile_id for step in steps if step is not None for tile_id in step]:
+            if not 0 <= tile_id < tile_cnt:
+                raise_exception("Plan of agent {} in '{}' uses tile {} outside of the {}x{} map."
+                                .format(agent_id, path, tile_id, ozomap.width, ozomap.height))
+        if positions[0] != starts[agent_id]:
+            raise_exception("Plan of agent {} in '{}' starts on tile {}, but the agent starts on tile {}."
+                            .format(agent_id, path, positions[0], starts[agent_id]))
+
+        for index, (t_from, t_to) in enumerate(zip(positions, positions[1:])):
+            if t_from != t_to and t_to not in ozomap.get_neighbour_ids(t_from):
+                raise_exception("Plan of agent {} in '{}' moves from tile {} to tile {}, they are not neighbours."
+                                .format(agent_id, path, t_from, t_to))
+            if index < len(steps) and steps[index] != (None if t_from == t_to else (t_from, t_to)):
+                raise_exception("Move {} of agent {} in '{}' does not match its positions."
+                                .format(index + 1, agent_id, path))
+        if len(steps) >= len(positions) or not any(steps):
+            raise_exception("Plan of agent {} in '{}' has {} moves for {} positions."
+                            .format(agent_id, path, sum(step is not None for step in steps), len(positions)))
+
+
+def raise_exception(message):
+    """Function logs error message and raises an exception.
+
+    Args:
+        message (str): Error message
+
+    Raises:
+        PlanFileException: Always
+    """
+    logging.error("Invalid plan file: {}".format(message))
+    raise PlanFileException(message)
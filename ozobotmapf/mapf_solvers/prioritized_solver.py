@@ -0,0 +1,213 @@
+import heapq
+import logging
+import random
+
+from ozobotmapf.mapf_solvers.solver import Solver
+from ozobotmapf.mapf_solvers.solver_exception import NoPlanFoundException
+
+
+class PrioritizedSolver(Solver):
+    """Simple built-in solver using prioritized planning with space-time A*.
+
+    Agents are planned one after another, each avoiding vertex and swap conflicts with the already planned agents.
+    The solver is not complete (it can fail on instances that boOX solves), so if an agent fails, it gets the highest
+    priority and the planning is restarted. It is meant for recording plan fixtures and for tools that must not
+    depend on the external solver.
+
+    Note:
+        Only `width`, `height` and `get_neighbour_ids` of the map are used, so any grid providing them can be planned
+        on (e.g. generated layouts), agents are then given explicitly.
+
+    Attributes:
+        ozomap (OzoMap): Loaded map
+        agents (dict[int, tuple[int, int]]): Start and finish tile ID of every agent (None to take them from the map)
+        restarts (int): Number of priority orders tried after the default one fails
+        seed (int): Seed of the random priority orders
+    """
+
+    def __init__(self, ozomap, restarts=20, seed=0, agents=None):
+        """Initialize the PrioritizedSolver instance.
+
+        Args:
+            ozomap (OzoMap): Loaded map
+            restarts (int): Number of priority orders tried after the default one fails
+            seed (int): Seed of the random priority orders
+            agents (dict[int, tuple[int, int]]): Start and finish tile ID of every agent
+                (None to take them from the map)
+        """
+        self.ozomap = ozomap
+        self.agents = agents
+        self.restarts = restarts
+        self.seed = seed
+
+        self.__neighbours = None
+
+    def plan(self):
+        """Method plans all agents of the map.
+
+        Returns:
+            dict[int, dict[str, list]]: Plans for every agent, including the list of positions and list of moves
+
+        Raises:
+            NoPlanFoundException: If no priority order leads to a plan
+        """
+        if self.agents is None:
+            starts, finishes = get_agent_endpoints(self.ozomap)
+        else:
+            starts = {agent: start for agent, (start, _) in self.agents.items()}
+            finishes = {agent: finish for agent, (_, finish) in self.agents.items()}
+        self.__neighbours = [self.ozomap.get_neighbour_ids(tile_id)
+                             for tile_id in range(self.ozomap.width * self.ozomap.height)]
+        order = sorted(starts)
+        rng = random.Random(self.seed)
+
+        for attempt in range(self.restarts + 1):
+            paths, failed = self.__plan_in_order(order, starts, finishes)
+            if paths is not None:
+                logging.info("Prioritized planning succeeded in attempt {}.".format(attempt + 1))
+                return paths_to_plans(paths)
+            if order[0] == failed:  # The agent fails even with the highest priority, the rest is shuffled
+                rng.shuffle(order)
+            else:
+                order.remove(failed)
+                order.insert(0, failed)
+
+        raise NoPlanFoundException("Prioritized planning did not find a plan.")
+
+    def __plan_in_order(self, order, starts, finishes):
+        """Method plans agents in the given priority order.
+
+        Returns:
+            dict[int, list[int]]: Timed path (tile ID for every time step) of every agent (None if an agent fails)
+            int: ID of the agent that failed (None if all agents were planned)
+        """
+        vertices, edges, parked = set(), set(), {}
+        end_time = 0
+        paths = {}
+        for agent_id in order:
+            path = self.__space_time_a_star(starts[agent_id], finishes[agent_id], vertices, edges, parked, end_time)
+            if path is None:
+                return None, agent_id
+            for time, tile in enumerate(path):
+                vertices.add((tile, time))
+                if time > 0:
+                    edges.add((path[time - 1], tile, time))
+            parked[path[-1]] = len(path) - 1
+            end_time = max(end_time, len(path) - 1)
+            paths[agent_id] = path
+        return paths, None
+
+    def __space_time_a_star(self, start, finish, vertices, edges, parked, end_time):
+        """Method finds the shortest timed path of a single agent avoiding reserved vertices and edges.
+
+        After `end_time` all already planned agents are parked and nothing changes anymore, so states later than that
+        differ only by the tile and are searched as a plain graph. Tiles from which the finish cannot be reached
+        around the parked agents are not expanded after `end_time` at all.
+
+        Args:
+            start (int): Start tile ID
+            finish (int): Finish tile ID
+            vertices (set[tuple[int, int]]): Reserved (tile, time) pairs
+            edges (set[tuple[int, int, int]]): Reserved moves (from, to, arrival time)
+            parked (dict[int, int]): Tiles occupied by finished agents from the given time on
+            end_time (int): Time when the last already planned agent finishes
+
+        Returns:
+            list[int]: Tile ID for every time step (None if there is no path)
+        """
+        distance = self.__distances_to(finish)
+        finish_area = self.__distances_to(finish, parked) if finish not in parked else {}
+        if start not in distance or not finish_area:
+            return None
+
+        last_reserved = max((time for tile, time in vertices if tile == finish), default=-1)
+        queue = [(distance[start], 0, start)]
+        previous = {(start, 0): None}
+        closed = set()
+        while queue:
+            _, time, tile = heapq.heappop(queue)
+            if tile == finish and time > last_reserved:
+                path = [(tile, time)]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                return [tile for tile, _ in reversed(path)]
+
+            key = (tile, min(time, end_time + 1))
+            if key in closed:
+                continue
+            closed.add(key)
+
+            for neighbour in [tile, *self.__neighbours[tile]]:
+                state = (neighbour, time + 1)
+                if state in previous or state in vertices or (neighbour, tile, time + 1) in edges:
+                    continue
+                if neighbour in parked and parked[neighbour] <= time + 1:
+                    continue
+                if time + 1 > end_time and neighbour not in finish_area:
+                    continue
+                previous[state] = (tile, time)
+                heapq.heappush(queue, (time + 1 + distance[neighbour], time + 1, neighbour))
+        return None
+
+    def __distances_to(self, finish, blocked=()):
+        """Method computes distances of all tiles, from which the finish can be reached, to the finish tile.
+
+        Args:
+            finish (int): Finish tile ID
+            blocked (set[int]): Tiles that cannot be passed
+
+        Returns:
+            dict[int, int]: Distance of every reachable tile
+        """
+        distance = {finish: 0}
+        frontier = [finish]
+        while frontier:
+            following = []
+            for tile in frontier:
+                for neighbour in self.__neighbours[tile]:
+                    if neighbour not in distance and neighbour not in blocked:
+                        distance[neighbour] = distance[tile] + 1
+                        following.append(neighbour)
+            frontier = following
+        return distance
+# ------------------------------------------------------------------------------------------------------------
+
+
+def get_agent_endpoints(ozomap):
+    """Function finds start and finish tiles of all agents on the map.
+
+    Args:
+        ozomap (OzoMap): Loaded map
+
+    Returns:
+        dict[int, int]: Start tile ID of every agent
+        dict[int, int]: Finish tile ID of every agent
+    """
+    starts, finishes = {}, {}
+    for tile_id, tile in enumerate(ozomap.map_tile_generator()):
+        if tile.agent_start > 0:
+            starts[tile.agent_start] = tile_id
+        if tile.agent_finish > 0:
+            finishes[tile.agent_finish] = tile_id
+    return starts, finishes
+
+
+def paths_to_plans(paths):
+    """Function converts timed tile paths to plans, shorter paths are padded by waiting in the finish.
+
+    Args:
+        paths (dict[int, list[int]]): Tile ID for every time step of every agent
+
+    Returns:
+        dict[int, dict[str, list]]: Plans in the same format as produced by solvers
+    """
+    if not paths:
+        return {}
+
+    length = max(len(path) for path in paths.values())
+    plans = {}
+    for agent_id, path in paths.items():
+        pos_list = path + [path[-1]] * (length - len(path))
+        steps = [(a, b) if a != b else None for a, b in zip(pos_list, pos_list[1:])]
+        plans[agent_id] = {'pos_list': pos_list, 'steps': steps}
+    return plans
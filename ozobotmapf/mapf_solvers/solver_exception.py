@@ -1,3 +1,13 @@
 class SubprocessSolverException(Exception):
     """Raised when subprocess solver fails to produce a plan."""
     pass
+
+
+class NoPlanFoundException(Exception):
+    """Raised when a solver cannot find a plan."""
+    pass
+
+
+class PlanFileException(Exception):
+    """Raised when a plan file is invalid."""
+    pass
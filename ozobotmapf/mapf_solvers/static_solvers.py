@@ -73,7 +73,7 @@ class MapfSolverBoOX(SubprocessSolver):
             dict[int, dict[str, list]]: Parsed plans for every agent, including the list of positions and list of moves
         """
         output = self.__run_subprocess()
-        return self.__parse_plan(str(output).replace('\\n', '\n'))
+        return parse_boox_output(str(output).replace('\\n', '\n'))
 
     def __run_subprocess(self):
         """Method runs the subprocess with all arguments.
@@ -106,34 +106,35 @@ class MapfSolverBoOX(SubprocessSolver):
             list[str]: Command list including path to executable and command-line arguments.
         """
         return [self.solver_path, *self._build_arguments_string()]
+# ------------------------------------------------------------------------------------------------------------
 
-    @staticmethod
-    def __parse_plan(output):
-        """Method parses the output string of the solver subprocess.
 
-        Args:
-            output (str): Output of the subprocess
+def parse_boox_output(output):
+    """Function parses the output string of a boOX solver.
 
-        Returns:
-            dict[int, dict[str, list]]: Parsed plans for every agent, including the list of positions and list of moves
-        """
-        agent_positions = [(int(aID), list(map(int, positions.split(' '))))
-                           for aID, positions in re.findall(r"Agent (\d+): (.+)\n", output)]
-        steps = [re.findall(r"(\d+)#(\d+)->(\d+)", x) for x in re.findall(r"Step \d+: (.*) \n", output)]
-        steps = [[(int(x), int(y), int(z)) for x, y, z in step] for step in steps]
-
-        agents = {}
-        for aID, positions in agent_positions:
-            agents[aID] = {'pos_list': positions, 'steps': []}
-            for step in steps:
-                moved = False
-                for agent_step in step:
-                    if aID == agent_step[0]:
-                        agents[aID]['steps'].append((agent_step[1], agent_step[2]))
-                        moved = True
-                        break
-                if not moved:
-                    agents[aID]['steps'].append(None)
-
-        logging.debug("Parsed agent plans: {}".format(agents))
-        return agents
+    Args:
+        output (str): Output of the solver
+
+    Returns:
+        dict[int, dict[str, list]]: Parsed plans for every agent, including the list of positions and list of moves
+    """
+    agent_positions = [(int(aID), list(map(int, positions.split(' '))))
+                       for aID, positions in re.findall(r"Agent (\d+): (.+)\n", output)]
+    steps = [re.findall(r"(\d+)#(\d+)->(\d+)", x) for x in re.findall(r"Step \d+: (.*) \n", output)]
+    steps = [[(int(x), int(y), int(z)) for x, y, z in step] for step in steps]
+
+    agents = {}
+    for aID, positions in agent_positions:
+        agents[aID] = {'pos_list': positions, 'steps': []}
+        for step in steps:
+            moved = False
+            for agent_step in step:
+                if aID == agent_step[0]:
+                    agents[aID]['steps'].append((agent_step[1], agent_step[2]))
+                    moved = True
+                    break
+            if not moved:
+                agents[aID]['steps'].append(None)
+
+    logging.debug("Parsed agent plans: {}".format(agents))
+    return agents
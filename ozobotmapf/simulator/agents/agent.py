@@ -1,6 +1,7 @@
 import logging
+import math
 
-from ozobotmapf.graphics.drawables import FullArrow, DrawableGroup, Line, Arc
+from ozobotmapf.graphics.drawables import FullArrow, DrawableGroup, Line, Arc, SpriteArc, SpriteDot
 from ozobotmapf.graphics.shapes import Rectangle
 from ozobotmapf.simulator.path_position import PathPosition
 from ozobotmapf.simulator.position_tile import PositionTile
@@ -25,6 +26,7 @@ class Agent:
 
         self.positions = self.__tiles_from_positions()
         self.steps = self.__tiles_from_steps()
+        self.__wait_ends = self.__get_wait_ends()
 
         self.active_path = DrawableGroup()
         self.direction_arrow = self.__create_direction_arrow()
@@ -35,6 +37,51 @@ class Agent:
     def get_active_path(self):
         return self.active_path
 
+    def get_tile_bounds(self, time):
+        """Method returns the tiles the active path can be drawn to (used to skip agents outside of the view).
+
+        Note:
+            The tail is never longer than one step, one tile is added around for turns and Color Codes.
+
+        Args:
+            time (int): Current simulation time in milliseconds
+
+        Returns:
+            tuple[int, int, int, int]: First column, first row, last column and last row (inclusive)
+        """
+        first = self.__position_id_from_time(min(max(time - self.config.tail_lag, 0), self.max_time))
+        last = self.__position_id_from_time(min(max(time, 0), self.max_time))
+        return get_bounds([position.tile for position in self.positions[first:last + 1]])
+
+    def is_idle(self, start, end):
+        """Method checks if the drawn path of the agent stays the same between two simulation times.
+
+        Note:
+            The path shows at most the tail lag before the current time, the agent is idle if it stays on one tile
+            from a step before the tail at the start time to a step after the head at the end time (a waiting or
+            finished agent). Positions of the arrival and the departure are not idle, their paths change color.
+
+        Args:
+            start (int): First simulation time in milliseconds
+            end (int): Last simulation time in milliseconds
+
+        Returns:
+            bool: True if the path does not change
+        """
+        step = self.config.step_time
+        last_id = len(self.raw_positions) - 1
+        first = min(max(math.floor((start - self.config.tail_lag) / step) - 1, 0), last_id)
+        last = min(max(math.ceil(end / step) + 1, 0), last_id)
+        return self.__wait_ends[first] >= last
+
+    def relayout(self, shift):
+        """Method updates the agent after the map was laid out again by the viewport.
+
+        Args:
+            shift (tuple[int, int]): Move of all tiles in pixels (None if the tile size changed)
+        """
+        self.direction_arrow = self.__create_direction_arrow()
+
     def __tiles_from_positions(self):
         tiles = [self.ozomap.get_tile_by_id(raw_id) for raw_id in self.raw_positions]
         positions = []
@@ -85,28 +132,70 @@ class Agent:
                 steps.append((t_from, t_to))
         return steps
 
+    def __get_wait_ends(self):
+        """Method computes the index of the last position on the same tile for every position of the path."""
+        ends = list(range(len(self.raw_positions)))
+        for i in range(len(ends) - 2, -1, -1):
+            if self.raw_positions[i] == self.raw_positions[i + 1]:
+                ends[i] = ends[i + 1]
+        return ends
+
     def __create_direction_arrow(self):
         for step in self.steps:
             if step is not None:
                 direction = step[0].direction_to(step[1])
-                position = step[0].get_edge_middle(direction)
+                position = self.ozomap.geometry.get_edge_middle(step[0].x_pos, step[0].y_pos, direction)
                 return FullArrow(position, direction, self.config.wall_width)
         return None
 
-    def _get_position(self, time):
-        position = PathPosition(time, self.max_time)
+    def _get_position(self, time, position=None):
+        """Method computes the position of the agent on its path in the simulation time.
+
+        Args:
+            time (float): Simulation time in milliseconds
+            position (PathPosition): Position that should be reused (None for a new one)
+
+        Returns:
+            PathPosition: Position on the path
+        """
+        if position is None:
+            position = PathPosition(time, self.max_time, self.ozomap.geometry)
+        else:
+            position.set_time(time, self.max_time)
 
         current_pos_id = self.__position_id_from_time(position.time)
-        current_pos = self.positions[current_pos_id]
-        next_pos = self.positions[current_pos_id + 1] if current_pos_id < len(self.positions) - 1 else current_pos
-        prev_pos = self.positions[current_pos_id - 1] if current_pos_id > 0 else current_pos
-        position.set_position_tile(current_pos, next_pos, prev_pos)
+        self.__set_position_tile(position, current_pos_id)
 
         enter, middle, leave = self.__time_window_from_position(current_pos_id)
         position.set_time_window(enter, middle, leave)
 
         return position
 
+    def _get_half_position(self, pos_id, is_first_half, offset):
+        """Method creates a position at the given offset of a tile half (independently of the simulation time).
+
+        Args:
+            pos_id (int): Position index in the tile path sequence
+            is_first_half (bool): Flag if the position is in the first half of the tile
+            offset (float): Relative position in the half <0, 1>
+
+        Returns:
+            PathPosition: Position on the path
+        """
+        enter, middle, leave = self.__time_window_from_position(pos_id)
+        position = PathPosition(middle, self.max_time, self.ozomap.geometry)
+        self.__set_position_tile(position, pos_id)
+        position.set_time_window(enter, middle, leave)
+        position.set_half(is_first_half, offset)
+
+        return position
+
+    def __set_position_tile(self, position, pos_id):
+        current_pos = self.positions[pos_id]
+        next_pos = self.positions[pos_id + 1] if pos_id < len(self.positions) - 1 else current_pos
+        prev_pos = self.positions[pos_id - 1] if pos_id > 0 else current_pos
+        position.set_position_tile(current_pos, next_pos, prev_pos)
+
     def __position_id_from_time(self, time):
         """ Method returns a position ID in the path sequence of tiles based on current simulation time.
 
@@ -171,9 +260,28 @@ class Agent:
         self.raw_positions = self.raw_positions[:real_len]
 
     def _line_drawable(self, p_from, p_to):
+        if self.config.trail_sprites and p_from.x == p_to.x and p_from.y == p_to.y:
+            return SpriteDot(p_from, self.config.line_width)
         return Line(p_from, p_to, self.config.line_width)
 
     def _arc_drawable(self, box_origin, start, end):
         box_size = self.config.tile_size + self.config.line_width
         box = Rectangle(box_origin, box_size, box_size)
+        if self.config.trail_sprites:
+            return SpriteArc(box, start, end, self.config.line_width)
         return Arc(box, start, end, self.config.line_width)
+# ------------------------------------------------------------------------------------------------------------
+
+
+def get_bounds(tiles):
+    """Function returns the tile rectangle around the tiles extended by one tile to every side.
+
+    Args:
+        tiles (list[Tile]): Tiles to be covered
+
+    Returns:
+        tuple[int, int, int, int]: First column, first row, last column and last row (inclusive)
+    """
+    columns = [tile.x_pos for tile in tiles]
+    rows = [tile.y_pos for tile in tiles]
+    return min(columns) - 1, min(rows) - 1, max(columns) + 1, max(rows) + 1
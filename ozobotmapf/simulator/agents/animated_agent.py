@@ -1,21 +1,33 @@
-from ozobotmapf.graphics.drawables import Line
+from ozobotmapf.graphics.drawables import LinePool
 from ozobotmapf.simulator.agents.agent import Agent
 
 
 class AnimatedAgent(Agent):
     """
     This agent is animating it's path in time.
+
+    Lines of the path and the head and tail positions are reused in every frame.
     """
     def __init__(self, agent_id, raw_plans, ozomap, config):
         super().__init__(agent_id, raw_plans, ozomap, config)
+        self.active_path = LinePool(config.line_width)
+        self.__head = None
+        self.__tail = None
 
     def update_path(self, time):
         self.active_path.clear()
 
-        head = self._get_position(time)
-        tail = self._get_position(time - self.config.tail_lag)
+        self.__head = self._get_position(time, self.__head)
+        self.__tail = self._get_position(time - self.config.tail_lag, self.__tail)
+
+        self.__build_active_path(self.__tail, self.__head)
 
-        self.__build_active_path(tail, head)
+    def relayout(self, shift):
+        super().relayout(shift)
+        if shift is None:  # Line width changed with the tile size
+            self.active_path = LinePool(self.config.line_width)
+        else:
+            self.active_path.translate(*shift)
 
     def __build_active_path(self, from_pos, to_pos):
         if from_pos.pos_tile == to_pos.pos_tile:
@@ -42,31 +54,35 @@ class AnimatedAgent(Agent):
 
     def __build_line_to_middle(self, pos):
         position = pos.get_point_from_position()
-        middle = pos.pos_tile.tile.get_middle()
+        middle = self.__get_middle(pos)
 
         self.__add_path_line(middle, position)
 
     def __build_line_before_leave(self, from_pos):
         position = from_pos.get_point_from_position()
-        leave = from_pos.pos_tile.tile.get_edge_middle(from_pos.pos_tile.to_dir)
+        leave = self.__get_edge_middle(from_pos, from_pos.pos_tile.to_dir)
         if from_pos.is_first_half:
-            middle = from_pos.pos_tile.tile.get_middle()
-            self.__add_path_line(position, from_pos.pos_tile.tile.get_middle())
+            middle = self.__get_middle(from_pos)
+            self.__add_path_line(position, middle)
             self.__add_path_line(middle, leave)
         else:
             self.__add_path_line(position, leave)
 
     def __build_line_after_entry(self, to_pos):
         position = to_pos.get_point_from_position()
-        enter = to_pos.pos_tile.tile.get_edge_middle(to_pos.pos_tile.from_dir)
+        enter = self.__get_edge_middle(to_pos, to_pos.pos_tile.from_dir)
         if to_pos.is_first_half:
             self.__add_path_line(enter, position)
         else:
-            middle = to_pos.pos_tile.tile.get_middle()
+            middle = self.__get_middle(to_pos)
             self.__add_path_line(middle, enter)
             self.__add_path_line(middle, position)
 
+    def __get_middle(self, pos):
+        return self.ozomap.geometry.get_middle(pos.pos_tile.tile.x_pos, pos.pos_tile.tile.y_pos)
+
+    def __get_edge_middle(self, pos, direction):
+        return self.ozomap.geometry.get_edge_middle(pos.pos_tile.tile.x_pos, pos.pos_tile.tile.y_pos, direction)
+
     def __add_path_line(self, p_from, p_to):
-        self.active_path.add_drawable(
-            Line(p_from, p_to, self.config.line_width)
-        )
+        self.active_path.add_line(p_from, p_to)
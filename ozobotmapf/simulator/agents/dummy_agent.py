@@ -1,17 +1,38 @@
-from ozobotmapf.simulator.agents.agent import Agent
+from ozobotmapf.simulator.agents.agent import Agent, get_bounds
 from ozobotmapf.graphics.drawables import Line
 
 
 class DummyAgent(Agent):
     """
     This agent implementation is displaying it's whole path (plan) during each update.
+
+    The path does not change in time, so it is built only once (and again when the map is laid out again).
     """
     def __init__(self, agent_id, raw_plans, ozomap, config):
         super().__init__(agent_id, raw_plans, ozomap, config)
+        self.bounds = get_bounds([position.tile for position in self.positions])
+        self.__build_path()
 
     def update_path(self, time):
+        pass
+
+    def relayout(self, shift):
+        super().relayout(shift)
+        if shift is None:
+            self.__build_path()
+        else:
+            self.active_path.translate(*shift)
+
+    def __build_path(self):
         self.active_path.clear()
+        geometry = self.ozomap.geometry
         for i in range(1, len(self.positions)):
-            start = self.positions[i-1].tile.get_middle()
-            end = self.positions[i].tile.get_middle()
+            start = geometry.get_middle(self.positions[i-1].tile.x_pos, self.positions[i-1].tile.y_pos)
+            end = geometry.get_middle(self.positions[i].tile.x_pos, self.positions[i].tile.y_pos)
             self.active_path.add_drawable(Line(start, end, self.config.line_width))
+
+    def is_idle(self, start, end):
+        return True
+
+    def get_tile_bounds(self, time):
+        return self.bounds
@@ -0,0 +1,112 @@
+import bisect
+
+from ozobotmapf.utils.constants import MarkerTypes, PositionTypes
+
+
+class MarkerEvent:
+    """Marker on the agent path with its exact time.
+
+    Attributes:
+        time (float): Simulation time of the marker in milliseconds
+        type (int): Type of the marker (one of `MarkerTypes`)
+        pos_id (int): Position index in the tile path sequence
+        is_first_half (bool): Flag if the marker is in the first half of the tile
+        offset (float): Relative position of the marker in the tile half <0, 1>
+        end (float): Time the marker stops affecting the path in milliseconds (leave time of the tile)
+        is_turn (bool): Flag if the marker should be drawn in the turn color
+    """
+
+    __slots__ = ("time", "type", "pos_id", "is_first_half", "offset", "end", "is_turn")
+
+    def __init__(self, time, marker_type, pos_id, is_first_half, offset, end, is_turn=False):
+        self.time = time
+        self.type = marker_type
+        self.pos_id = pos_id
+        self.is_first_half = is_first_half
+        self.offset = offset
+        self.end = end
+        self.is_turn = is_turn
+
+
+class MarkerSchedule:
+    """Marker events of an agent path compiled once from the plan and sorted by time.
+
+    Events are consumed by a pointer while the simulation time grows (`pop_due`) or read for a time window
+    (`get_events`), so the markers do not depend on the frame timing and no state of the path tiles is changed.
+
+    Attributes:
+        events (list[MarkerEvent]): Marker events sorted by time
+    """
+
+    TURN_LINE_OFFSET = 0.65  # Offset of the second half of the tile where the path before a turn starts
+    INTERSECTION_OFFSETS = (0.45, 0.1, 0.75)  # Offsets of the intersection indicators (first half, second half)
+    STOP_INTERSECTION_OFFSETS = (0.45, 0.03, 0.6)  # Offsets of the indicators before a turn where the agent stops
+
+    def __init__(self, positions, step_time, intersections):
+        """Initialization of the MarkerSchedule instance.
+
+        Args:
+            positions (list[PositionTile]): Tile path sequence of the agent
+            step_time (int): Time of the move between two tile middles in milliseconds
+            intersections (bool): Flag if intersection indicators should be scheduled
+        """
+        self.__step_time = step_time
+        events = []
+        for pos_id, pos_tile in enumerate(positions):
+            next_tile = positions[pos_id + 1] if pos_id < len(positions) - 1 else pos_tile
+            prev_tile = positions[pos_id - 1] if pos_id > 0 else pos_tile
+            if intersections:
+                events.extend(self.__intersection_events(pos_id, pos_tile, next_tile, prev_tile))
+            if next_tile.is_turn and not pos_tile.is_turn and pos_tile.type != PositionTypes.WAIT:
+                events.append(self.__event(MarkerTypes.TURN_LINE, pos_id, False, self.TURN_LINE_OFFSET))
+            if pos_tile.u_turn:
+                events.append(self.__event(MarkerTypes.U_TURN, pos_id, False, 0))
+
+        self.events = sorted(events, key=lambda event: event.time)
+        self.__times = [event.time for event in self.events]
+        self.__next = 0  # Index of the first event that was not consumed
+
+    def pop_due(self, time):
+        """Method consumes events that happened until the time.
+
+        Args:
+            time (float): Current simulation time in milliseconds
+
+        Returns:
+            list[MarkerEvent]: Events that were not consumed yet and are not later than the time
+        """
+        start = self.__next
+        self.__next = bisect.bisect_right(self.__times, time, start)
+        return self.events[start:self.__next]
+
+    def get_events(self, start, end):
+        """Method returns events in a time window (events are not consumed).
+
+        Args:
+            start (float): Start of the window in milliseconds
+            end (float): End of the window in milliseconds (inclusive)
+
+        Returns:
+            list[MarkerEvent]: Events in the window sorted by time
+        """
+        return self.events[bisect.bisect_left(self.__times, start):bisect.bisect_right(self.__times, end)]
+
+    def __intersection_events(self, pos_id, pos_tile, next_tile, prev_tile):
+        if pos_tile.is_turn or pos_tile.type != PositionTypes.PASS:
+            return []
+
+        stops = next_tile.is_turn and next_tile.is_stop()
+        offsets = self.STOP_INTERSECTION_OFFSETS if stops else self.INTERSECTION_OFFSETS
+        events = []
+        for index, offset in enumerate(offsets):
+            if index == 0 and prev_tile.is_turn and prev_tile.is_start():  # First intersection after Wait on Turn
+                continue
+            is_turn = next_tile.is_turn and index >= 2  # Intersection right before a turn
+            events.append(self.__event(MarkerTypes.INTERSECTION, pos_id, index == 0, offset, is_turn))
+        return events
+
+    def __event(self, marker_type, pos_id, is_first_half, offset, is_turn=False):
+        middle = pos_id * self.__step_time
+        half_start = middle - self.__step_time / 2 if is_first_half else middle
+        time = half_start + offset * self.__step_time / 2
+        return MarkerEvent(time, marker_type, pos_id, is_first_half, offset, middle + self.__step_time / 2, is_turn)
@@ -1,30 +1,50 @@
+import math
+
 from ozobotmapf.graphics.drawables import Circle
 from ozobotmapf.simulator.agents.agent import Agent
-from ozobotmapf.simulator.agents.path_drawable import UTurnCode, PathSegment, TurnSegment
-from ozobotmapf.utils.constants import PositionTypes
+from ozobotmapf.simulator.agents.marker_schedule import MarkerSchedule
+from ozobotmapf.simulator.agents.path_drawable import UTurnCode, PathSegment, TurnSegment, Trail
+from ozobotmapf.utils.constants import MarkerTypes, PositionTypes, TrailModes
 
 
 class OzobotAgent(Agent):
     """
     This agent is animating it's path in time, keeps Ozobot's limitations in mind, and uses Color Codes.
     Agent also supports curved paths.
+
+    In the `frames` trail mode, a segment of the current position is added every frame. In the `analytic` mode, the
+    whole visible trail (from `time - tail_lag` to `time`) is computed from the plan every frame, straight parts are
+    drawn as single lines and turns as arc pieces at fixed angles, so the trail does not depend on the frame rate.
+
+    Intersection indicators, paths before turns and U-turn Color Codes are placed by the marker events compiled from
+    the plan (`MarkerSchedule`) in both modes.
     """
+    TURN_PIECE_STEP = 1  # Degrees between the arc pieces of a turn in the analytic mode (as the frames mode at 60 FPS)
+
     def __init__(self, agent_id, raw_plans, ozomap, config):
         super().__init__(agent_id, raw_plans, ozomap, config)
-        self.tail = []
+        self.active_path = Trail(config.tail_lag, config.colors)
+        self.markers = MarkerSchedule(self.positions, config.step_time, config.colors)
+        self.__turn_line_end = 0  # Time until the path is drawn as a path before a turn (frames mode)
 
     def update_path(self, time):
-        self.active_path.clear()
-        self.__filter_tail(time)
-        self.__update_tail(time)
+        if self.config.trail_mode == TrailModes.ANALYTIC:
+            self.__build_trail(time)
+            return
+
+        self.active_path.update(time)
 
         position = self._get_position(time)
+        for event in self.markers.pop_due(position.time):
+            self.__add_marker(event)
         self.__add_path_segments(position)
 
-        if position.pos_tile.u_turn and not position.is_first_half:
-            self.__add_color_code(position, time)
-
-        self.__activate_tail()
+    def relayout(self, shift):
+        super().relayout(shift)
+        if shift is None:  # Trail cannot be scaled, a new one is drawn
+            self.active_path.clear()
+        else:
+            self.active_path.translate(*shift)
 
     def __add_path_segments(self, pos):
         if pos.get_type() == PositionTypes.WAIT:
@@ -35,53 +55,37 @@ class OzobotAgent(Agent):
                 self.__add_arc_segment(pos, True)
             else:
                 self.__add_arc_segment(pos)
+        elif pos.get_type() == PositionTypes.STOP and pos.is_turn():
+            self.__add_turn_wait_segment(pos, pos.time)
         else:
-            if self.config.colors and pos.should_print_intersection():
-                self.__add_intersection_segments(pos)
-            else:  # No intersection, just path
-                if not (pos.get_type() == PositionTypes.STOP and pos.is_turn()):
-                    self.__add_path_line_segments(pos)
-                else:
-                    self.__add_turn_wait_segment(pos)
+            self.__add_path_line_segments(pos)
 
     def __add_arc_segment(self, pos, full=False):
-        box_origin, s_angle, e_angle = pos.get_angle_from_position(self.config.tile_size, self.config.line_width, full)
+        box_origin, s_angle, e_angle = pos.get_angle_from_position(self.config.line_width, full)
         if box_origin:
-            self.tail.append(TurnSegment(
-                self._arc_drawable(box_origin, s_angle, e_angle),
-                pos.time, self.config.tail_lag, self.config.colors)
-            )
-
-    def __add_color_code(self, pos, time):
-        pos.pos_tile.u_turn = False
-        circle = Circle(pos.pos_tile.tile.get_middle(), self.config.color_code_radius)
-        code = UTurnCode(circle, time, self.config.tail_lag)
-        self.tail.append(code)
-
-    def __add_intersection_segments(self, pos):
+            self.active_path.append(TurnSegment(self._arc_drawable(box_origin, s_angle, e_angle), pos.time))
+
+    def __add_marker(self, event):
+        if event.type == MarkerTypes.INTERSECTION:
+            self.__add_intersection_segments(event)
+        elif event.type == MarkerTypes.TURN_LINE:
+            self.__turn_line_end = event.end
+        else:
+            self.__add_color_code(event)
+
+    def __add_color_code(self, event):
+        tile = self.positions[event.pos_id].tile
+        circle = Circle(self.ozomap.geometry.get_middle(tile.x_pos, tile.y_pos), self.config.color_code_radius)
+        self.active_path.append(UTurnCode(circle, event.time))
+
+    def __add_intersection_segments(self, event):
+        pos = self._get_half_position(event.pos_id, event.is_first_half, event.offset)
         point = pos.get_point_from_position(True)
         p1, p2 = self.__get_intersection_indicator_ends(point, pos)
-        if pos.prev_pos_tile.is_turn and pos.prev_pos_tile.is_start() and pos.pos_tile.intersection_cnt == 0:
-            # First intersection after Wait on Turn
-            pass
-        elif pos.next_pos_tile.is_turn and pos.pos_tile.intersection_cnt >= 2:  # Intersection right before a turn
-            self.tail.append(
-                TurnSegment(self._line_drawable(p1, p2), pos.time,
-                            self.config.tail_lag, self.config.colors)
-            )
-            self.tail.append(
-                TurnSegment(self._line_drawable(point, point.moved_direction(pos.pos_tile.from_dir, 15)), pos.time,
-                            self.config.tail_lag, self.config.colors)
-            )
-        else:  # Any other intersection
-            self.tail.append(
-                PathSegment(self._line_drawable(p1, p2), pos.time, self.config.tail_lag, self.config.colors)
-            )
-            self.tail.append(
-                PathSegment(self._line_drawable(point, point.moved_direction(pos.pos_tile.from_dir, 15)), pos.time,
-                            self.config.tail_lag, self.config.colors)
-            )
-        pos.pos_tile.intersection_cnt += 1
+        stub = point.moved_direction(pos.pos_tile.from_dir, 15)
+        segment = TurnSegment if event.is_turn else PathSegment  # Intersection right before a turn is a turn
+        self.active_path.append(segment(self._line_drawable(p1, p2), event.time))
+        self.active_path.append(segment(self._line_drawable(point, stub), event.time))
 
     def __get_intersection_indicator_ends(self, point, pos):
         dir1, dir2 = pos.get_normal_directions()
@@ -91,38 +95,161 @@ class OzobotAgent(Agent):
 
     def __add_path_line_segments(self, pos):
         point = pos.get_point_from_position(True)
-        if pos.next_pos_tile.is_turn and not pos.is_first_half and pos.offset >= 0.65:
-            # Path before a turn (but after the intersection)
-            self.tail.append(
-                TurnSegment(self._line_drawable(point, point), pos.time, self.config.tail_lag, self.config.colors)
-            )
+        if pos.time < self.__turn_line_end:  # Path before a turn (but after the intersection)
+            self.active_path.append(TurnSegment(self._line_drawable(point, point), pos.time))
         else:
-            self.tail.append(
-                PathSegment(self._line_drawable(point, point), pos.time, self.config.tail_lag, self.config.colors)
-            )
+            self.active_path.append(PathSegment(self._line_drawable(point, point), pos.time))
 
-    def __add_turn_wait_segment(self, pos):
-        entry = pos.get_tile().get_edge_middle(pos.pos_tile.previous_direction)
-        middle = pos.get_tile().get_middle()
+    def __add_turn_wait_segment(self, pos, time):
+        tile = pos.get_tile()
+        entry = self.ozomap.geometry.get_edge_middle(tile.x_pos, tile.y_pos, pos.pos_tile.previous_direction)
+        middle = self.ozomap.geometry.get_middle(tile.x_pos, tile.y_pos)
         p1 = middle.moved_direction(pos.pos_tile.previous_direction, self.config.tile_size / 3)
-        p2 = middle.moved_direction(pos.pos_tile.next_direction, self.config.tile_size / 3.5).moved_direction(pos.pos_tile.previous_direction, self.config.tile_size / 4)
-        self.tail.append(
-            PathSegment(self._line_drawable(entry, p1), pos.time,
-                        self.config.tail_lag, self.config.colors)
-        )
-        self.tail.append(
-            PathSegment(self._line_drawable(p1, p2), pos.time,
-                        self.config.tail_lag, self.config.colors)
-        )
-
-    def __filter_tail(self, time):
-        while len(self.tail) > 0 and not self.tail[0].is_valid(time):
-            self.tail = self.tail[1:]
-
-    def __update_tail(self, time):
-        for p_drawable in self.tail:
-            p_drawable.update(time)
-
-    def __activate_tail(self):
-        for p_drawable in self.tail:
-            self.active_path.add_drawable(p_drawable.drawable)
+        p2 = middle.moved_direction(pos.pos_tile.next_direction, self.config.tile_size / 3.5).move_direction(pos.pos_tile.previous_direction, self.config.tile_size / 4)
+        self.active_path.append(PathSegment(self._line_drawable(entry, p1), time))
+        self.active_path.append(PathSegment(self._line_drawable(p1, p2), time))
+
+    def __build_trail(self, time):
+        """Method computes the whole visible trail for the simulation time (analytic trail mode).
+
+        Note:
+            Every tile half in the visible time window is one piece of the trail. Pieces are cut at the color band
+            boundaries, so every drawable has one color, and drawables are added in the order of their times.
+            The head of a finished agent stays at its last position.
+
+        Args:
+            time (int): Current simulation time in milliseconds
+        """
+        self.active_path.clear()
+        step = self.config.step_time
+        end = min(max(time, 0), self.max_time)
+        start = min(max(time - self.config.tail_lag, 0), end)
+        band = self.active_path.palette.band_length
+        band_cuts = (time - 2 * band, time - band)
+        events = self.markers.get_events(start - step / 2, end)  # Path before a turn can start before the window
+
+        first_id = max(0, math.floor(start / step - 0.5))
+        last_id = min(len(self.positions) - 1, math.ceil(end / step + 0.5))
+        for pos_id in range(first_id, last_id + 1):
+            middle = pos_id * step
+            for is_first_half, half_start, half_end in ((True, middle - step / 2, middle),
+                                                        (False, middle, middle + step / 2)):
+                if is_first_half and pos_id == 0:  # Path starts in the middle of the first tile
+                    continue
+                piece_start, piece_end = max(start, half_start), min(end, half_end)
+                if piece_start >= piece_end:
+                    continue
+
+                self.__add_trail_piece(pos_id, is_first_half, half_start, piece_start, piece_end, band_cuts,
+                                       get_piece_events(events, pos_id, is_first_half))
+
+        self.active_path.update(time)
+
+        # Head is added after the update, so it keeps the newest color (as in the frames mode)
+        head_id = round(end / step)
+        is_first_half = end < head_id * step
+        half_start = head_id * step - step / 2 if is_first_half else head_id * step
+        turn_lines = [event for event in get_piece_events(events, head_id, is_first_half)
+                      if event.type == MarkerTypes.TURN_LINE]
+        self.__add_trail_piece(head_id, is_first_half, half_start, end, end, (), turn_lines)
+
+    def __add_trail_piece(self, pos_id, is_first_half, half_start, start, end, band_cuts, events):
+        """Method adds drawables of the trail between two times in one tile half (analytic trail mode).
+
+        Args:
+            pos_id (int): Position index in the tile path sequence
+            is_first_half (bool): Flag if the piece is in the first half of the tile
+            half_start (float): Time the agent enters the tile half in milliseconds
+            start (float): Start time of the piece in milliseconds
+            end (float): End time of the piece in milliseconds
+            band_cuts (tuple[float, float]): Times of the color band boundaries in milliseconds
+            events (list[MarkerEvent]): Marker events of the tile half sorted by time
+        """
+        for event in events:
+            if event.type == MarkerTypes.U_TURN and event.time >= start:
+                self.__add_color_code(event)
+
+        half_length = self.config.step_time / 2
+        pos = self._get_half_position(pos_id, is_first_half, (start - half_start) / half_length)
+        if pos.get_type() == PositionTypes.WAIT:
+            return
+
+        if pos.is_turn() and pos.get_type() != PositionTypes.STOP:
+            full = pos.prev_pos_tile.is_start() and pos.prev_pos_tile.is_turn and is_first_half
+            box_origin, s_angle, e_angle = pos.get_angle_from_position(self.config.line_width, full)
+            if box_origin:
+                end_pos = self._get_half_position(pos_id, is_first_half, (end - half_start) / half_length)
+                _, s_end, e_end = end_pos.get_angle_from_position(self.config.line_width, full)
+                self.__add_turn_arcs(box_origin, (s_angle, e_angle), (s_end, e_end), start, end)
+            return
+        if pos.get_type() == PositionTypes.STOP and pos.is_turn():  # Colored as the last frame of the wait
+            self.__add_turn_wait_segment(pos, end)
+            return
+
+        cuts = {cut: None for cut in band_cuts if start < cut < end}
+        turn_from = end
+        for event in events:
+            if event.type == MarkerTypes.INTERSECTION and start <= event.time <= end:
+                cuts[event.time] = event
+            elif event.type == MarkerTypes.TURN_LINE:
+                turn_from = event.time
+                if start < turn_from < end:
+                    cuts.setdefault(turn_from, None)
+
+        piece_start = start
+        for cut in sorted(cuts) + [end]:
+            self.__add_trail_line(pos_id, is_first_half, half_start, piece_start, cut, piece_start >= turn_from)
+            if cuts.get(cut) is not None:
+                self.__add_intersection_segments(cuts[cut])
+            piece_start = cut
+
+    def __add_turn_arcs(self, box_origin, start_arc, end_arc, start, end):
+        """Method adds a turn between two times as overlapping arc pieces (analytic trail mode).
+
+        Note:
+            A single wide arc drawn by pygame has pinholes inside the line. The frames mode overlaps an arc piece every
+            frame, so the turn is filled the same way: pieces of the same size are placed every `TURN_PIECE_STEP`
+            degrees. Pieces are placed on the multiples of the step, so they do not move between the frames.
+
+        Args:
+            box_origin (Point): Origin of the bounding box of the turn circle
+            start_arc (tuple[float, float]): Angles of the arc piece at the start time in degrees
+            end_arc (tuple[float, float]): Angles of the arc piece at the end time in degrees
+            start (float): Start time of the turn piece in milliseconds
+            end (float): End time of the turn piece in milliseconds
+        """
+        half_span = (start_arc[1] - start_arc[0]) / 2
+        first, last = start_arc[0] + half_span, end_arc[0] + half_span  # Middles of the first and the last piece
+        step = self.TURN_PIECE_STEP if last >= first else -self.TURN_PIECE_STEP
+        middles = [first] + [k * step for k in range(math.floor(first / step) + 1, math.ceil(last / step))]
+        if last != first:
+            middles.append(last)
+
+        for middle in middles:  # From the oldest piece, so the times are ordered
+            time = start if last == first else start + (end - start) * (middle - first) / (last - first)
+            arc = self._arc_drawable(box_origin, middle - half_span, middle + half_span)
+            self.active_path.append(TurnSegment(arc, time))
+
+    def __add_trail_line(self, pos_id, is_first_half, half_start, start, end, is_turn):
+        half_length = self.config.step_time / 2
+        point = self._get_half_position(pos_id, is_first_half,
+                                        (start - half_start) / half_length).get_point_from_position(True)
+        end_point = self._get_half_position(pos_id, is_first_half,
+                                            (end - half_start) / half_length).get_point_from_position(True)
+        segment = TurnSegment if is_turn else PathSegment  # Path before a turn (but after the intersection)
+        self.active_path.append(segment(self._line_drawable(point, end_point), start))
+# ------------------------------------------------------------------------------------------------------------
+
+
+def get_piece_events(events, pos_id, is_first_half):
+    """Function selects marker events of a tile half.
+
+    Args:
+        events (list[MarkerEvent]): Marker events sorted by time
+        pos_id (int): Position index in the tile path sequence
+        is_first_half (bool): Flag if the events should be in the first half of the tile
+
+    Returns:
+        list[MarkerEvent]: Events of the tile half sorted by time
+    """
+    return [event for event in events if event.pos_id == pos_id and event.is_first_half == is_first_half]
@@ -1,61 +1,212 @@
+import bisect
+from collections import deque
+
+from ozobotmapf.graphics.drawables import Drawable
 from ozobotmapf.utils.constants import Colors
 
 
+class TrailPalette:
+    """Immutable colors of a trail, shared by all its segments.
+
+    The tail is split into three time bands of the same length (`tail_lag / 3`). Path segments take the color of the
+    band their age falls into, so colors are computed once per band and frame, not for every segment.
+
+    Attributes:
+        band_length (float): Length of one color band in milliseconds
+        band_colors (tuple): Colors of the bands from the oldest to the newest
+        turn_color (tuple[int, int, int]): Color of the segments around turns
+        code_colors (tuple): Colors of the flashing U-turn Color Code
+    """
+
+    __slots__ = ("band_length", "band_colors", "turn_color", "code_colors")
+
+    CODE_SWITCH_TIME = 42  # How long is one color of the flashing Color Code displayed in milliseconds
+
+    def __init__(self, tail_lag, is_colored):
+        """Initialization of the TrailPalette instance.
+
+        Args:
+            tail_lag (int): Time lag of the tail in milliseconds
+            is_colored (bool): Flag if the path segments should be colored (black otherwise)
+        """
+        self.band_length = tail_lag / 3
+        if is_colored:
+            self.band_colors = (Colors.RED, Colors.BLACK, Colors.BLUE)
+            self.turn_color = Colors.BLUE
+        else:
+            self.band_colors = (Colors.BLACK, Colors.BLACK, Colors.BLACK)
+            self.turn_color = Colors.BLACK
+        self.code_colors = (Colors.RED, Colors.YELLOW, Colors.CYAN, Colors.YELLOW)
+
+    def code_color(self, age):
+        """Method returns the color of the flashing Color Code.
+
+        Args:
+            age (float): Time since the Color Code was displayed in milliseconds
+
+        Returns:
+            tuple[int, int, int]: Current color of the Color Code
+        """
+        return self.code_colors[int(age // self.CODE_SWITCH_TIME) % len(self.code_colors)]
+
+
 class PathDrawable:
-    def __init__(self, drawable, time, duration):
+    """Drawable of the trail, it keeps only the time it was created at.
+
+    Attributes:
+        drawable (Drawable): Drawn object
+        time (float): Simulation time of creation in milliseconds
+    """
+
+    __slots__ = ("drawable", "time")
+
+    BANDED = False  # Flag if the color is given by the color band of the segment
+
+    def __init__(self, drawable, time):
         self.drawable = drawable
-        self.valid_until = time + duration
+        self.time = time
 
-    def is_valid(self, time):
-        return True if time <= self.valid_until else False
+    def get_color(self, palette, time):
+        """Method returns the color of a segment that is not banded.
 
-    def update(self, time):
-        pass
+        Args:
+            palette (TrailPalette): Colors of the trail
+            time (float): Current simulation time in milliseconds
+
+        Returns:
+            tuple[int, int, int]: Current color of the segment
+        """
+        return self.drawable.color
 
 
 class PathSegment(PathDrawable):
-    def __init__(self, drawable, time, duration, is_colored):
-        super().__init__(drawable, time, duration)
-        self.is_colored = is_colored
-        colored_time = duration / 3
-        self.color_times = [time + colored_time, time + (2 * colored_time), time + (3 * colored_time)]
-        self.colors = [Colors.BLUE, Colors.BLACK, Colors.RED]
-        if self.is_colored:
-            self.drawable.color = self.colors[0]
+    __slots__ = ()
 
-    def update(self, time):
-        if self.is_colored:
-            if time <= self.color_times[0]:
-                self.drawable.color = self.colors[0]
-            elif time <= self.color_times[1]:
-                self.drawable.color = self.colors[1]
-            else:
-                self.drawable.color = self.colors[2]
+    BANDED = True
 
 
 class TurnSegment(PathDrawable):
-    def __init__(self, drawable, time, duration, is_colored):
-        super().__init__(drawable, time, duration)
-        self.is_colored = is_colored
-        if self.is_colored:
-            self.drawable.color = Colors.BLUE
+    __slots__ = ()
 
-    def update(self, time):
-        pass
+    def get_color(self, palette, time):
+        return palette.turn_color
 
 
 class UTurnCode(PathDrawable):
-    def __init__(self, drawable, time, duration):
-        super().__init__(drawable, time, duration)
-        self.last_switch = time
-        self.next_switch = time + 42
-        self.current_color = 0
-        self.colors = [Colors.RED, Colors.YELLOW, Colors.CYAN, Colors.YELLOW]
-        self.drawable.color = self.colors[self.current_color]
+    __slots__ = ()
+
+    def get_color(self, palette, time):
+        return palette.code_color(time - self.time)
+
+
+class Trail(Drawable):
+    """Trail of an agent, the drawables are kept in order of their creation and drawn by color bands.
+
+    Note:
+        Band boundaries are found by bisection of the creation times once per frame. Drawables are not recolored,
+        they are drawn in the color of their band (`Drawable.draw_colored`). Drawables added after the last update
+        are always in the newest band (the head of a finished agent keeps the newest color).
+
+    Attributes:
+        tail_lag (int): Time lag of the tail in milliseconds (lifetime of the drawables)
+        palette (TrailPalette): Colors of the trail
+        time (float): Current simulation time in milliseconds
+    """
+
+    __slots__ = ("tail_lag", "palette", "time", "__segments", "__times", "__head")
+
+    def __init__(self, tail_lag, is_colored):
+        """Initialization of the Trail instance.
+
+        Args:
+            tail_lag (int): Time lag of the tail in milliseconds
+            is_colored (bool): Flag if the path segments should be colored
+        """
+        self.tail_lag = tail_lag
+        self.palette = TrailPalette(tail_lag, is_colored)
+        self.time = 0
+
+        self.__segments = deque()
+        self.__times = deque()  # Creation times of the segments (for bisection)
+        self.__head = 0  # Index of the first drawable added after the last update
 
     def update(self, time):
-        if time >= self.next_switch:
-            self.last_switch = self.next_switch
-            self.next_switch = self.next_switch + 42
-            self.current_color += 1
-            self.drawable.color = self.colors[self.current_color % 4]
+        """Method sets the current time and drops drawables that are older than the tail lag.
+
+        Args:
+            time (float): Current simulation time in milliseconds
+        """
+        self.time = time
+        while self.__times and self.__times[0] + self.tail_lag < time:
+            self.__times.popleft()
+            self.__segments.popleft()
+        self.__head = len(self.__segments)
+
+    def append(self, segment):
+        """Method adds a new drawable to the head of the trail.
+
+        Args:
+            segment (PathDrawable): New drawable (it must not be older than the last one)
+        """
+        self.__segments.append(segment)
+        self.__times.append(segment.time)
+
+    def translate(self, dx, dy):
+        for segment in self.__segments:
+            segment.drawable.translate(dx, dy)
+
+    def clear(self):
+        """Method drops all drawables of the trail."""
+        self.__segments.clear()
+        self.__times.clear()
+        self.__head = 0
+
+    def get_bands(self):
+        """Method splits the trail into color bands for the current time.
+
+        Returns:
+            list[tuple[int, tuple[int, int, int]]]: Index of the first drawable after the band and the band color
+        """
+        black_from = bisect.bisect_left(self.__times, self.time - 2 * self.palette.band_length, 0, self.__head)
+        blue_from = bisect.bisect_left(self.__times, self.time - self.palette.band_length, black_from, self.__head)
+        red, black, blue = self.palette.band_colors
+        return [(black_from, red), (blue_from, black), (len(self.__segments), blue)]
+
+    def draw(self, screen):
+        palette, time = self.palette, self.time
+        segments = iter(self.__segments)
+        start = 0
+        for end, color in self.get_bands():
+            for _ in range(end - start):
+                segment = next(segments)
+                if segment.BANDED:
+                    segment.drawable.draw_colored(screen, color)
+                else:
+                    segment.drawable.draw_colored(screen, segment.get_color(palette, time))
+            start = end
+
+    def submit(self, renderer, color=None):
+        palette, time = self.palette, self.time
+        segments = iter(self.__segments)
+        start = 0
+        for end, band_color in self.get_bands():
+            dots = []  # Consecutive dots of the band are passed at once
+            for _ in range(end - start):
+                segment = next(segments)
+                if segment.BANDED and segment.drawable.IS_DOT:
+                    dots.append(segment.drawable)
+                    continue
+                renderer.add_dots(dots, band_color)  # Dots before the drawable are drawn under it
+                dots = []
+                if segment.BANDED:
+                    segment.drawable.submit(renderer, band_color)
+                else:
+                    segment.drawable.submit(renderer, segment.get_color(palette, time))
+            renderer.add_dots(dots, band_color)
+            start = end
+
+    def __len__(self):
+        return len(self.__segments)
+
+    def __iter__(self):
+        return (segment.drawable for segment in self.__segments)
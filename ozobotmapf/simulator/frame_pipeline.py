@@ -0,0 +1,158 @@
+import collections
+import logging
+import math
+import queue
+import threading
+
+import pygame
+
+
+class FramePipeline:
+    """Render-ahead pipeline, upcoming frames are rendered by a worker thread while the main thread displays them.
+
+    The worker thread updates the agents and renders every frame into an off-screen surface for the time the frame is
+    going to be displayed, the latency budget ahead of the current time. The main thread only handles events and flips
+    finished frames on schedule, so a slow frame (garbage collection, a log flush) is absorbed by the frames already
+    waiting in the queue instead of causing a visible stutter.
+
+    Note:
+        Frames show the simulation time they are displayed at, so the trail is not delayed, only the reaction to the
+        input (viewport changes) is delayed by the latency budget. Number of the surfaces limits how far ahead the
+        worker gets. A frame that missed its time is skipped if a newer frame is already due, otherwise it is late.
+
+    Attributes:
+        latency (float): Latency budget (how far ahead the frames are rendered) in milliseconds
+        shown (int): Number of the displayed frames
+        skipped (int): Number of the frames skipped because a newer frame was already due
+        late (int): Number of the frames displayed more than one frame time after their time
+    """
+
+    FRAME_TIME = 1000 / 60  # Time between two rendered frames in milliseconds
+    POLL_TIME = 5  # Longest wait of the main thread without handling events in milliseconds
+    END = None  # Queue item following the last frame
+
+    def __init__(self, render, timer, end_time, screen, latency):
+        """Initialization of the FramePipeline instance.
+
+        Args:
+            render (callable): Function `render(time, surface)` drawing the frame of a simulation time onto a surface,
+                it is called only by the worker thread
+            timer (Timer): Started simulation timer
+            end_time (int): Simulation time of the last frame in milliseconds
+            screen (pygame.Surface): Display surface, the frames are copied onto it
+            latency (float): Latency budget in milliseconds
+        """
+        self.latency = latency
+        self.shown = 0
+        self.skipped = 0
+        self.late = 0
+
+        self.__render = render
+        self.__timer = timer
+        self.__end_time = end_time
+        self.__screen = screen
+
+        self.__free = queue.Queue()  # Surfaces that can be rendered into
+        for _ in range(max(1, math.ceil(latency / self.FRAME_TIME)) + 1):  # Queued frames and the rendered one
+            self.__free.put(screen.copy())
+        self.__ready = queue.Queue()  # Rendered frames (time, surface), END or an exception of the worker
+        self.__frames = collections.deque()  # Frames received by the main thread
+        self.__stopped = threading.Event()
+        self.__worker = threading.Thread(target=self.__produce, name="FramePipeline", daemon=True)
+
+    def start(self):
+        """Method starts the worker thread."""
+        logging.info("Starting the render-ahead pipeline (latency budget {} ms).".format(self.latency))
+        self.__worker.start()
+
+    def stop(self):
+        """Method stops the worker thread and logs the statistics of the displayed frames."""
+        if self.__stopped.is_set():
+            return
+        self.__stopped.set()
+        self.__worker.join()
+        logging.info("Render-ahead pipeline stopped: {} frames displayed, {} skipped, {} late."
+                     .format(self.shown, self.skipped, self.late))
+
+    def present(self):
+        """Method displays the newest due frame, it waits at most `POLL_TIME` for it (called by the main thread).
+
+        Returns:
+            bool: False if the last frame was already displayed
+
+        Raises:
+            Exception: Exception raised by the worker thread
+        """
+        self.__receive()
+        if not self.__frames:
+            return True
+
+        now = self.__timer.get_time()
+        while len(self.__frames) > 1 and self.__frames[1] is not self.END and self.__frames[1][0] <= now:
+            self.__free.put(self.__frames.popleft()[1])
+            self.skipped += 1
+
+        frame = self.__frames[0]
+        if frame is self.END:
+            return False
+        time, surface = frame
+        if time > now:
+            pygame.time.wait(min(math.ceil(time - now), self.POLL_TIME))
+            return True
+
+        self.__frames.popleft()
+        if now - time > self.FRAME_TIME:
+            self.late += 1
+        self.__screen.blit(surface, (0, 0))
+        self.__free.put(surface)
+        pygame.display.update()
+        self.shown += 1
+        return True
+
+    def __receive(self):
+        """Method moves the rendered frames from the queue, it waits for one only if no frame is received."""
+        try:
+            if self.__frames:
+                item = self.__ready.get_nowait()
+            else:
+                item = self.__ready.get(timeout=self.POLL_TIME / 1000)
+            while True:
+                if isinstance(item, Exception):
+                    raise item
+                self.__frames.append(item)
+                item = self.__ready.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __produce(self):
+        """Main loop of the worker thread, frames are rendered until the last one or until the pipeline is stopped.
+
+        Every frame is rendered for the time the latency budget ahead, but at least one frame time after the previous
+        one. Exceptions are passed to the main thread.
+        """
+        try:
+            time = None
+            while time != self.__end_time:
+                surface = self.__take_surface()
+                if surface is None:
+                    return
+                ahead = self.__timer.get_time() + self.latency
+                time = min(self.__end_time, round(ahead if time is None else max(time + self.FRAME_TIME, ahead)))
+                self.__render(time, surface)
+                self.__ready.put((time, surface))
+            self.__ready.put(self.END)
+        except Exception as exception:
+            self.__ready.put(exception)
+
+    def __take_surface(self):
+        """Method waits for a free surface.
+
+        Returns:
+            pygame.Surface: Surface for the next frame (None if the pipeline was stopped)
+        """
+        while not self.__stopped.is_set():
+            try:
+                return self.__free.get(timeout=self.POLL_TIME / 1000)
+            except queue.Empty:
+                pass
+        return None
@@ -0,0 +1,204 @@
+import csv
+import json
+import logging
+import math
+import time
+from array import array
+
+
+class FrameProfiler:
+    """Class measures how the frame time is split between the phases of the Simulator main loop.
+
+    Every phase of a frame is timestamped with `time.perf_counter_ns`. Samples are stored as raw nanoseconds and
+    aggregated into percentiles and histograms only when the report is created. Counters (e.g. draw calls) are stored
+    once per frame as well.
+
+    Attributes:
+        budget_ns (int): Frame time budget in nanoseconds (None if frames over budget should not be logged)
+        phases (dict[str, array]): Duration samples of every phase in nanoseconds
+        agent_types (dict[str, array]): Duration samples of agent updates grouped by the agent class name
+        frames (array): Duration samples of whole frames in nanoseconds
+        counters (dict[str, array]): Per frame samples of the counters
+        over_budget (int): Number of frames that exceeded the budget
+    """
+
+    PHASES = ("events", "update", "draw_map", "draw_paths", "display")
+
+    def __init__(self, budget_ms=None):
+        """Initialization of the FrameProfiler instance.
+
+        Args:
+            budget_ms (float): Frame time budget in milliseconds, frames over budget are logged (None to disable)
+        """
+        self.budget_ns = None if budget_ms is None else int(budget_ms * 1000000)
+        self.phases = {phase: array('q') for phase in self.PHASES}
+        self.agent_types = {}
+        self.frames = array('q')
+        self.counters = {}
+        self.over_budget = 0
+
+        self.__frame_start = 0
+        self.__last_mark = 0
+
+    def start_frame(self):
+        """Method marks the beginning of a new frame."""
+        self.__frame_start = self.__last_mark = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """Method marks the end of a frame phase that started with the previous mark.
+
+        Args:
+            phase (str): Name of the phase (one of `PHASES`)
+        """
+        now = time.perf_counter_ns()
+        self.phases[phase].append(now - self.__last_mark)
+        self.__last_mark = now
+
+    def add_agent_sample(self, agent_type, duration_ns):
+        """Method stores duration of a single agent update.
+
+        Args:
+            agent_type (str): Name of the agent class
+            duration_ns (int): Duration of the update in nanoseconds
+        """
+        if agent_type not in self.agent_types:
+            self.agent_types[agent_type] = array('q')
+        self.agent_types[agent_type].append(duration_ns)
+
+    def add_counter(self, name, value):
+        """Method stores the value of a counter in the current frame.
+
+        Args:
+            name (str): Name of the counter
+            value (int): Value of the counter
+        """
+        if name not in self.counters:
+            self.counters[name] = array('q')
+        self.counters[name].append(value)
+
+    def end_frame(self, sim_time):
+        """Method marks the end of the current frame.
+
+        Args:
+            sim_time (int): Simulation time of the frame in milliseconds (used for logging)
+        """
+        duration = time.perf_counter_ns() - self.__frame_start
+        self.frames.append(duration)
+        if self.budget_ns is not None and duration > self.budget_ns:
+            self.over_budget += 1
+            logging.warning("Frame at {} ms took {:.2f} ms (budget {:.2f} ms): {}".format(
+                sim_time, duration / 1000000, self.budget_ns / 1000000, self.__last_frame_phases()))
+
+    def report(self):
+        """Method aggregates all collected samples.
+
+        Returns:
+            dict: Statistics of frames, phases, agent types and counters
+        """
+        return {
+            "frames": len(self.frames),
+            "over_budget": self.over_budget,
+            "budget_ms": None if self.budget_ns is None else self.budget_ns / 1000000,
+            "frame": summarize(self.frames),
+            "phases": {phase: summarize(samples) for phase, samples in self.phases.items()},
+            "agent_types": {agent_type: summarize(samples) for agent_type, samples in self.agent_types.items()},
+            "counters": {name: summarize_counts(samples) for name, samples in self.counters.items()},
+        }
+
+    def dump(self, path_prefix):
+        """Method writes the report into a JSON file and a CSV file.
+
+        Args:
+            path_prefix (str): Path of the output files without extension
+        """
+        report = self.report()
+        with open(path_prefix + ".json", "w") as file:
+            json.dump(report, file, indent=2)
+
+        with open(path_prefix + ".csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["group", "name", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+            rows = [("frame", "total", report["frame"])]
+            rows += [("phase", phase, stats) for phase, stats in report["phases"].items()]
+            rows += [("agent_type", agent_type, stats) for agent_type, stats in report["agent_types"].items()]
+            for group, name, stats in rows:
+                writer.writerow([group, name, stats["count"], stats["mean_ms"], stats["p50_ms"], stats["p95_ms"],
+                                 stats["p99_ms"], stats["max_ms"]])
+
+        logging.info("Frame profile written to '{}.json' and '{}.csv'.".format(path_prefix, path_prefix))
+
+    def __last_frame_phases(self):
+        """Returns a readable split of the last frame into phases (with the counters of the frame)."""
+        phases = ["{}: {:.2f} ms".format(phase, samples[-1] / 1000000)
+                  for phase, samples in self.phases.items() if samples]
+        counters = ["{}: {}".format(name, samples[-1]) for name, samples in self.counters.items() if samples]
+        return ", ".join(phases + counters)
+# ------------------------------------------------------------------------------------------------------------
+
+
+def summarize(samples):
+    """Function computes statistics of duration samples.
+
+    Histogram buckets are powers of two in microseconds, the key is the upper bound of the bucket.
+
+    Args:
+        samples (array): Duration samples in nanoseconds
+
+    Returns:
+        dict: Count, mean, percentiles (p50, p95, p99), max (all in milliseconds) and histogram of the samples
+    """
+    if len(samples) == 0:
+        return {"count": 0, "mean_ms": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0, "max_ms": 0, "histogram_us": {}}
+
+    ordered = sorted(samples)
+    histogram = {}
+    for sample in ordered:
+        bucket = 1 << max(0, math.ceil(math.log2(max(sample, 1) / 1000)))
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) / 1000000, 4),
+        "p50_ms": round(percentile(ordered, 50) / 1000000, 4),
+        "p95_ms": round(percentile(ordered, 95) / 1000000, 4),
+        "p99_ms": round(percentile(ordered, 99) / 1000000, 4),
+        "max_ms": round(ordered[-1] / 1000000, 4),
+        "histogram_us": {str(bucket): count for bucket, count in sorted(histogram.items())},
+    }
+
+
+def summarize_counts(samples):
+    """Function computes statistics of per frame counter samples.
+
+    Args:
+        samples (array): Counter values of the frames
+
+    Returns:
+        dict: Count of the frames, mean, percentiles (p50, p95, p99) and max of the values
+    """
+    if len(samples) == 0:
+        return {"count": 0, "mean": 0, "p50": 0, "p95": 0, "p99": 0, "max": 0}
+
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+def percentile(ordered, pct):
+    """Function returns a percentile of sorted samples (nearest-rank method).
+
+    Args:
+        ordered (list[int]): Sorted samples
+        pct (float): Percentile in range (0, 100]
+
+    Returns:
+        int: Sample at the given percentile
+    """
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -2,14 +2,17 @@ from ozobotmapf.utils.constants import Directions, PositionTypes
 
 
 class PathPosition:
-    def __init__(self, time, max_time):
-        if time < 0:
-            self.time = 0
-        elif time > max_time:
-            self.time = max_time
-        else:
-            self.time = time
+    __slots__ = ("time", "geometry", "pos_tile", "next_pos_tile", "prev_pos_tile", "enter_time", "middle_time",
+                 "leave_time", "offset", "is_first_half")
+
+    LEFT_TURNS = {(Directions.UP, Directions.RIGHT), (Directions.DOWN, Directions.LEFT),
+                  (Directions.RIGHT, Directions.DOWN), (Directions.LEFT, Directions.UP)}
 
+    def __init__(self, time, max_time, geometry):
+        self.time = 0
+        self.set_time(time, max_time)
+
+        self.geometry = geometry
         self.pos_tile = None
         self.next_pos_tile = None
         self.prev_pos_tile = None
@@ -17,6 +20,20 @@ class PathPosition:
         self.offset = 0
         self.is_first_half = False
 
+    def set_time(self, time, max_time):
+        """Method sets the simulation time of the position (the position can be reused for another time).
+
+        Args:
+            time (float): Simulation time in milliseconds (limited to the path duration)
+            max_time (int): Time of the end of the path in milliseconds
+        """
+        if time < 0:
+            self.time = 0
+        elif time > max_time:
+            self.time = max_time
+        else:
+            self.time = time
+
     def set_position_tile(self, pos, next_pos, prev_pos):
         self.pos_tile = pos
         self.next_pos_tile = next_pos
@@ -34,6 +51,16 @@ class PathPosition:
             self.offset = (self.time - middle) / (leave - middle)
             self.is_first_half = False
 
+    def set_half(self, is_first_half, offset):
+        """Method places the position into a half of the tile directly (the path can be sampled at any offset).
+
+        Args:
+            is_first_half (bool): Flag if the position is in the first half of the tile
+            offset (float): Relative position in the half <0, 1>
+        """
+        self.is_first_half = is_first_half
+        self.offset = offset
+
     def get_tile(self):
         return self.pos_tile.tile
 
@@ -44,72 +71,44 @@ class PathPosition:
         return self.pos_tile.type
 
     def get_point_from_position(self, bounded=False):
-        middle = self.get_tile().get_middle()
+        tile = self.get_tile()
         if self.is_first_half:
-            point_from = self.get_tile().get_edge_middle(self.pos_tile.from_dir)
-            point_to = middle
+            point_from = self.geometry.get_edge_middle(tile.x_pos, tile.y_pos, self.pos_tile.from_dir)
+            point_to = self.geometry.get_middle(tile.x_pos, tile.y_pos)
         else:
-            point_from = middle
-            point_to = self.get_tile().get_edge_middle(self.pos_tile.to_dir)
+            point_from = self.geometry.get_middle(tile.x_pos, tile.y_pos)
+            point_to = self.geometry.get_edge_middle(tile.x_pos, tile.y_pos, self.pos_tile.to_dir)
 
-        position = point_from.offset_to(point_to, self.offset)
+        position = point_from.move_offset_to(point_to, self.offset)  # point_from is a new point
         return self.__bound_position_from_middle(position) if bounded else position
 
     def __bound_position_from_middle(self, position):
         if self.get_type() == PositionTypes.STOP:
             # Stop path before the tile middle
-            enter = self.get_tile().get_edge_middle(self.pos_tile.from_dir)
-            middle = self.get_tile().get_middle()
-            bound = enter.offset_to(middle, 0.5)
+            tile = self.get_tile()
+            enter = self.geometry.get_edge_middle(tile.x_pos, tile.y_pos, self.pos_tile.from_dir)
+            middle = self.geometry.get_middle(tile.x_pos, tile.y_pos)
+            bound = enter.move_offset_to(middle, 0.5)
             if bound.dist_to(middle) > position.dist_to(middle):
                 return bound
 
         return position
 
-    def get_angle_from_position(self, tile_size, line_width, full=False):
-        origin, s_angle, e_angle = None, None, None
-
+    def get_angle_from_position(self, line_width, full=False):
         if not self.is_first_half and self.get_type() == PositionTypes.STOP:
-            return origin, s_angle, e_angle
+            return None, None, None
 
         from_dir = self.pos_tile.previous_direction
         to_dir = self.pos_tile.next_direction
-        origin = self.pos_tile.tile.get_middle().moved(-line_width / 2, -line_width / 2)
-
-        if from_dir == Directions.UP:
-            if to_dir == Directions.RIGHT:  # Left turn from Up (3)
-                s_angle, e_angle = self.__left_turn_angles(from_dir, full)
-                origin = origin.moved_direction(Directions.UP, tile_size)
-            elif to_dir == Directions.LEFT:  # Right turn from Up (4)
-                s_angle, e_angle = self.__right_turn_angles(from_dir, full)
-                origin = origin.moved(-tile_size, -tile_size)
-                return origin, s_angle, e_angle
-        elif from_dir == Directions.DOWN:
-            if to_dir == Directions.RIGHT:  # Right turn from Down (1)
-                s_angle, e_angle = self.__right_turn_angles(from_dir, full)
-                return origin, s_angle, e_angle
-            elif to_dir == Directions.LEFT:  # Left turn from Down (2)
-                s_angle, e_angle = self.__left_turn_angles(from_dir, full)
-                origin = origin.moved_direction(Directions.LEFT, tile_size)
-                return origin, s_angle, e_angle
-        elif from_dir == Directions.RIGHT:
-            if to_dir == Directions.UP:  # Right turn from Right (3)
-                s_angle, e_angle = self.__right_turn_angles(from_dir, full)
-                origin = origin.moved_direction(Directions.UP, tile_size)
-                return origin, s_angle, e_angle
-            elif to_dir == Directions.DOWN:  # Left turn from Right (1)
-                s_angle, e_angle = self.__left_turn_angles(from_dir, full)
-                return origin, s_angle, e_angle
-        elif from_dir == Directions.LEFT:
-            if to_dir == Directions.UP:  # Left turn from Left (4)
-                s_angle, e_angle = self.__left_turn_angles(from_dir, full)
-                origin = origin.moved(-tile_size, -tile_size)
-            elif to_dir == Directions.DOWN:  # Right turn from Left (2)
-                s_angle, e_angle = self.__right_turn_angles(from_dir, full)
-                origin = origin.moved_direction(Directions.LEFT, tile_size)
-        else:
+        tile = self.get_tile()
+        origin = self.geometry.get_arc_origin(tile.x_pos, tile.y_pos, from_dir, to_dir, line_width)
+        if origin is None:
             raise Exception("Getting arc path angle, but it is not a turn.")
 
+        if (from_dir, to_dir) in self.LEFT_TURNS:
+            s_angle, e_angle = self.__left_turn_angles(from_dir, full)
+        else:
+            s_angle, e_angle = self.__right_turn_angles(from_dir, full)
         return origin, s_angle, e_angle
 
     def __left_turn_angles(self, from_dir, full=False):
@@ -157,22 +156,6 @@ class PathPosition:
         else:
             return angle2, angle1
 
-    def should_print_intersection(self):
-        if self.next_pos_tile.is_turn and self.next_pos_tile.is_stop():
-            return ((not self.is_turn()) and self.is_first_half and self.offset >= 0.45 and
-                    self.pos_tile.intersection_cnt < 1 and self.get_type() == PositionTypes.PASS) or \
-                   ((not self.is_turn()) and (not self.is_first_half) and self.offset >= 0.03 and
-                    self.pos_tile.intersection_cnt < 2 and self.get_type() == PositionTypes.PASS) or \
-                   ((not self.is_turn()) and (not self.is_first_half) and self.offset >= 0.6 and
-                    self.pos_tile.intersection_cnt < 3 and self.get_type() == PositionTypes.PASS)
-        else:
-            return ((not self.is_turn()) and self.is_first_half and self.offset >= 0.45 and
-                    self.pos_tile.intersection_cnt < 1 and self.get_type() == PositionTypes.PASS) or \
-                   ((not self.is_turn()) and (not self.is_first_half) and self.offset >= 0.1 and
-                    self.pos_tile.intersection_cnt < 2 and self.get_type() == PositionTypes.PASS) or \
-                   ((not self.is_turn()) and (not self.is_first_half) and self.offset >= 0.75 and
-                    self.pos_tile.intersection_cnt < 3 and self.get_type() == PositionTypes.PASS)
-
     def get_normal_directions(self):
         direction = self.pos_tile.from_dir if self.is_first_half else self.pos_tile.to_dir
         if direction in Directions.HORIZONTAL:
@@ -2,6 +2,8 @@ from ozobotmapf.utils.constants import PositionTypes, Directions
 
 
 class PositionTile:
+    __slots__ = ("tile", "from_dir", "to_dir", "previous_direction", "next_direction", "type", "is_turn", "u_turn")
+
     def __init__(self, tile, from_dir, to_dir):
         self.tile = tile
         self.from_dir = from_dir
@@ -13,7 +15,6 @@ class PositionTile:
         self.type = self.__get_type()
         self.is_turn = False
         self.u_turn = False
-        self.intersection_cnt = 0
 
     def __get_type(self):
         if self.from_dir == Directions.NONE and self.to_dir == Directions.NONE:
@@ -0,0 +1,85 @@
+import logging
+
+
+class QualityController:
+    """Adaptive quality, costly features are degraded one by one to keep the frame time within a budget.
+
+    Measured frame times are smoothed by an exponential moving average. When the average exceeds the budget, the next
+    feature of the list is degraded. The time the degradation saved is measured, and the last degraded feature is
+    restored when the average with this time added falls below `RESTORE_RATIO` of the budget. Features are ordered from
+    the least to the most visible, so they are degraded in this order and restored in the opposite one. Every change
+    is logged.
+
+    Note:
+        After every change the controller holds for a number of frames, so the effect of the change is measured before
+        the next one. Restoring waits longer than degrading and needs a margin under the budget (hysteresis), so
+        a feature is not switched on and off every few frames.
+
+    Attributes:
+        budget (float): Frame time budget in milliseconds
+        features (list[tuple[str, callable]]): Names of the features and functions `set_degraded(bool)` switching them
+        level (int): Number of the degraded features (from the start of the list)
+        average (float): Exponential moving average of the frame time in milliseconds (None before the first frame)
+        changes (int): Number of the degradations and restorations
+    """
+
+    SMOOTHING = 0.1  # Weight of the new frame time in the moving average
+    RESTORE_RATIO = 0.7  # Part of the budget the average has to fall below to restore a feature
+    DEGRADE_HOLD = 30  # Number of frames after a change before a feature is degraded
+    RESTORE_HOLD = 120  # Number of frames after a change before a feature is restored
+
+    def __init__(self, budget, features):
+        """Initialization of the QualityController instance.
+
+        Args:
+            budget (float): Frame time budget in milliseconds
+            features (list[tuple[str, callable]]): Features from the least to the most visible, every feature is
+                a name and a function `set_degraded(bool)` switching its quality
+        """
+        self.budget = budget
+        self.features = features
+        self.level = 0
+        self.average = None
+        self.changes = 0
+
+        self.__hold = 0  # Frames since the last change
+        self.__costs = []  # Frame time saved by every degraded feature in milliseconds
+        self.__before = None  # Average before the last degradation (until its effect is measured)
+
+    def add_frame(self, frame_time):
+        """Method adds a measured frame time and degrades or restores a feature if needed.
+
+        Args:
+            frame_time (float): Time of the frame in milliseconds
+        """
+        if self.average is None:
+            self.average = frame_time
+        else:
+            self.average += self.SMOOTHING * (frame_time - self.average)
+        self.__hold += 1
+        if self.__before is not None and self.__hold >= self.DEGRADE_HOLD:
+            self.__costs[-1] = max(0.0, self.__before - self.average)
+            self.__before = None
+
+        if self.average > self.budget and self.__hold >= self.DEGRADE_HOLD and self.level < len(self.features):
+            name, set_degraded = self.features[self.level]
+            set_degraded(True)
+            self.level += 1
+            self.__before = self.average
+            self.__costs.append(0.0)
+            logging.warning("Frame time {:.1f} ms is over the budget {} ms, quality degraded: {} (level {}/{})."
+                            .format(self.average, self.budget, name, self.level, len(self.features)))
+            self.__changed()
+        elif (self.level > 0 and self.__hold >= self.RESTORE_HOLD
+              and self.average + self.__costs[-1] < self.budget * self.RESTORE_RATIO):
+            self.level -= 1
+            self.__costs.pop()
+            name, set_degraded = self.features[self.level]
+            set_degraded(False)
+            logging.info("Frame time {:.1f} ms is under the budget {} ms, quality restored: {} (level {}/{})."
+                         .format(self.average, self.budget, name, self.level, len(self.features)))
+            self.__changed()
+
+    def __changed(self):
+        self.changes += 1
+        self.__hold = 0
@@ -0,0 +1,236 @@
+import logging
+import struct
+from multiprocessing import shared_memory
+
+from ozobotmapf.simulator.agents.agent import Agent
+from ozobotmapf.simulator.timeline_exception import TimelineException
+
+
+class SharedTimeline:
+    """Compiled timelines of all agents stored in a shared memory block.
+
+    The timeline is compiled once by the main process, other processes (tiled output, exports, analytics) attach to
+    the block by its name and read the arrays without copying them. All values are little-endian.
+
+    Layout:
+        Header (32 B): magic `b"OZTL"` (4s), version (H), reserved (H), agent count (I), keyframe count (I),
+        map width (I), map height (I), step time in milliseconds (I), tail lag in milliseconds (I)
+
+        Agent table (16 B per agent): agent ID (I), index of the first keyframe (I), number of keyframes (I),
+        time of the last keyframe in milliseconds (I)
+
+        Keyframe arrays (one value per keyframe, keyframes of an agent are consecutive):
+            - tile IDs (int32), tile columns (int32), tile rows (int32), keyframe times in milliseconds (int32)
+            - middle of the tile relative to the grid origin in pixels of the physical scale, x and y (float32)
+            - entry and exit directions (int8, `Directions`), flags (uint8, `TURN` and `U_TURN` bits)
+
+    Note:
+        Keyframe `i` of an agent is the middle of its `i`-th tile, reached at `i * step_time`. Positions after the
+        last move are trimmed the same way as by the `Agent`.
+
+    Attributes:
+        name (str): Name of the shared memory block
+        agent_count (int): Number of agents
+        keyframe_count (int): Number of keyframes of all agents
+        map_width (int): Width of the map in tiles
+        map_height (int): Height of the map in tiles
+        step_time (int): Time of the move between two tile middles in milliseconds
+        tail_lag (int): Time lag of the tail in milliseconds
+        tiles (memoryview): Tile IDs of the keyframes
+        columns (memoryview): Tile columns of the keyframes
+        rows (memoryview): Tile rows of the keyframes
+        times (memoryview): Times of the keyframes in milliseconds
+        x (memoryview): Horizontal coordinates of the tile middles
+        y (memoryview): Vertical coordinates of the tile middles
+        from_dirs (memoryview): Entry directions of the keyframes
+        to_dirs (memoryview): Exit directions of the keyframes
+        flags (memoryview): Flags of the keyframes
+    """
+
+    MAGIC = b"OZTL"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHIIIIII")
+    AGENT = struct.Struct("<IIII")
+    ARRAYS = (("tiles", "i"), ("columns", "i"), ("rows", "i"), ("times", "i"), ("x", "f"), ("y", "f"),
+              ("from_dirs", "b"), ("to_dirs", "b"), ("flags", "B"))
+
+    TURN = 1
+    U_TURN = 2
+
+    def __init__(self, block):
+        """Initialization of the SharedTimeline instance from an existing block (use `create` or `attach`).
+
+        Args:
+            block (shared_memory.SharedMemory): Shared memory block with the timeline
+
+        Raises:
+            TimelineException: If the block does not contain a timeline of the supported version
+        """
+        self.__block = block
+        self.name = block.name
+
+        magic, version, _, self.agent_count, self.keyframe_count, self.map_width, self.map_height, self.step_time, \
+            self.tail_lag = self.HEADER.unpack_from(block.buf)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise_exception("Shared memory block '{}' does not contain a timeline.".format(block.name))
+
+        self.__agents = {}
+        for index in range(self.agent_count):
+            agent_id, first, count, max_time = self.AGENT.unpack_from(block.buf, self.__agent_offset(index))
+            self.__agents[agent_id] = (first, count, max_time)
+
+        buffer = block.buf
+        for name, code, offset in self.__array_offsets(self.agent_count, self.keyframe_count):
+            size = self.keyframe_count * struct.calcsize(code)
+            setattr(self, name, buffer[offset:offset + size].cast(code))
+
+    @classmethod
+    def create(cls, ozomap, plans, config, name=None):
+        """Method compiles timelines of the agents into a new shared memory block.
+
+        Args:
+            ozomap (OzoMap): Map of the plans
+            plans (dict): Plans of the agents
+            config (Configuration): Application configuration parameters
+            name (str): Name of the block (None for a generated one)
+
+        Returns:
+            SharedTimeline: Timeline in the new block (the creator is responsible for `unlink`)
+        """
+        agents = [Agent(agent_id, plans[agent_id], ozomap, config) for agent_id in plans]
+        keyframe_count = sum(len(agent.positions) for agent in agents)
+        arrays = cls.__array_offsets(len(agents), keyframe_count)
+        size = arrays[-1][2] + keyframe_count * struct.calcsize(arrays[-1][1])
+
+        block = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        cls.HEADER.pack_into(block.buf, 0, cls.MAGIC, cls.VERSION, 0, len(agents), keyframe_count, ozomap.width,
+                             ozomap.height, config.step_time, config.tail_lag)
+        first = 0
+        for index, agent in enumerate(agents):
+            cls.AGENT.pack_into(block.buf, cls.__agent_offset(index), agent.id, first, len(agent.positions),
+                                agent.max_time)
+            first += len(agent.positions)
+
+        timeline = cls(block)
+        timeline.__fill(agents, config.tile_size)
+        logging.info("Compiled timeline of {} agents ({} keyframes, {} B) into shared memory '{}'.".format(
+            len(agents), keyframe_count, size, block.name))
+        return timeline
+
+    @classmethod
+    def attach(cls, name):
+        """Method attaches to a timeline created by another process.
+
+        Args:
+            name (str): Name of the shared memory block
+
+        Returns:
+            SharedTimeline: Timeline in the existing block
+        """
+        return cls(shared_memory.SharedMemory(name=name))
+
+    def get_agent_ids(self):
+        return list(self.__agents)
+
+    def get_keyframes(self, agent_id):
+        """Method returns the keyframe range of an agent.
+
+        Args:
+            agent_id (int): ID of the agent
+
+        Returns:
+            range: Indices of the agent's keyframes in the keyframe arrays
+        """
+        first, count, _ = self.__agents[agent_id]
+        return range(first, first + count)
+
+    def get_max_time(self, agent_id):
+        """Returns time of the last keyframe of the agent in milliseconds."""
+        return self.__agents[agent_id][2]
+
+    def get_bounds(self, agent_id):
+        """Method returns the tile rectangle the agent moves in.
+
+        Returns:
+            tuple[int, int, int, int]: First column, first row, last column and last row (inclusive)
+        """
+        keyframes = self.get_keyframes(agent_id)
+        columns = self.columns[keyframes.start:keyframes.stop]
+        rows = self.rows[keyframes.start:keyframes.stop]
+        return min(columns), min(rows), max(columns), max(rows)
+
+    def get_plan(self, agent_id):
+        """Method rebuilds the plan of the agent, so that the agent can be initialized from the timeline.
+
+        Note:
+            Moves are derived from the consecutive tiles, a stay on the same tile is a wait (`None`).
+
+        Returns:
+            dict: Plan of the agent (`pos_list` and `steps`)
+        """
+        keyframes = self.get_keyframes(agent_id)
+        positions = self.tiles[keyframes.start:keyframes.stop].tolist()
+        steps = [(a, b) if a != b else None for a, b in zip(positions, positions[1:])]
+        return {'pos_list': positions, 'steps': steps}
+
+    def close(self):
+        """Method releases the arrays and detaches from the block (other processes can still use it)."""
+        for name, _ in self.ARRAYS:
+            getattr(self, name).release()
+        self.__block.close()
+
+    def unlink(self):
+        """Method destroys the block, it should be called once by the creator after all processes are detached."""
+        self.__block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __fill(self, agents, tile_size):
+        """Method writes keyframes of the agents into the arrays."""
+        index = 0
+        for agent in agents:
+            for position_id, position in enumerate(agent.positions):
+                tile = position.tile
+                self.tiles[index] = tile.y_pos * self.map_width + tile.x_pos
+                self.columns[index], self.rows[index] = tile.x_pos, tile.y_pos
+                self.times[index] = position_id * self.step_time
+                self.x[index] = (tile.x_pos + 0.5) * tile_size
+                self.y[index] = (tile.y_pos + 0.5) * tile_size
+                self.from_dirs[index], self.to_dirs[index] = position.from_dir, position.to_dir
+                self.flags[index] = (self.TURN if position.is_turn else 0) | (self.U_TURN if position.u_turn else 0)
+                index += 1
+
+    @classmethod
+    def __agent_offset(cls, index):
+        return cls.HEADER.size + index * cls.AGENT.size
+
+    @classmethod
+    def __array_offsets(cls, agent_count, keyframe_count):
+        """Method computes offsets of the keyframe arrays (every array is aligned to its item size).
+
+        Returns:
+            list[tuple[str, str, int]]: Name, type code and offset of every array
+        """
+        offset = cls.__agent_offset(agent_count)
+        offsets = []
+        for name, code in cls.ARRAYS:
+            item_size = struct.calcsize(code)
+            offset = -(-offset // item_size) * item_size
+            offsets.append((name, code, offset))
+            offset += keyframe_count * item_size
+        return offsets
+# ------------------------------------------------------------------------------------------------------------
+
+
+def raise_exception(message):
+    """Function logs error message and raises an exception.
+
+    Raises:
+        TimelineException: Always
+    """
+    logging.error(message)
+    raise TimelineException(message)
@@ -1,24 +1,66 @@
 import logging
+import queue
 import sys
+import time as clock
 
 import pygame
 
+from ozobotmapf.graphics.chunk_index import ChunkIndex
 from ozobotmapf.graphics.ozomap_drawable import OzomapDrawableParser
-from ozobotmapf.simulator.timer import Timer
-from ozobotmapf.utils.constants import Colors, Values
+from ozobotmapf.graphics.render_list import RenderList
+from ozobotmapf.graphics.trail_rasterizer import TrailRasterizer
+from ozobotmapf.graphics.trail_sprites import SPRITES
+from ozobotmapf.simulator.frame_pipeline import FramePipeline
+from ozobotmapf.simulator.frame_profiler import FrameProfiler
+from ozobotmapf.simulator.quality_controller import QualityController
+from ozobotmapf.simulator.timer import Timer, SyncedTimer
+from ozobotmapf.simulator.viewport import Viewport
+from ozobotmapf.utils.constants import Colors, RenderBackends, TrailModes, Values
 
 
 class Simulator:
-    def __init__(self, ozomap, plans, config):
+    IDLE_WAIT = 10  # Wait of the main loop when the frame was not drawn in milliseconds
+    MAX_IDLE_TIME = 1000  # Longest time without drawing a frame in milliseconds
+    SPARSE_DOT_SPACING = 0.5  # Spacing of the drawn trail dots in line widths when the quality is degraded
+
+    def __init__(self, ozomap, plans, config, run_profiler=None, region=None, sync=None):
+        """Initialization of the Simulator instance.
+
+        Args:
+            ozomap (OzoMap): Simulated map
+            plans (dict): Plans of the agents
+            config (Configuration): Application configuration parameters
+            run_profiler (RunProfiler): Profiler that is notified about the simulation time (None if not profiling)
+            region (tuple[int, int]): First column and row of the displayed region (tiled output, None otherwise)
+            sync (TileSync): Synchronization with the other tiled output processes (None for a single window)
+        """
         self.ozomap = ozomap
         self.plans = plans
         self.config = config
+        self.run_profiler = run_profiler
+        self.region = region
+        self.sync = sync
 
         self.timer = Timer()
         # self.timer = Timer(True)  # Debug mode timer
 
-        self.map_objects = OzomapDrawableParser(ozomap, config).parse()
+        if config.viewport or region is not None:  # Large maps are drawn by chunks, only the visible ones are created
+            self.map_objects = None
+            self.map_index = ChunkIndex(OzomapDrawableParser(ozomap, config), ozomap.grid.width, ozomap.grid.height)
+        else:
+            self.map_objects = OzomapDrawableParser(ozomap, config).parse()
+            self.map_index = None
+        self.viewport = None
         self.agents = self.__init_agents()
+        self.__time = 0
+        self.__drawn_time = None  # Simulation time of the last drawn frame (None if the next frame has to be drawn)
+        self.profiler = FrameProfiler(config.frame_budget) if config.frame_profile else None
+        self.renderer = TrailRasterizer() if config.render_backend == RenderBackends.NUMPY else RenderList()
+        self.quality = None
+        if config.quality_budget is not None:
+            self.quality = QualityController(config.quality_budget, self.__get_quality_features())
+        self.pipeline = None  # Render-ahead pipeline while the simulation runs (if `render_ahead` is set)
+        self.__pipeline_events = queue.Queue()  # Viewport events passed to the worker thread of the pipeline
 
         self.__pygame_init()
 
@@ -34,6 +76,7 @@ class Simulator:
         pygame.init()
         pygame.display.set_caption(Values.APP_NAME)
         self.__screen = None
+        self.__canvas = None  # Surface the frames are drawn onto (the screen or a surface of the pipeline)
         self.__width, self.__height = self.config.window_width, self.config.window_height
 
     def __init_screen(self):
@@ -43,69 +86,300 @@ class Simulator:
         else:
             self.__screen = pygame.display.set_mode([self.config.window_width, self.config.window_height])
         self.__screen.fill(Colors.WHITE)
+        self.__canvas = self.__screen
         self.__width, self.__height = pygame.display.get_surface().get_size()
         logging.debug("Application window resolution: {} x {} (px)".format(self.__width, self.__height))
+        if self.config.viewport or self.region is not None:
+            self.viewport = Viewport(self.config, self.ozomap, self.__width, self.__height)
+        if self.region is not None:
+            self.viewport.show_region(*self.region)
+            self.__apply_viewport()
 
     def run(self):
         logging.info("Starting the Simulator process.")
         self.__init_screen()
 
         self.__preview_map()
-        self.__wait_for_user()
+        if self.sync is None:
+            self.__wait_for_user()
+        else:
+            self.timer = SyncedTimer(self.__wait_for_start())
 
         self.timer.start(self.__get_longest_path_time())
 
-        while not self.timer.is_finished():
-            self.__handle_events()
-            time = self.timer.get_time()
-            self.__update_agents(time)
-            self.__draw_map().__draw_active_paths()
-            self.__update()
+        if self.config.render_ahead is not None:
+            self.__run_pipelined()
+        elif self.profiler is None:
+            while not self.timer.is_finished():
+                self.__handle_events()
+                time = self.timer.get_time()
+                if self.run_profiler is not None:
+                    self.run_profiler.update(time)
+                start = clock.perf_counter()
+                self.__update_agents(time)
+                if self.__is_idle(time):  # Nothing on the screen changed since the last drawn frame
+                    pygame.time.wait(self.IDLE_WAIT)
+                    continue
+                self.__draw_map().__draw_active_paths()
+                self.__update()
+                self.__drawn_time = time
+                if self.quality is not None:
+                    self.quality.add_frame((clock.perf_counter() - start) * 1000)
+        else:
+            try:
+                self.__run_profiled()
+            finally:
+                self.profiler.dump(Values.LOGS_PATH + clock.strftime("frame_profile_%Y%m%d_%H%M%S"))
 
-        self.__wait_for_user()
+        self.__wait_for_user(True)
+        if self.sync is not None:  # Finished windows of the tiled output are closed together
+            self.sync.stop()
 
         pygame.quit()
         logging.info("Successfully finished the Simulator process.")
 
-    @staticmethod
-    def __wait_for_user():
-        while True:
-            for event in pygame.event.get():
+    def run_frames(self, times):
+        """Method renders frames for the given simulation times without any user interaction.
+
+        Events are not handled and the real time is not followed, so the method can be used for headless runs
+        (e.g. benchmarks with the dummy SDL video driver).
+
+        Args:
+            times (iterable[int]): Simulation times of the frames in milliseconds
+        """
+        self.__init_screen()
+        for time in times:
+            if self.profiler is None:
+                self.__update_agents(time)
+                self.__draw_map().__draw_active_paths()
+                self.__update()
+            else:
+                self.profiler.start_frame()
+                self.profiler.mark("events")
+                self.__profiled_frame(time)
+
+    def __run_pipelined(self):
+        """Main loop of the simulation with frames rendered ahead by the worker thread of the render-ahead pipeline.
+
+        The main thread only handles events and displays the frames, viewport events are passed to the worker thread,
+        which owns the agents and the viewport until the last frame.
+        """
+        self.pipeline = FramePipeline(self.__render_ahead_frame, self.timer, self.__get_longest_path_time(),
+                                      self.__screen, self.config.render_ahead)
+        self.pipeline.start()
+        try:
+            while self.pipeline.present():
+                self.__handle_events()
+        finally:
+            self.pipeline.stop()
+            self.pipeline = None
+            self.__canvas = self.__screen
+
+    def __render_ahead_frame(self, time, surface):
+        """Method renders the frame of a simulation time onto a surface (called by the worker thread of the pipeline).
+
+        Args:
+            time (int): Simulation time of the frame in milliseconds
+            surface (pygame.Surface): Target surface
+        """
+        while not self.__pipeline_events.empty():
+            self.viewport.handle_event(self.__pipeline_events.get())
+        if self.config.viewport and self.viewport.has_changes():
+            self.__apply_viewport()
+
+        if self.run_profiler is not None:
+            self.run_profiler.update(time)
+        start = clock.perf_counter()
+        self.__canvas = surface
+        self.__update_agents(time)
+        self.__draw_map().__draw_active_paths()
+        if self.quality is not None:
+            self.quality.add_frame((clock.perf_counter() - start) * 1000)
+
+    def __run_profiled(self):
+        """Main loop of the simulation with every frame phase measured by the frame profiler."""
+        while not self.timer.is_finished():
+            self.profiler.start_frame()
+            self.__handle_events()
+            self.profiler.mark("events")
+            self.__profiled_frame(self.timer.get_time())
+
+    def __profiled_frame(self, time):
+        profiler = self.profiler
+        if self.run_profiler is not None:
+            self.run_profiler.update(time)
+        self.__update_agents_profiled(time)
+        profiler.mark("update")
+        self.__draw_map()
+        profiler.mark("draw_map")
+        self.__draw_active_paths()
+        profiler.mark("draw_paths")
+        profiler.add_counter("drawables", self.renderer.drawables)
+        profiler.add_counter("draw_calls", self.renderer.draw_calls)
+        self.__update()
+        profiler.mark("display")
+        profiler.end_frame(time)
+
+    def __is_idle(self, time):
+        """Method checks if the frame can be skipped, because no agent path changed since the last drawn frame.
+
+        Args:
+            time (int): Current simulation time in milliseconds
+
+        Returns:
+            bool: True if the last drawn frame is still valid (it is drawn again after `MAX_IDLE_TIME`)
+        """
+        if self.__drawn_time is None or time - self.__drawn_time >= self.MAX_IDLE_TIME:
+            return False
+        return all(agent.is_idle(self.__drawn_time, time) for agent in self.agents)
+
+    def __wait_for_user(self, is_finished=False):
+        """Method waits for a key press, the view can be panned and zoomed meanwhile.
+
+        Args:
+            is_finished (bool): Flag if the simulation already ran (the paths are redrawn), otherwise the preview of
+                the map with the direction arrows is redrawn
+        """
+        while self.sync is None or not self.sync.is_stopped():
+            for event in self.__wait_for_events():
                 if (event.type == pygame.QUIT) or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                    logging.info("Quitting application.")
-                    pygame.quit()
-                    sys.exit()
+                    self.__quit()
+                if self.config.viewport and self.viewport.handle_event(event):
+                    continue
                 if event.type == pygame.KEYDOWN:
                     return
+            if self.config.viewport and self.viewport.has_changes():
+                self.__apply_viewport()
+                if is_finished:
+                    self.__draw_map().__draw_active_paths().__update()
+                else:
+                    self.__preview_map()
+
+    def __wait_for_events(self):
+        """Method blocks until there are events in the queue.
+
+        Note:
+            Windows of the tiled output have to check whether the other windows were closed, so they poll the queue.
+
+        Returns:
+            list[pygame.event.Event]: Events from the queue
+        """
+        if self.sync is None:
+            return [pygame.event.wait()] + pygame.event.get()
+        pygame.time.wait(self.sync.POLL_TIME)
+        return pygame.event.get()
+
+    def __wait_for_start(self):
+        """Method waits until all tiled output processes are ready and the user starts the simulation in any of them.
+
+        Returns:
+            float: Shared start time of the simulation (`time.monotonic` in seconds)
+        """
+        self.sync.set_ready()
+        while not self.sync.is_started():
+            for event in pygame.event.get():
+                if (event.type == pygame.QUIT) or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    self.__quit()
+                if event.type == pygame.KEYDOWN:
+                    self.sync.request_start()
+            if self.sync.is_stopped():
+                self.__quit()
+            pygame.time.wait(self.sync.POLL_TIME)
+        return self.sync.wait_for_start_time()
 
-    @staticmethod
-    def __handle_events():
+    def __handle_events(self):
         for event in pygame.event.get():
             if (event.type == pygame.QUIT) or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                logging.info("Quitting application.")
-                pygame.quit()
-                sys.exit()
+                self.__quit()
+            if self.config.viewport and self.pipeline is not None:  # Viewport is changed by the worker thread
+                self.__pipeline_events.put(event)
+            elif self.config.viewport:
+                self.viewport.handle_event(event)
+            if event.type == pygame.VIDEOEXPOSE:  # Window has to be drawn again
+                self.__drawn_time = None
+
+        if self.sync is not None and self.sync.is_stopped():
+            self.__quit()
+        if self.config.viewport and self.pipeline is None and self.viewport.has_changes():
+            self.__apply_viewport()
+
+    def __quit(self):
+        logging.info("Quitting application.")
+        if self.pipeline is not None:  # Worker thread cannot draw after pygame is quit
+            self.pipeline.stop()
+        if self.sync is not None:  # All windows of the tiled output are closed
+            self.sync.stop()
+        pygame.quit()
+        sys.exit()
+
+    def __apply_viewport(self):
+        """Method lays the map out for the changed view, map chunks are dropped and agents moved."""
+        shift = self.viewport.apply()
+        self.__drawn_time = None
+        self.map_index.invalidate()
+        for agent in self.agents:
+            agent.relayout(shift)
+
+    def __get_quality_features(self):
+        """Method lists the features degraded by the adaptive quality, from the least to the most visible.
+
+        Returns:
+            list[tuple[str, callable]]: Names of the features and functions `set_degraded(bool)` switching them
+        """
+        features = [("start and finish checker patterns", self.__set_coarse_checkers)]
+        if self.config.trail_sprites:
+            features.append(("arc resolution", self.__set_coarse_arcs))
+        if self.config.trail_mode == TrailModes.FRAMES and (self.config.trail_sprites
+                                                            or self.config.render_backend == RenderBackends.NUMPY):
+            features.append(("trail dot density", self.__set_sparse_dots))  # Only frame trails are made of dots
+        if self.config.display_grid:
+            features.append(("grid borders", self.__set_hidden_grid))
+        return features
+
+    def __set_coarse_checkers(self, degraded):
+        self.config.checker_patterns = not degraded
+        if self.map_index is not None:
+            self.map_index.invalidate()
+        else:
+            self.map_objects = OzomapDrawableParser(self.ozomap, self.config).parse()
+
+    @staticmethod
+    def __set_coarse_arcs(degraded):
+        SPRITES.angle_step = SPRITES.COARSE_ANGLE_STEP if degraded else SPRITES.ANGLE_STEP
+
+    def __set_sparse_dots(self, degraded):
+        self.renderer.dot_spacing = self.SPARSE_DOT_SPACING if degraded else 0
+
+    def __set_hidden_grid(self, degraded):
+        self.config.display_grid = not degraded
 
     def __draw_map(self):
-        self.__screen.fill(Colors.WHITE)
+        self.__canvas.fill(Colors.WHITE)
+        if self.viewport is not None:
+            return self.__draw_visible_map()
 
-        self.map_objects[0].draw(self.__screen)  # Agent Starts/Ends
+        self.map_objects[0].draw(self.__canvas)  # Agent Starts/Ends
 
         if self.config.display_grid:
-            self.map_objects[1].draw(self.__screen)  # Grid border lines
+            self.map_objects[1].draw(self.__canvas)  # Grid border lines
 
         if self.config.display_walls:
-            self.map_objects[2].draw(self.__screen)  # Walls
+            self.map_objects[2].draw(self.__canvas)  # Walls
 
         return self
 
-    def __draw_all_paths(self):
-        for agent in self.agents:
-            self.__draw_agent_path(agent)
+    def __draw_visible_map(self):
+        starts, borders, walls = self.map_index.get_layers(*self.viewport.get_visible_tiles())
+        layers = [starts]
+        if self.config.display_grid:
+            layers.append(borders)
+        if self.config.display_walls:
+            layers.append(walls)
 
-    def __draw_agent_path(self, agent):
-        for drawable in agent.get_active_path():
-            drawable.draw(self.__screen)
+        for layer in layers:
+            for group in layer:
+                group.draw(self.__canvas)
+        return self
 
     def __update(self):
         pygame.display.update()
@@ -117,18 +391,29 @@ class Simulator:
         if self.config.direction_preview:
             for agent in self.agents:
                 if agent.direction_arrow is not None:
-                    agent.direction_arrow.draw(self.__screen)
+                    agent.direction_arrow.draw(self.__canvas)
 
         self.__update()
 
     def __update_agents(self, time):
+        self.__time = time
+        for agent in self.agents:
+            agent.update_path(time)
+        return self
+
+    def __update_agents_profiled(self, time):
+        self.__time = time
         for agent in self.agents:
+            start = clock.perf_counter_ns()
             agent.update_path(time)
+            self.profiler.add_agent_sample(type(agent).__name__, clock.perf_counter_ns() - start)
         return self
 
     def __draw_active_paths(self):
         for agent in self.agents:
-            agent.get_active_path().draw(self.__screen)
+            if self.viewport is None or self.viewport.is_visible(agent.get_tile_bounds(self.__time)):
+                self.renderer.add_path(agent.get_active_path())
+        self.renderer.draw(self.__canvas)  # Paths of all agents are drawn at once
         return self
 
     def __get_longest_path_time(self):
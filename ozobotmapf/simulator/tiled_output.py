@@ -0,0 +1,208 @@
+import logging
+import multiprocessing
+import os
+import time
+
+from ozobotmapf.level.ozomap import OzoMap
+from ozobotmapf.simulator.shared_timeline import SharedTimeline
+from ozobotmapf.utils.constants import Values
+
+
+class TileSync:
+    """Shared state synchronizing the processes of the tiled output.
+
+    The simulation is started by a key press in any window, but only after all windows are ready. Then all processes
+    follow the same start time, so the displays show the same simulation time. Quitting any window closes all of them.
+
+    Attributes:
+        count (int): Number of the synchronized processes
+    """
+
+    POLL_TIME = 10  # How often the shared state is checked while waiting in milliseconds
+    START_DELAY = 0.25  # Time between the start request and the shared start time in seconds
+
+    def __init__(self, context, count):
+        """Initialization of the TileSync instance.
+
+        Args:
+            context (multiprocessing.context.BaseContext): Multiprocessing context of the processes
+            count (int): Number of the synchronized processes
+        """
+        self.count = count
+
+        self.__ready = context.Value("i", 0)
+        self.__start_time = context.Value("d", 0.0)
+        self.__start_requested = context.Event()
+        self.__started = context.Event()
+        self.__stopped = context.Event()
+
+    def set_ready(self):
+        """Method marks one more process as ready (its window is open and the map is drawn)."""
+        with self.__ready.get_lock():
+            self.__ready.value += 1
+
+    def is_ready(self):
+        """Returns true if all processes are ready."""
+        return self.__ready.value == self.count
+
+    def request_start(self):
+        self.__start_requested.set()
+
+    def is_start_requested(self):
+        return self.__start_requested.is_set()
+
+    def start(self, start_time):
+        """Method sets the shared start time and lets all processes start.
+
+        Args:
+            start_time (float): Start time of the simulation (`time.monotonic` in seconds)
+        """
+        self.__start_time.value = start_time
+        self.__started.set()
+
+    def is_started(self):
+        return self.__started.is_set()
+
+    def wait_for_start_time(self):
+        """Method waits until the shared start time.
+
+        Returns:
+            float: Shared start time of the simulation (`time.monotonic` in seconds)
+        """
+        start_time = self.__start_time.value
+        time.sleep(max(0.0, start_time - time.monotonic()))
+        return start_time
+
+    def stop(self):
+        self.__stopped.set()
+
+    def is_stopped(self):
+        return self.__stopped.is_set()
+
+
+class TiledOutput:
+    """Class runs the simulation on several displays (projectors) forming one large arena.
+
+    Every display is run by its own process with its own window and shows a region of the map in the physical scale.
+    Plans are computed only once and compiled into a `SharedTimeline`, every process attaches to it and initializes
+    only the agents that can be drawn into its region. Windows are placed side by side (display `[column, row]` at
+    `[column * width, row * height]` of the desktop).
+
+    Attributes:
+        ozomap (OzoMap): Simulated map
+        plans (dict): Plans of all agents
+        config (Configuration): Application configuration parameters
+        columns (int): Number of displays in a row
+        rows (int): Number of displays in a column
+    """
+
+    def __init__(self, ozomap, plans, config):
+        """Initialization of the TiledOutput instance.
+
+        Args:
+            ozomap (OzoMap): Simulated map
+            plans (dict): Plans of all agents
+            config (Configuration): Application configuration parameters
+        """
+        self.ozomap = ozomap
+        self.plans = plans
+        self.config = config
+        self.columns, self.rows = config.tiles
+
+    def get_regions(self):
+        """Method splits the map into regions of the displays.
+
+        Returns:
+            list[tuple[int, int]]: First column and row of the region of every display (row by row)
+        """
+        width, height = self.config.region_width, self.config.region_height
+        return [(column * width, row * height) for row in range(self.rows) for column in range(self.columns)]
+
+    def get_region_agents(self, timeline, region):
+        """Method selects the agents that can be drawn into the region.
+
+        Args:
+            timeline (SharedTimeline): Compiled timelines of all agents
+            region (tuple[int, int]): First column and row of the region
+
+        Returns:
+            list[int]: IDs of the selected agents
+        """
+        x0, y0 = region
+        x1, y1 = x0 + self.config.region_width, y0 + self.config.region_height
+        agent_ids = []
+        for agent_id in timeline.get_agent_ids():
+            left, top, right, bottom = timeline.get_bounds(agent_id)
+            if left - 1 < x1 and right + 1 >= x0 and top - 1 < y1 and bottom + 1 >= y0:  # One tile around for turns
+                agent_ids.append(agent_id)
+        return agent_ids
+
+    def run(self):
+        """Method starts a process for every display and waits until all of them are finished."""
+        timeline = SharedTimeline.create(self.ozomap, self.plans, self.config)
+        try:
+            self.__run_processes(timeline)
+        finally:
+            timeline.close()
+            timeline.unlink()
+
+    def __run_processes(self, timeline):
+        context = multiprocessing.get_context("spawn")  # Processes do not inherit any pygame state
+        regions = self.get_regions()
+        sync = TileSync(context, len(regions))
+        processes = []
+        for index, region in enumerate(regions):
+            column, row = index % self.columns, index // self.columns
+            position = (column * self.config.window_width, row * self.config.window_height)
+            processes.append(context.Process(target=run_tile, name="Tile-{}".format(index), daemon=True, args=(
+                self.config, timeline.name, self.get_region_agents(timeline, region), region, position, sync,
+                logging.getLogger().level)))
+
+        logging.info("Starting {} tiled output processes ({}x{}).".format(len(processes), self.columns, self.rows))
+        for process in processes:
+            process.start()
+        try:
+            self.__supervise(processes, sync)
+        finally:
+            sync.stop()
+            for process in processes:
+                process.join()
+
+    def __supervise(self, processes, sync):
+        """Method starts the simulation once it is requested and stops all processes if any of them fails."""
+        while any(process.is_alive() for process in processes):
+            failed = [process.name for process in processes if process.exitcode not in (None, 0)]
+            if failed:
+                logging.error("Tiled output processes failed: {}.".format(", ".join(failed)))
+                return
+
+            if not sync.is_started() and sync.is_ready() and sync.is_start_requested():
+                sync.start(time.monotonic() + sync.START_DELAY)
+                logging.info("Tiled output started.")
+            time.sleep(sync.POLL_TIME / 1000)
+# ------------------------------------------------------------------------------------------------------------
+
+
+def run_tile(config, timeline_name, agent_ids, region, position, sync, log_level):
+    """Function runs the Simulator of one display of the tiled output (run in the tile processes).
+
+    Args:
+        config (Configuration): Application configuration parameters
+        timeline_name (str): Name of the shared memory block with the compiled timelines
+        agent_ids (list[int]): IDs of the agents drawn into the region
+        region (tuple[int, int]): First column and row of the displayed region
+        position (tuple[int, int]): Position of the window on the desktop
+        sync (TileSync): Synchronization with the other processes
+        log_level (int): Logging level of the main process
+    """
+    from ozobotmapf.simulator.simulator import Simulator
+
+    logging.basicConfig(filename=Values.LOGS_PATH + "log.log", format='%(asctime)s - %(levelname)s: %(message)s',
+                        level=log_level)
+    os.environ["SDL_VIDEO_WINDOW_POS"] = "{},{}".format(*position)
+    logging.info("Starting tiled output of the region [{}, {}] with {} agents.".format(*region, len(agent_ids)))
+
+    with SharedTimeline.attach(timeline_name) as timeline:
+        plans = {agent_id: timeline.get_plan(agent_id) for agent_id in agent_ids}
+    ozomap = OzoMap(config).load_map(config)
+    Simulator(ozomap, plans, config, region=region, sync=sync).run()
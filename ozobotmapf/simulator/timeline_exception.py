@@ -0,0 +1,3 @@
+class TimelineException(Exception):
+    """Raised when a shared memory block does not contain a valid timeline."""
+    pass
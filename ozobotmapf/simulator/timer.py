@@ -1,3 +1,5 @@
+import time
+
 import pygame
 
 
@@ -30,3 +32,30 @@ class Timer:
             return self.ticks
         else:
             return pygame.time.get_ticks() - self.start_ticks
+
+
+class SyncedTimer(Timer):
+    """Timer of the tiled output, all processes follow the same start time.
+
+    Note:
+        `time.monotonic` is a system-wide clock, so the start time can be shared by processes of the same computer.
+    """
+
+    def __init__(self, start_time):
+        """Initialization of the SyncedTimer instance.
+
+        Args:
+            start_time (float): Shared start time of the simulation (`time.monotonic` in seconds)
+        """
+        super().__init__()
+        self.start_time = start_time
+
+    def is_finished(self):
+        return self.finish_ticks <= self.get_time()
+
+    def start(self, length):
+        self.start_ticks = 0
+        self.finish_ticks = length
+
+    def get_time(self):
+        return round((time.monotonic() - self.start_time) * 1000)
@@ -0,0 +1,214 @@
+import logging
+import math
+
+import pygame
+
+from ozobotmapf.graphics.shapes import Point
+from ozobotmapf.utils.constants import Values
+
+
+class Viewport:
+    """Class keeps the visible part of the map (pan and zoom) and lays the map out for it.
+
+    Zoom 1 is the physical scale given by the configuration, so a region of a large map can still be projected for
+    real Ozobots. Panning and zooming lay the tiles out again (tile origins and pixel dimensions in the configuration
+    are changed), the changes are collected from the events and applied once per frame.
+
+    Controls: arrow keys or dragging with the left mouse button pan the view, `+`/`-` or the mouse wheel zoom and
+    `0` (or `Home`) returns to the physical scale.
+
+    Attributes:
+        config (Configuration): Application configuration parameters (pixel dimensions are changed by the zoom)
+        ozomap (OzoMap): Displayed map
+        width (int): Width of the window in pixels
+        height (int): Height of the window in pixels
+        zoom (float): Current zoom (1 is the physical scale)
+        origin (Point): Position of the grid origin on the screen
+    """
+
+    SCALED = ("tile_size", "tile_border_width", "line_width", "wall_width", "color_code_radius", "intersection_width")
+    ZOOM_STEP = 1.25
+    MAX_ZOOM = 4
+    MIN_TILE_SIZE = 4
+    PAN_STEP = 0.125  # Part of the window moved by one arrow key press
+
+    def __init__(self, config, ozomap, width, height):
+        """Initialization of the Viewport instance.
+
+        Args:
+            config (Configuration): Application configuration parameters
+            ozomap (OzoMap): Displayed map
+            width (int): Width of the window in pixels
+            height (int): Height of the window in pixels
+        """
+        self.config = config
+        self.ozomap = ozomap
+        self.width, self.height = width, height
+        self.zoom = 1
+        self.origin = Point(config.map_origin.x, config.map_origin.y)
+
+        self.__home = Point(config.map_origin.x, config.map_origin.y)
+        self.__base = {name: getattr(config, name) for name in self.SCALED}
+        self.__shift = [0, 0]
+        self.__rescaled = False
+        self.__dragging = False
+
+    def handle_event(self, event):
+        """Method handles pan and zoom events.
+
+        Args:
+            event (pygame.event.Event): Event from the queue
+
+        Returns:
+            bool: True if the event was used by the viewport
+        """
+        if event.type == pygame.KEYDOWN:
+            return self.__handle_key(event.key)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):  # Mouse wheel
+            self.zoom_at(self.ZOOM_STEP if event.button == 4 else 1 / self.ZOOM_STEP, Point(*event.pos))
+            return True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.__dragging = True
+            return True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.__dragging = False
+            return True
+        elif event.type == pygame.MOUSEMOTION and self.__dragging:
+            self.pan(*event.rel)
+            return True
+        return False
+
+    def pan(self, dx, dy):
+        """Method moves the map on the screen, the map cannot leave the window when it is larger than the window.
+
+        Args:
+            dx (int): Horizontal move in pixels
+            dy (int): Vertical move in pixels
+        """
+        x, y = self.__clamp(self.origin.x + dx, self.origin.y + dy, self.config.tile_size)
+        self.__shift[0] += x - self.origin.x
+        self.__shift[1] += y - self.origin.y
+        self.origin = Point(x, y)
+
+    def zoom_at(self, factor, anchor):
+        """Method changes the zoom, the map point under the anchor stays in place.
+
+        Args:
+            factor (float): Zoom multiplier
+            anchor (Point): Fixed point on the screen
+        """
+        tile_size = self.config.tile_size
+        min_zoom = self.MIN_TILE_SIZE / self.__base["tile_size"]
+        zoom = min(self.MAX_ZOOM, max(min_zoom, self.zoom * factor))
+        new_tile_size = self.__scaled_tile_size(zoom)
+        if new_tile_size == tile_size:
+            return
+
+        ratio = new_tile_size / tile_size
+        x = round(anchor.x - (anchor.x - self.origin.x) * ratio)
+        y = round(anchor.y - (anchor.y - self.origin.y) * ratio)
+        self.zoom = zoom
+        self.origin = Point(*self.__clamp(x, y, new_tile_size))
+        self.__rescaled = True
+
+    def show_region(self, column, row):
+        """Method moves the map, so that the tile is at the default position of the map (top-left corner).
+
+        The position is not limited, it is used by the tiled output where every window shows its own region.
+
+        Args:
+            column (int): Column of the first displayed tile
+            row (int): Row of the first displayed tile
+        """
+        x = self.__home.x - column * self.config.tile_size
+        y = self.__home.y - row * self.config.tile_size
+        self.__shift[0] += x - self.origin.x
+        self.__shift[1] += y - self.origin.y
+        self.origin = Point(x, y)
+
+    def reset(self):
+        """Method returns to the physical scale and the default position of the map."""
+        self.zoom = 1
+        self.origin = Point(self.__home.x, self.__home.y)
+        self.__rescaled = True
+
+    def has_changes(self):
+        """Returns true if the view was changed since the last `apply`."""
+        return self.__rescaled or self.__shift != [0, 0]
+
+    def apply(self):
+        """Method lays the map out for the current view.
+
+        Returns:
+            tuple[int, int]: Move of all tiles in pixels if only the position changed, None if the zoom changed
+        """
+        shift = None if self.__rescaled else tuple(self.__shift)
+        if self.__rescaled:
+            for name, value in self.__base.items():
+                setattr(self.config, name, max(1, round(value * self.zoom)))
+            self.config.tile_size = self.__scaled_tile_size(self.zoom)
+            pygame.display.set_caption("{} ({:.0%})".format(Values.APP_NAME, self.zoom))
+            logging.info("Viewport zoom changed to {:.2f} (tile size {}px).".format(self.zoom, self.config.tile_size))
+
+        self.ozomap.grid.relayout(self.origin, self.config.tile_size)
+        self.__shift = [0, 0]
+        self.__rescaled = False
+        return shift
+
+    def get_visible_tiles(self):
+        """Method computes the part of the grid that is visible in the window.
+
+        Returns:
+            tuple[int, int, int, int]: First column, first row, column after the last and row after the last
+        """
+        tile_size = self.config.tile_size
+        x0 = max(0, math.floor(-self.origin.x / tile_size))
+        y0 = max(0, math.floor(-self.origin.y / tile_size))
+        x1 = min(self.ozomap.grid.width, math.ceil((self.width - self.origin.x) / tile_size))
+        y1 = min(self.ozomap.grid.height, math.ceil((self.height - self.origin.y) / tile_size))
+        return x0, y0, x1, y1
+
+    def is_visible(self, bounds):
+        """Method checks if a tile rectangle overlaps the visible part of the grid.
+
+        Args:
+            bounds (tuple[int, int, int, int]): First column, first row, last column and last row (inclusive)
+
+        Returns:
+            bool: True if at least a part of the rectangle is visible
+        """
+        x0, y0, x1, y1 = self.get_visible_tiles()
+        return bounds[0] < x1 and bounds[2] >= x0 and bounds[1] < y1 and bounds[3] >= y0
+
+    def __handle_key(self, key):
+        step_x, step_y = round(self.width * self.PAN_STEP), round(self.height * self.PAN_STEP)
+        if key == pygame.K_LEFT:
+            self.pan(step_x, 0)
+        elif key == pygame.K_RIGHT:
+            self.pan(-step_x, 0)
+        elif key == pygame.K_UP:
+            self.pan(0, step_y)
+        elif key == pygame.K_DOWN:
+            self.pan(0, -step_y)
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.zoom_at(self.ZOOM_STEP, Point(self.width / 2, self.height / 2))
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom_at(1 / self.ZOOM_STEP, Point(self.width / 2, self.height / 2))
+        elif key in (pygame.K_0, pygame.K_KP0, pygame.K_HOME):
+            self.reset()
+        else:
+            return False
+        return True
+
+    def __scaled_tile_size(self, zoom):
+        return max(self.MIN_TILE_SIZE, round(self.__base["tile_size"] * zoom))
+
+    def __clamp(self, x, y, tile_size):
+        """Method limits the grid origin, so that a map larger than the window always covers the window.
+
+        Returns:
+            tuple[int, int]: Limited origin
+        """
+        min_x = min(self.__home.x, self.width - self.__home.x - self.ozomap.width * tile_size)
+        min_y = min(self.__home.y, self.height - self.__home.y - self.ozomap.height * tile_size)
+        return min(self.__home.x, max(min_x, x)), min(self.__home.y, max(min_y, y))
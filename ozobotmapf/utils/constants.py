@@ -1,25 +1,23 @@
-import pygame
-
-
 class Colors:
     """Class contains color constants for easier use.
 
-    Colors are represented as pygame.Color object.
+    Colors are represented as RGB tuples, which are accepted by all pygame drawing functions. This keeps the module
+    importable without pygame.
     """
-    WHITE = pygame.Color(255, 255, 255)
-    BLACK = pygame.Color(0, 0, 0)
-    GREY = pygame.Color(150, 150, 150)
-    RED = pygame.Color(255, 0, 0)
-    GREEN = pygame.Color(0, 255, 0)
-    BLUE = pygame.Color(0, 0, 255)
-    CYAN = pygame.Color(0, 255, 255)
-    MAGENTA = pygame.Color(255, 0, 255)
-    YELLOW = pygame.Color(255, 255, 0)
-
-    # START = pygame.Color(230, 255, 230)
-    # FINISH = pygame.Color(255, 230, 230)
-    START = pygame.Color(235, 255, 235)
-    FINISH = pygame.Color(255, 235, 235)
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    GREY = (150, 150, 150)
+    RED = (255, 0, 0)
+    GREEN = (0, 255, 0)
+    BLUE = (0, 0, 255)
+    CYAN = (0, 255, 255)
+    MAGENTA = (255, 0, 255)
+    YELLOW = (255, 255, 0)
+
+    # START = (230, 255, 230)
+    # FINISH = (255, 230, 230)
+    START = (235, 255, 235)
+    FINISH = (255, 235, 235)
 
 
 class Values:
@@ -30,10 +28,12 @@ class Values:
     DISPLAY_CONFIGS_PATH = "../resources/config/display/"
     MAPS_PATH = "../resources/maps/"
     LOGS_PATH = "../resources/logs/"
+    PLANS_PATH = "../resources/plans/"
 
     SIMULATOR_CONFIG = "../resources/config/simulator.ini"
 
     MAP_FILE_EXT = ".ozomap"
+    PLAN_FILE_EXT = ".ozoplan"
 
 
 class Directions:
@@ -56,8 +56,27 @@ class PositionTypes:
     STOP = 3
 
 
+class MarkerTypes:
+    """Class contains types of the marker events on agent path."""
+    INTERSECTION = 0  # Intersection indicator
+    TURN_LINE = 1  # Path before a turn (drawn in the turn color until the agent leaves the tile)
+    U_TURN = 2  # U-turn Color Code
+
+
 class AgentTypes:
     """Class contains supported agent types (classes)."""
     DUMMY = "dummy"
     ANIMATED = "animated"
     OZOBOT = "ozobot"
+
+
+class TrailModes:
+    """Class contains supported trail modes of the OzobotAgent."""
+    FRAMES = "frames"  # Trail is made of the positions of rendered frames
+    ANALYTIC = "analytic"  # Trail is computed from the plan for every frame
+
+
+class RenderBackends:
+    """Class contains supported backends drawing the agent paths."""
+    PYGAME = "pygame"  # Every drawable is drawn by its own pygame call
+    NUMPY = "numpy"  # Trail points are stamped into the screen buffer by NumPy (optional dependency)
@@ -0,0 +1,31 @@
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on the first attribute access.
+
+    After the first access, all attributes of the real module are copied into the placeholder, so following lookups
+    are plain module attribute reads without any additional overhead.
+
+    Note:
+        The placeholder is not registered in `sys.modules`, so `'pygame' in sys.modules` still tells whether
+        the real module was imported.
+    """
+
+    def __getattr__(self, item):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, item)
+
+
+def lazy_import(name):
+    """Function returns a lazily imported module.
+
+    Args:
+        name (str): Absolute name of the module
+
+    Returns:
+        LazyModule: Placeholder that imports the module when it is used for the first time
+    """
+    return LazyModule(name)
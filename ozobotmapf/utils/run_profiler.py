@@ -0,0 +1,176 @@
+import cProfile
+import gc
+import logging
+import time
+import tracemalloc
+
+from ozobotmapf.utils.constants import Values
+
+
+class RunProfiler:
+    """Class captures cProfile statistics and tracemalloc snapshots of a Simulator or Map Editor run.
+
+    The whole run is captured by default. If a time window is set, the Simulator enables the capture only while the
+    simulation time is inside the window (see `update`).
+
+    Attributes:
+        profile (bool): Flag if the run should be profiled with cProfile
+        trace_memory (bool): Flag if memory allocations should be traced with tracemalloc
+        window (list[int]): Simulation time window [start, end) in milliseconds (None for the whole run)
+        output_prefix (str): Path prefix of the output files
+    """
+
+    TRACKED_TYPES = ("Point", "Rectangle", "Line", "Arc", "Circle", "PathSegment", "TurnSegment", "UTurnCode",
+                     "PathPosition")
+    SAMPLE_INTERVAL = 250  # How often (in simulation milliseconds) the traced memory is checked for a new peak
+    TOP_ALLOCATIONS = 25
+
+    def __init__(self, config):
+        """Initialization of the RunProfiler instance.
+
+        Args:
+            config (Configuration): Application configuration parameters
+        """
+        self.profile = config.profile
+        self.trace_memory = config.trace_memory
+        self.window = config.profile_window
+        self.output_prefix = Values.LOGS_PATH + "{}_" + time.strftime("%Y%m%d_%H%M%S")
+
+        self.__profiler = cProfile.Profile() if self.profile else None
+        self.__active = False
+        self.__finished = False
+        self.__next_sample = 0
+        self.__peak_size = -1
+        self.__peak_traced = 0
+        self.__peak_time = None
+        self.__peak_snapshot = None
+        self.__peak_objects = None
+
+    def is_enabled(self):
+        """Returns true if any kind of capture was requested."""
+        return self.profile or self.trace_memory
+
+    def run(self, function, *args):
+        """Method runs the function with the requested captures and writes the results.
+
+        Args:
+            function (callable): Function to be run (`run_simulation` or `run_editor`)
+            *args: Arguments of the function
+
+        Returns:
+            Return value of the function
+        """
+        if self.window is None:
+            self.__start()
+        try:
+            return function(*args)
+        finally:
+            self.__stop()
+            self.__dump()
+
+    def update(self, sim_time):
+        """Method is called by the Simulator every frame.
+
+        It starts or stops the capture according to the time window and samples the traced memory.
+
+        Args:
+            sim_time (int): Current simulation time in milliseconds
+        """
+        if self.window is not None and not self.__finished:
+            if not self.__active and self.window[0] <= sim_time < self.window[1]:
+                logging.info("Profiling window started at {} ms.".format(sim_time))
+                self.__start()
+            elif self.__active and sim_time >= self.window[1]:
+                logging.info("Profiling window finished at {} ms.".format(sim_time))
+                self.__stop()
+
+        if self.__active and self.trace_memory and sim_time >= self.__next_sample:
+            self.__next_sample = sim_time + self.SAMPLE_INTERVAL
+            if self.profile:  # Sampling should not show up in the profile
+                self.__profiler.disable()
+            self.__sample_peak(sim_time)
+            if self.profile:
+                self.__profiler.enable()
+
+    def __start(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self.__profiler.enable()
+        self.__active = True
+
+    def __stop(self):
+        if not self.__active:
+            return
+        if self.profile:
+            self.__profiler.disable()
+        if self.trace_memory:
+            self.__sample_peak(None)
+            self.__peak_traced = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.__active = False
+        self.__finished = True
+
+    def __sample_peak(self, sim_time):
+        """Method takes a snapshot if the traced memory is higher than at the last snapshot.
+
+        Args:
+            sim_time (int): Current simulation time in milliseconds (None at the end of the run)
+        """
+        size = tracemalloc.get_traced_memory()[0]
+        if size <= self.__peak_size:
+            return
+
+        self.__peak_size = size
+        self.__peak_time = sim_time
+        self.__peak_snapshot = tracemalloc.take_snapshot()
+        self.__peak_objects = count_objects(self.TRACKED_TYPES)
+
+    def __dump(self):
+        """Method writes the cProfile statistics and the memory report into the logs folder."""
+        if not self.__finished:
+            logging.warning("Nothing was captured, the profiling window was never reached.")
+            return
+
+        if self.profile:
+            path = self.output_prefix.format("profile") + ".pstats"
+            self.__profiler.dump_stats(path)
+            logging.info("cProfile statistics written to '{}'.".format(path))
+
+        if self.trace_memory:
+            path = self.output_prefix.format("memory") + ".txt"
+            with open(path, "w") as file:
+                file.writelines(self.__memory_report())
+            logging.info("Memory report written to '{}'.".format(path))
+
+    def __memory_report(self):
+        """Creates lines of the memory report from the peak snapshot."""
+        lines = ["Peak traced memory: {:.1f} KiB\n".format(self.__peak_traced / 1024),
+                 "Largest sampled snapshot: {:.1f} KiB at simulation time {}\n\n".format(
+                     self.__peak_size / 1024, "end" if self.__peak_time is None else "{} ms".format(self.__peak_time)),
+                 "Live objects at the snapshot:\n"]
+        lines += ["    {:<14} {:>10}\n".format(name, count) for name, count in self.__peak_objects.items()]
+
+        lines.append("\nTop {} allocations at the snapshot:\n".format(self.TOP_ALLOCATIONS))
+        snapshot = self.__peak_snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        for stat in snapshot.statistics("lineno")[:self.TOP_ALLOCATIONS]:
+            lines.append("    {}\n".format(stat))
+        return lines
+# ------------------------------------------------------------------------------------------------------------
+
+
+def count_objects(type_names):
+    """Function counts live objects of the given types.
+
+    Args:
+        type_names (tuple[str]): Class names of the counted objects
+
+    Returns:
+        dict[str, int]: Number of live objects for each class name
+    """
+    counts = dict.fromkeys(type_names, 0)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in counts:
+            counts[name] += 1
+    return counts